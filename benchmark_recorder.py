@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Measure recorder bytes per ChoreBot task completion on the dev instance.
+
+Completes and uncompletes one task through Home Assistant's websocket API
+and reports how much the recorder database grew for the ChoreBot entities
+(new state rows plus newly stored attribute payloads). Run it once with
+Slim Recorder Attributes off and once with it on to compare.
+
+    python benchmark_recorder.py todo.chorebot_chores "Feed the cat" --rounds 10
+"""
+
+import argparse
+import asyncio
+import json
+import sqlite3
+
+import websockets
+
+DEFAULT_DB = "dev-config/home-assistant_v2.db"
+
+# Rows written for the ChoreBot entities (state rows and their attributes)
+STATE_BYTES_QUERY = """
+    SELECT COUNT(*), COALESCE(SUM(LENGTH(s.state)), 0)
+    FROM states s JOIN states_meta m ON s.metadata_id = m.metadata_id
+    WHERE m.entity_id LIKE 'todo.%' OR m.entity_id LIKE 'sensor.chorebot%'
+"""
+ATTRIBUTE_BYTES_QUERY = """
+    SELECT COUNT(*), COALESCE(SUM(LENGTH(shared_attrs)), 0)
+    FROM state_attributes WHERE attributes_id IN (
+        SELECT s.attributes_id
+        FROM states s JOIN states_meta m ON s.metadata_id = m.metadata_id
+        WHERE m.entity_id LIKE 'todo.%' OR m.entity_id LIKE 'sensor.chorebot%'
+    )
+"""
+
+
+def measure(db_path):
+    """Return (state rows, attribute rows, bytes) recorded for ChoreBot."""
+    with sqlite3.connect(f"file:{db_path}?mode=ro", uri=True) as db:
+        state_rows, state_bytes = db.execute(STATE_BYTES_QUERY).fetchone()
+        attr_rows, attr_bytes = db.execute(ATTRIBUTE_BYTES_QUERY).fetchone()
+    return state_rows, attr_rows, state_bytes + attr_bytes
+
+
+async def update_item(websocket, message_id, entity_id, item, status):
+    """Call todo.update_item and wait for its result."""
+    await websocket.send(
+        json.dumps(
+            {
+                "id": message_id,
+                "type": "call_service",
+                "domain": "todo",
+                "service": "update_item",
+                "service_data": {"item": item, "status": status},
+                "target": {"entity_id": entity_id},
+            }
+        )
+    )
+    while True:
+        result = json.loads(await websocket.recv())
+        if result.get("id") == message_id:
+            if not result.get("success"):
+                raise RuntimeError(f"Service call failed: {result}")
+            return
+
+
+async def run_benchmark(entity_id, item, rounds, db_path, commit_wait):
+    """Complete and uncomplete a task ``rounds`` times and report the growth."""
+    uri = "ws://localhost:8123/api/websocket"
+
+    async with websockets.connect(uri) as websocket:
+        await websocket.recv()  # auth_required
+        # No token needed for local connections in dev mode
+        await websocket.send(
+            json.dumps(
+                {"type": "auth", "access_token": "dummy_token_not_needed_for_localhost"}
+            )
+        )
+        print(f"Auth result: {await websocket.recv()}")
+
+        # Let the recorder flush whatever was pending before measuring
+        await asyncio.sleep(commit_wait)
+        state_rows, attr_rows, size = measure(db_path)
+
+        message_id = 1
+        for _ in range(rounds):
+            for status in ("completed", "needs_action"):
+                await update_item(websocket, message_id, entity_id, item, status)
+                message_id += 1
+
+        # The recorder commits on an interval (1 s by default)
+        await asyncio.sleep(commit_wait)
+        new_state_rows, new_attr_rows, new_size = measure(db_path)
+
+    changes = rounds * 2
+    print(f"Changes:               {changes} ({rounds} completions + uncompletes)")
+    print(f"State rows written:    {new_state_rows - state_rows}")
+    print(f"Attribute rows stored: {new_attr_rows - attr_rows}")
+    print(f"Recorder bytes:        {new_size - size}")
+    print(f"Bytes per change:      {(new_size - size) / changes:.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("entity_id", help="ChoreBot list, e.g. todo.chorebot_chores")
+    parser.add_argument("item", help="Summary or UID of a task on that list")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--db", default=DEFAULT_DB, help="Recorder database path")
+    parser.add_argument(
+        "--commit-wait", type=float, default=5, help="Seconds to wait for the recorder"
+    )
+    args = parser.parse_args()
+    asyncio.run(
+        run_benchmark(args.entity_id, args.item, args.rounds, args.db, args.commit_wait)
+    )
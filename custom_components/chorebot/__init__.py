@@ -2,58 +2,83 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
 import logging
+from typing import Any
 from zoneinfo import ZoneInfo
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.helpers import (
     aiohttp_client,
     config_entry_oauth2_flow,
     config_validation as cv,
     entity_registry as er,
 )
-from homeassistant.helpers.event import (
-    async_track_time_change,
-    async_track_time_interval,
-)
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.util import slugify
 
 from .const import (
     BACKEND_TICKTICK,
+    CONF_JOURNAL_STORAGE,
+    CONF_SQLITE_STORAGE,
     CONF_SYNC_BACKEND,
     CONF_SYNC_ENABLED,
     CONF_SYNC_INTERVAL_MINUTES,
+    CONF_SYNC_MAX_INTERVAL_MINUTES,
+    CONF_SYNC_MIN_INTERVAL_MINUTES,
+    CONF_SYNC_TRACE,
+    DEFAULT_JOURNAL_STORAGE,
+    DEFAULT_SQLITE_STORAGE,
     DEFAULT_SYNC_INTERVAL_MINUTES,
+    DEFAULT_SYNC_MAX_INTERVAL_MINUTES,
+    DEFAULT_SYNC_MIN_INTERVAL_MINUTES,
+    DEFAULT_SYNC_TRACE,
     DOMAIN,
     SERVICE_ADD_TASK,
+    SERVICE_ADD_TASKS,
     SERVICE_ADJUST_POINTS,
+    SERVICE_ADJUST_POINTS_BATCH,
+    SERVICE_COMPLETE_TASKS,
     SERVICE_CREATE_LIST,
     SERVICE_DELETE_REWARD,
     SERVICE_DELETE_TASK,
     SERVICE_MANAGE_PERSON,
     SERVICE_MANAGE_REWARD,
+    SERVICE_REBUILD_STREAKS,
     SERVICE_REDEEM_REWARD,
     SERVICE_RUN_MAINTENANCE,
     SERVICE_SYNC,
     SERVICE_SYNC_PEOPLE,
     SERVICE_UPDATE_TASK,
+    SERVICE_UPDATE_TASKS,
 )
 from .audit_log import AuditLogger
+from .completion_commit import CompletionCommitter
+from .database import ChoreBotDatabase
+from .due_scheduler import DueScheduler
+from .history import CompletionHistory
 from .oauth_api import AsyncConfigEntryAuth
 from .people import PeopleStore
 from .store import ChoreBotStore
 from .sync_coordinator import SyncCoordinator
+from .sync_trace import SyncTracer
 from .ticktick_backend import TickTickBackend
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.TODO, Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.TODO, Platform.SENSOR, Platform.CALENDAR]
 
 # Service schema for chorebot.create_list
 CREATE_LIST_SCHEMA = vol.Schema(
@@ -101,6 +126,38 @@ UPDATE_TASK_SCHEMA = vol.Schema(
     }
 )
 
+# Service schema for chorebot.add_tasks (each task may target its own list)
+ADD_TASKS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("list_id"): cv.string,
+        vol.Required("tasks"): vol.All(
+            cv.ensure_list,
+            vol.Length(min=1),
+            [ADD_TASK_SCHEMA.extend({vol.Optional("list_id"): cv.string})],
+        ),
+    }
+)
+
+# Service schema for chorebot.update_tasks (each update may target its own list)
+UPDATE_TASKS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("list_id"): cv.string,
+        vol.Required("tasks"): vol.All(
+            cv.ensure_list,
+            vol.Length(min=1),
+            [UPDATE_TASK_SCHEMA.extend({vol.Optional("list_id"): cv.string})],
+        ),
+    }
+)
+
+# Service schema for chorebot.complete_tasks
+COMPLETE_TASKS_SCHEMA = vol.Schema(
+    {
+        vol.Required("list_id"): cv.string,
+        vol.Required("uids"): vol.All(cv.ensure_list, vol.Length(min=1), [cv.string]),
+    }
+)
+
 # Service schema for chorebot.delete_task
 DELETE_TASK_SCHEMA = vol.Schema(
     {
@@ -147,6 +204,37 @@ ADJUST_POINTS_SCHEMA = vol.Schema(
     }
 )
 
+# Service schema for chorebot.adjust_points_batch
+ADJUST_POINTS_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required("adjustments"): vol.All(
+            cv.ensure_list,
+            vol.Length(min=1),
+            [
+                vol.Schema(
+                    {
+                        vol.Required("person_id"): cv.entity_id,
+                        vol.Required("amount"): vol.All(
+                            vol.Coerce(int), vol.Range(min=-10000, max=10000)
+                        ),
+                        vol.Optional("reason"): cv.string,
+                    }
+                )
+            ],
+        ),
+        vol.Optional("reason"): cv.string,
+    }
+)
+
+# Service schema for chorebot.rebuild_streaks
+REBUILD_STREAKS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("list_id"): cv.entity_id,
+        vol.Optional("uid"): cv.string,
+        vol.Optional("dry_run", default=False): cv.boolean,
+    }
+)
+
 # Service schema for chorebot.update_list
 UPDATE_LIST_SCHEMA = vol.Schema(
     {
@@ -200,11 +288,21 @@ async def _async_setup_sync_coordinator(
     aiohttp_session = aiohttp_client.async_get_clientsession(hass)
     auth = AsyncConfigEntryAuth(aiohttp_session, oauth_session)
 
+    # Sync tracer: run summaries always, raw payload capture only when opted in
+    tracer = SyncTracer(
+        capture_payloads=entry.options.get(CONF_SYNC_TRACE, DEFAULT_SYNC_TRACE)
+    )
+    hass.data[DOMAIN]["sync_tracer"] = tracer
+    store.tracer = tracer
+
     # Create backend based on config
     backend_type = entry.data.get(CONF_SYNC_BACKEND, BACKEND_TICKTICK)
 
     if backend_type == BACKEND_TICKTICK:
-        backend = TickTickBackend(hass, store, auth, dict(entry.data))
+        # Options (e.g., delta sync) override setup data
+        backend = TickTickBackend(
+            hass, store, auth, {**entry.data, **entry.options}, tracer
+        )
     else:
         _LOGGER.error("Unknown sync backend: %s", backend_type)
         return None
@@ -233,7 +331,7 @@ def _extract_list_id_from_entity(hass: HomeAssistant, entity_id: str) -> str | N
 
 
 def _extract_task_data_from_service_call(
-    call: ServiceCall,
+    call_data: Mapping[str, Any],
     hass: HomeAssistant,
     include_uid: bool = False,
     apply_section_default: bool = False,
@@ -246,7 +344,7 @@ def _extract_task_data_from_service_call(
     Handles datetime conversion, tag normalization, and field extraction.
 
     Args:
-        call: The service call containing task data
+        call_data: Service call data (or one item of a batch service call)
         hass: Home Assistant instance for timezone handling
         include_uid: If True, extract uid field (for updates)
         apply_section_default: If True, apply default section if not provided (for creates)
@@ -260,21 +358,21 @@ def _extract_task_data_from_service_call(
 
     # UID (for updates only)
     if include_uid:
-        data["uid"] = call.data["uid"]
+        data["uid"] = call_data["uid"]
 
     # Core fields - only include if present in service call
-    if "summary" in call.data:
-        data["summary"] = call.data["summary"]
+    if "summary" in call_data:
+        data["summary"] = call_data["summary"]
 
-    if "description" in call.data:
-        data["description"] = call.data["description"]
+    if "description" in call_data:
+        data["description"] = call_data["description"]
 
-    if "status" in call.data:
-        data["status"] = call.data["status"]
+    if "status" in call_data:
+        data["status"] = call_data["status"]
 
     # Due date (with datetime conversion)
-    if "due" in call.data:
-        due = call.data["due"]
+    if "due" in call_data:
+        due = call_data["due"]
         if due == "":
             # Empty string means explicitly clear the due date (update only)
             data["due"] = ""
@@ -289,39 +387,39 @@ def _extract_task_data_from_service_call(
             data["due"] = due_utc.isoformat().replace("+00:00", "Z")
 
     # Boolean flags
-    if "is_all_day" in call.data:
-        data["is_all_day"] = call.data["is_all_day"]
+    if "is_all_day" in call_data:
+        data["is_all_day"] = call_data["is_all_day"]
 
     # Organization fields
     # Tags: distinguish between "not provided" and "provided as empty list"
-    if "tags" in call.data:
-        data["tags"] = call.data["tags"] if call.data["tags"] is not None else []
+    if "tags" in call_data:
+        data["tags"] = call_data["tags"] if call_data["tags"] is not None else []
 
-    if "section_id" in call.data:
-        data["section_id"] = call.data["section_id"]
+    if "section_id" in call_data:
+        data["section_id"] = call_data["section_id"]
     elif apply_section_default and store and list_id:
         # Apply default section if creating a new task and no section provided
         data["section_id"] = store.get_default_section_id(list_id)
 
     # Points system fields
-    if "points_value" in call.data:
-        data["points_value"] = call.data["points_value"]
+    if "points_value" in call_data:
+        data["points_value"] = call_data["points_value"]
 
-    if "streak_bonus_points" in call.data:
-        data["streak_bonus_points"] = call.data["streak_bonus_points"]
+    if "streak_bonus_points" in call_data:
+        data["streak_bonus_points"] = call_data["streak_bonus_points"]
 
-    if "streak_bonus_interval" in call.data:
-        data["streak_bonus_interval"] = call.data["streak_bonus_interval"]
+    if "streak_bonus_interval" in call_data:
+        data["streak_bonus_interval"] = call_data["streak_bonus_interval"]
 
     # Recurrence fields
-    if "rrule" in call.data:
-        data["rrule"] = call.data["rrule"]
+    if "rrule" in call_data:
+        data["rrule"] = call_data["rrule"]
 
-    if "is_dateless_recurring" in call.data:
-        data["is_dateless_recurring"] = call.data["is_dateless_recurring"]
+    if "is_dateless_recurring" in call_data:
+        data["is_dateless_recurring"] = call_data["is_dateless_recurring"]
 
-    if "include_future_occurrences" in call.data:
-        data["include_future_occurrences"] = call.data["include_future_occurrences"]
+    if "include_future_occurrences" in call_data:
+        data["include_future_occurrences"] = call_data["include_future_occurrences"]
 
     return data
 
@@ -329,7 +427,6 @@ def _extract_task_data_from_service_call(
 async def _handle_create_list(
     call: ServiceCall,
     hass: HomeAssistant,
-    entry: ConfigEntry,
     store: ChoreBotStore,
     sync_coordinator: SyncCoordinator | None,
 ) -> None:
@@ -357,6 +454,7 @@ async def _handle_create_list(
         kwargs["person_id"] = person_id
         _LOGGER.info("Assigning person %s to new list: %s", person_id, list_id)
 
+    # The todo platform adds the new list's entity (no config entry reload)
     await store.async_create_list(list_id, name, **kwargs)
 
     # Auto-create remote list if sync is enabled
@@ -371,10 +469,6 @@ async def _handle_create_list(
                 remote_list_id,
             )
 
-    # Schedule reload as background task so service returns immediately
-    # This prevents UI from briefly losing service definition
-    hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
-
 
 async def _handle_add_task(
     call: ServiceCall,
@@ -404,7 +498,7 @@ async def _handle_add_task(
 
     # Extract and normalize task data using shared function
     task_data = _extract_task_data_from_service_call(
-        call=call,
+        call_data=call.data,
         hass=hass,
         include_uid=False,
         apply_section_default=True,
@@ -449,7 +543,7 @@ async def _handle_update_task(
 
     # Extract and normalize task data using shared function
     task_data = _extract_task_data_from_service_call(
-        call=call,
+        call_data=call.data,
         hass=hass,
         include_uid=True,
         apply_section_default=False,
@@ -461,6 +555,145 @@ async def _handle_update_task(
     await entity.async_update_task_internal(**task_data)
 
 
+def _group_batch_items_by_list(
+    hass: HomeAssistant, call: ServiceCall
+) -> dict[str, tuple[Any, list[dict[str, Any]]]]:
+    """Group the items of a batch task service by list.
+
+    Each list entity is resolved once. Items use their own list_id, falling
+    back to the call's top-level list_id.
+
+    Returns:
+        list_id -> (entity, items in call order)
+
+    Raises:
+        ValueError: If an item has no list or a list cannot be resolved
+    """
+    default_entity_id = call.data.get("list_id")
+    entities = hass.data[DOMAIN].get("entities", {})
+    resolved: dict[str, str | None] = {}
+    grouped: dict[str, tuple[Any, list[dict[str, Any]]]] = {}
+
+    for item in call.data["tasks"]:
+        entity_id = item.get("list_id", default_entity_id)
+        if not entity_id:
+            raise ValueError("list_id is required (top level or per task)")
+
+        if entity_id not in resolved:
+            resolved[entity_id] = _extract_list_id_from_entity(hass, entity_id)
+        list_id = resolved[entity_id]
+        if not list_id:
+            raise ValueError(f"Invalid entity_id provided: {entity_id}")
+
+        if list_id not in grouped:
+            entity = entities.get(list_id)
+            if not entity:
+                raise ValueError(f"Entity not found for list_id: {list_id}")
+            grouped[list_id] = (entity, [])
+        grouped[list_id][1].append(item)
+
+    return grouped
+
+
+async def _handle_add_tasks(
+    call: ServiceCall,
+    hass: HomeAssistant,
+    store: ChoreBotStore,
+    sync_coordinator: SyncCoordinator | None,
+) -> None:
+    """Handle the chorebot.add_tasks service.
+
+    All items are validated before anything is written. Each affected list
+    is committed, written to the state machine and pushed to sync once.
+    """
+    batches = []
+    for list_id, (entity, items) in _group_batch_items_by_list(hass, call).items():
+        task_items = []
+        for item in items:
+            task_data = _extract_task_data_from_service_call(
+                call_data=item,
+                hass=hass,
+                include_uid=False,
+                apply_section_default=True,
+                store=store,
+                list_id=list_id,
+            )
+
+            # Validation: Cannot have both rrule and is_dateless_recurring
+            if task_data.get("rrule") and task_data.get("is_dateless_recurring"):
+                raise ValueError(
+                    f"Cannot specify both rrule and is_dateless_recurring: {item['summary']}"
+                )
+            task_items.append(task_data)
+        batches.append((list_id, entity, task_items))
+
+    for list_id, entity, task_items in batches:
+        created = await entity.async_create_tasks_internal(task_items)
+        _LOGGER.info("Added %d tasks via service to list %s", created, list_id)
+
+
+async def _handle_update_tasks(
+    call: ServiceCall,
+    hass: HomeAssistant,
+    store: ChoreBotStore,
+    sync_coordinator: SyncCoordinator | None,
+) -> None:
+    """Handle the chorebot.update_tasks service.
+
+    Updates are applied per list as one batch (see async_update_tasks_internal).
+    """
+    batches = [
+        (
+            list_id,
+            entity,
+            [
+                _extract_task_data_from_service_call(
+                    call_data=item,
+                    hass=hass,
+                    include_uid=True,
+                    apply_section_default=False,
+                    store=None,
+                    list_id=None,
+                )
+                for item in items
+            ],
+        )
+        for list_id, (entity, items) in _group_batch_items_by_list(hass, call).items()
+    ]
+
+    for list_id, entity, updates in batches:
+        _LOGGER.info("Updating %d tasks via service in list %s", len(updates), list_id)
+        await entity.async_update_tasks_internal(updates)
+
+
+async def _handle_complete_tasks(
+    call: ServiceCall,
+    hass: HomeAssistant,
+    store: ChoreBotStore,
+    sync_coordinator: SyncCoordinator | None,
+) -> None:
+    """Handle the chorebot.complete_tasks service."""
+    entity_id = call.data["list_id"]
+    uids = call.data["uids"]
+
+    list_id = _extract_list_id_from_entity(hass, entity_id)
+    if not list_id:
+        _LOGGER.error("Invalid entity_id provided: %s", entity_id)
+        return
+
+    _LOGGER.info("Completing %d tasks via service in list %s", len(uids), list_id)
+
+    # Get the entity instance
+    entities = hass.data[DOMAIN].get("entities", {})
+    entity = entities.get(list_id)
+
+    if not entity:
+        _LOGGER.error("Entity not found for list_id: %s", list_id)
+        return
+
+    await entity.async_complete_tasks_internal(uids)
+
+
 async def _handle_delete_task(
     call: ServiceCall,
     hass: HomeAssistant,
@@ -520,18 +753,19 @@ async def _handle_sync(
     stats = await sync_coordinator.async_pull_changes(list_id)
     _LOGGER.info("Sync completed: %s", stats)
 
-    # Notify entities to update their state immediately
+    # Update only the entities whose list actually changed
+    refreshed = _refresh_changed_entities(hass)
+    _LOGGER.debug("Updated state for %d changed lists", refreshed)
+
+
+def _refresh_changed_entities(hass: HomeAssistant) -> int:
+    """Schedule state writes for list entities whose list changed.
+
+    Returns:
+        Number of entities scheduled for a state write
+    """
     entities = hass.data[DOMAIN].get("entities", {})
-    if list_id:
-        # Update specific list
-        if entity := entities.get(list_id):
-            entity.async_write_ha_state()
-            _LOGGER.debug("Updated entity state for list: %s", list_id)
-    else:
-        # Update all entities
-        for entity in entities.values():
-            entity.async_write_ha_state()
-        _LOGGER.debug("Updated state for all %d entities", len(entities))
+    return sum(entity.async_refresh_if_changed() for entity in entities.values())
 
 
 async def _handle_manage_reward(
@@ -567,12 +801,6 @@ async def _handle_manage_reward(
 
     _LOGGER.info("Reward managed successfully: %s (id: %s)", name, result_id)
 
-    # Trigger immediate sensor update
-    points_sensor = hass.data[DOMAIN].get("points_sensor")
-    if points_sensor:
-        points_sensor.async_write_ha_state()
-        _LOGGER.debug("Triggered points sensor update after reward management")
-
 
 async def _handle_redeem_reward(
     call: ServiceCall,
@@ -598,12 +826,6 @@ async def _handle_redeem_reward(
 
     _LOGGER.info("Reward redeemed successfully: %s", message)
 
-    # Trigger immediate sensor update
-    points_sensor = hass.data[DOMAIN].get("points_sensor")
-    if points_sensor:
-        points_sensor.async_write_ha_state()
-        _LOGGER.debug("Triggered points sensor update after redemption")
-
 
 async def _handle_delete_reward(
     call: ServiceCall,
@@ -623,12 +845,6 @@ async def _handle_delete_reward(
 
     _LOGGER.info("Reward deleted successfully: %s", reward_id)
 
-    # Trigger immediate sensor update
-    points_sensor = hass.data[DOMAIN].get("points_sensor")
-    if points_sensor:
-        points_sensor.async_write_ha_state()
-        _LOGGER.debug("Triggered points sensor update after reward deletion")
-
 
 async def _handle_adjust_points(
     call: ServiceCall,
@@ -656,11 +872,40 @@ async def _handle_adjust_points(
 
     _LOGGER.info("Points adjusted successfully for %s", person_id)
 
-    # Trigger immediate sensor update
-    points_sensor = hass.data[DOMAIN].get("points_sensor")
-    if points_sensor:
-        points_sensor.async_write_ha_state()
-        _LOGGER.debug("Triggered points sensor update after points adjustment")
+
+async def _handle_adjust_points_batch(
+    call: ServiceCall,
+    hass: HomeAssistant,
+    people_store: PeopleStore,
+) -> None:
+    """Handle the chorebot.adjust_points_batch service."""
+    default_reason = call.data.get("reason")
+    person_ids = set(hass.states.async_entity_ids("person"))
+
+    # Validate every adjustment before applying any of them
+    entries = []
+    for adjustment in call.data["adjustments"]:
+        person_id = adjustment["person_id"]
+        if person_id not in person_ids:
+            _LOGGER.error("Person entity not found: %s", person_id)
+            raise ValueError(f"Person entity not found: {person_id}")
+
+        reason = adjustment.get("reason", default_reason)
+        if not reason:
+            raise ValueError(f"Reason is required for adjustment of {person_id}")
+
+        entries.append(
+            {
+                "person_id": person_id,
+                "amount": adjustment["amount"],
+                "type": "manual_adjustment",
+                "metadata": {"reason": reason},
+            }
+        )
+
+    _LOGGER.info("Adjusting points in batch: %d adjustments", len(entries))
+
+    await people_store.async_add_points_batch(entries)
 
 
 async def _handle_sync_people(
@@ -697,10 +942,15 @@ async def _handle_run_maintenance(
     # Run the daily maintenance job immediately
     await _daily_maintenance(hass, store, datetime.now(UTC))
 
+    # Apply any overdue streak resets right away as well
+    if scheduler := hass.data[DOMAIN].get("due_scheduler"):
+        reset_count = await scheduler.async_reset_overdue_streaks()
+        _LOGGER.info("Reset %d streaks for overdue recurring tasks", reset_count)
+
     # Trigger immediate entity state updates so frontend reflects changes
     entities = hass.data[DOMAIN].get("entities", {})
     for entity in entities.values():
-        entity.async_write_ha_state()
+        entity.async_schedule_state_write()
     _LOGGER.debug(
         "Updated state for all %d entities after manual maintenance", len(entities)
     )
@@ -708,6 +958,38 @@ async def _handle_run_maintenance(
     _LOGGER.info("Manual maintenance completed")
 
 
+async def _handle_rebuild_streaks(
+    call: ServiceCall,
+    hass: HomeAssistant,
+    history: CompletionHistory,
+) -> ServiceResponse:
+    """Handle the chorebot.rebuild_streaks service."""
+    list_id = None
+    if entity_id := call.data.get("list_id"):
+        list_id = _extract_list_id_from_entity(hass, entity_id)
+        if not list_id:
+            raise ValueError(f"Invalid entity_id provided: {entity_id}")
+    elif "uid" in call.data:
+        raise ValueError("list_id is required when uid is given")
+
+    dry_run = call.data["dry_run"]
+    mismatches = await history.async_rebuild_streaks(
+        list_id, call.data.get("uid"), dry_run
+    )
+    _LOGGER.info(
+        "%s %d template streaks from completion history",
+        "Found differing" if dry_run else "Rebuilt",
+        len(mismatches),
+    )
+
+    if mismatches and not dry_run:
+        entities = hass.data[DOMAIN].get("entities", {})
+        for entity_list_id, entity in entities.items():
+            if list_id is None or entity_list_id == list_id:
+                entity.async_schedule_state_write()
+    return {"templates": mismatches}
+
+
 async def _handle_manage_person(
     call: ServiceCall,
     hass: HomeAssistant,
@@ -752,12 +1034,6 @@ async def _handle_manage_person(
 
     _LOGGER.info("Person profile updated successfully: %s", person_id)
 
-    # Trigger immediate sensor update
-    points_sensor = hass.data[DOMAIN].get("points_sensor")
-    if points_sensor:
-        points_sensor.async_write_ha_state()
-        _LOGGER.debug("Triggered points sensor update after person profile update")
-
 
 async def _handle_update_list(
     call: ServiceCall,
@@ -804,7 +1080,7 @@ async def _handle_update_list(
     # Trigger immediate entity state update so frontend sees the change
     entities = hass.data[DOMAIN].get("entities", {})
     if entity := entities.get(list_id):
-        entity.async_write_ha_state()
+        entity.async_schedule_state_write()
         _LOGGER.debug("Triggered entity state update after list update: %s", list_id)
 
 
@@ -931,72 +1207,68 @@ async def _handle_manage_section(
     # Trigger immediate entity state update so frontend sees the change
     entities = hass.data[DOMAIN].get("entities", {})
     if entity := entities.get(list_id):
-        entity.async_write_ha_state()
+        entity.async_schedule_state_write()
         _LOGGER.debug(
             "Triggered entity state update after section %s: %s", action, list_id
         )
 
 
 async def _daily_maintenance(hass: HomeAssistant, store: ChoreBotStore, now) -> None:
-    """Daily maintenance: archive old instances, hide completed instances, check streaks."""
+    """Daily maintenance: archive old instances, hide completed instances.
+
+    Overdue streak resets are applied by the due scheduler as each due date ends.
+    """
     _LOGGER.debug("Running daily maintenance job")
 
-    # Get all lists
-    lists = store.get_all_lists()
+    # Lists have independent locks, so maintain them concurrently
+    await asyncio.gather(
+        *(
+            _daily_maintenance_for_list(store, list_config["id"])
+            for list_config in store.get_all_lists()
+        )
+    )
 
-    for list_config in lists:
-        list_id = list_config["id"]
 
-        # 1. Archive instances completed 30+ days ago
-        archived_count = await store.async_archive_old_instances(list_id, days=30)
-        if archived_count > 0:
-            _LOGGER.info(
-                "Archived %d old instances from list %s", archived_count, list_id
+async def _daily_maintenance_for_list(store: ChoreBotStore, list_id: str) -> None:
+    """Run daily maintenance for a single list."""
+    # 1. Archive instances completed 30+ days ago
+    archived_count = await store.async_archive_old_instances(list_id, days=30)
+    if archived_count > 0:
+        _LOGGER.info("Archived %d old instances from list %s", archived_count, list_id)
+
+    # 2. Soft-delete completed tasks (working copies, committed in one save)
+    deleted_tasks = []
+    for task in store.get_tasks_for_list(list_id):
+        if task.status == "completed" and not task.is_deleted():
+            _LOGGER.debug(
+                "Soft-deleting completed task: %s",
+                task.summary,
             )
-
-        # 2. Soft-delete completed tasks
-        tasks = store.get_tasks_for_list(list_id)
-
-        for task in tasks:
-            if task.status == "completed":
-                _LOGGER.debug(
-                    "Soft-deleting completed task: %s",
-                    task.summary,
-                )
-                task.mark_deleted()
-                await store.async_update_task(list_id, task)
-
-    # 3. Check for overdue instances and reset template streaks
-    templates = await store.async_get_all_recurring_templates()
-
-    for list_id, template in templates:
-        # Get all instances for this template
-        instances = store.get_instances_for_template(list_id, template.uid)
-
-        # Find the most recent instance
-        if instances:
-            # Sort by occurrence_index descending
-            instances.sort(key=lambda t: t.occurrence_index, reverse=True)
-            latest_instance = instances[0]
-
-            # If latest instance is overdue and not completed, reset streak
-            if latest_instance.is_overdue() and template.streak_current > 0:
-                _LOGGER.info(
-                    "Resetting streak for overdue template: %s (was %d)",
-                    template.summary,
-                    template.streak_current,
-                )
-                template.streak_current = 0
-                template.update_modified()
-                await store.async_update_task(list_id, template)
+            task.mark_deleted()
+            deleted_tasks.append(task)
+    if deleted_tasks:
+        await store.async_commit_tasks(list_id, deleted_tasks)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up ChoreBot from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
+    # Optional SQLite storage engine (imports the JSON files on first use)
+    database = None
+    if entry.options.get(CONF_SQLITE_STORAGE, DEFAULT_SQLITE_STORAGE):
+        database = ChoreBotDatabase(hass)
+        await database.async_open()
+        hass.data[DOMAIN]["database"] = database
+
     # Initialize data storage layer
-    store = ChoreBotStore(hass)
+    store = ChoreBotStore(
+        hass,
+        journal_storage=entry.options.get(
+            CONF_JOURNAL_STORAGE, DEFAULT_JOURNAL_STORAGE
+        ),
+        database=database,
+    )
     await store.async_load()
 
     # Store in hass.data
@@ -1004,11 +1276,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Store saved to hass.data")
 
     # Initialize people store
-    people_store = PeopleStore(hass)
+    people_store = PeopleStore(hass, database)
     await people_store.async_load()
     hass.data[DOMAIN]["people_store"] = people_store
     _LOGGER.info("People store initialized")
 
+    # Completions commit tasks and points as one unit; roll forward any
+    # completion interrupted by a crash before entities read the stores
+    completion_committer = CompletionCommitter(hass, store, people_store)
+    await completion_committer.async_recover()
+    hass.data[DOMAIN]["completion_committer"] = completion_committer
+
     # Initialize audit logger
     audit_log_path = hass.config.path(".storage", "chorebot_audit.log")
     audit_logger = AuditLogger(audit_log_path)
@@ -1031,6 +1309,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     sync_coordinator = await _async_setup_sync_coordinator(hass, entry, store)
     hass.data[DOMAIN]["sync_coordinator"] = sync_coordinator
 
+    # Per-template completion history (the due scheduler records misses)
+    completion_history = CompletionHistory(hass, store)
+    await completion_history.async_load()
+    completion_history.async_start()
+    hass.data[DOMAIN]["completion_history"] = completion_history
+
+    # Fire due/overdue events and streak resets at each task's due time
+    due_scheduler = DueScheduler(hass, store)
+    due_scheduler.async_start()
+    hass.data[DOMAIN]["due_scheduler"] = due_scheduler
+
     # Set up daily maintenance job
     async def daily_maintenance(now):
         """Wrapper for daily maintenance."""
@@ -1046,41 +1335,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         sync_interval_minutes = entry.data.get(
             CONF_SYNC_INTERVAL_MINUTES, DEFAULT_SYNC_INTERVAL_MINUTES
         )
+        min_interval_minutes = entry.options.get(
+            CONF_SYNC_MIN_INTERVAL_MINUTES, DEFAULT_SYNC_MIN_INTERVAL_MINUTES
+        )
+        max_interval_minutes = entry.options.get(
+            CONF_SYNC_MAX_INTERVAL_MINUTES, DEFAULT_SYNC_MAX_INTERVAL_MINUTES
+        )
 
-        async def periodic_sync(now):
-            """Periodically pull changes from remote backend."""
-            _LOGGER.debug("Running periodic sync")
-            stats = await sync_coordinator.async_pull_changes()
-
-            # Notify all entities to update their state if changes were made
-            if (
-                stats
-                and (
-                    stats.get("created", 0)
-                    + stats.get("updated", 0)
-                    + stats.get("deleted", 0)
-                )
-                > 0
-            ):
-                entities = hass.data[DOMAIN].get("entities", {})
-                for entity in entities.values():
-                    entity.async_write_ha_state()
+        async def periodic_sync(stats: dict[str, int]) -> None:
+            """Update the state of lists changed by a periodic pull."""
+            refreshed = _refresh_changed_entities(hass)
+            if refreshed:
                 _LOGGER.debug(
-                    "Updated state for all %d entities after periodic sync",
-                    len(entities),
+                    "Updated state for %d changed lists after periodic sync",
+                    refreshed,
                 )
 
-        hass.data[DOMAIN]["periodic_sync"] = async_track_time_interval(
-            hass, periodic_sync, timedelta(minutes=sync_interval_minutes)
+        # Adaptive schedule: polls faster after activity, backs off when quiet
+        hass.data[DOMAIN]["periodic_sync"] = sync_coordinator.async_start_polling(
+            periodic_sync,
+            interval=timedelta(minutes=sync_interval_minutes),
+            min_interval=timedelta(minutes=min_interval_minutes),
+            max_interval=timedelta(minutes=max_interval_minutes),
         )
         _LOGGER.info(
-            "Periodic sync enabled (interval: %d minutes)",
+            "Periodic sync enabled (interval: %d minutes, adaptive %d-%d minutes)",
             sync_interval_minutes,
+            min_interval_minutes,
+            max_interval_minutes,
         )
 
     # Register chorebot.create_list service
     async def handle_create_list(call: ServiceCall) -> None:
-        await _handle_create_list(call, hass, entry, store, sync_coordinator)
+        await _handle_create_list(call, hass, store, sync_coordinator)
 
     hass.services.async_register(
         DOMAIN, SERVICE_CREATE_LIST, handle_create_list, schema=CREATE_LIST_SCHEMA
@@ -1105,6 +1392,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     _LOGGER.info("Service registered: %s", SERVICE_UPDATE_TASK)
 
+    # Register chorebot.add_tasks service
+    async def handle_add_tasks(call: ServiceCall) -> None:
+        await _handle_add_tasks(call, hass, store, sync_coordinator)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_ADD_TASKS, handle_add_tasks, schema=ADD_TASKS_SCHEMA
+    )
+    _LOGGER.info("Service registered: %s", SERVICE_ADD_TASKS)
+
+    # Register chorebot.update_tasks service
+    async def handle_update_tasks(call: ServiceCall) -> None:
+        await _handle_update_tasks(call, hass, store, sync_coordinator)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_UPDATE_TASKS, handle_update_tasks, schema=UPDATE_TASKS_SCHEMA
+    )
+    _LOGGER.info("Service registered: %s", SERVICE_UPDATE_TASKS)
+
+    # Register chorebot.complete_tasks service
+    async def handle_complete_tasks(call: ServiceCall) -> None:
+        await _handle_complete_tasks(call, hass, store, sync_coordinator)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_COMPLETE_TASKS,
+        handle_complete_tasks,
+        schema=COMPLETE_TASKS_SCHEMA,
+    )
+    _LOGGER.info("Service registered: %s", SERVICE_COMPLETE_TASKS)
+
     # Register chorebot.delete_task service
     async def handle_delete_task(call: ServiceCall) -> None:
         await _handle_delete_task(call, hass, store, sync_coordinator)
@@ -1189,6 +1506,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         _LOGGER.info("Service registered: %s", SERVICE_ADJUST_POINTS)
 
+    # Register chorebot.adjust_points_batch service
+    if people_store:
+
+        async def handle_adjust_points_batch(call: ServiceCall) -> None:
+            await _handle_adjust_points_batch(call, hass, people_store)
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_ADJUST_POINTS_BATCH,
+            handle_adjust_points_batch,
+            schema=ADJUST_POINTS_BATCH_SCHEMA,
+        )
+        _LOGGER.info("Service registered: %s", SERVICE_ADJUST_POINTS_BATCH)
+
     # Register chorebot.sync_people service
     if people_store:
 
@@ -1243,6 +1574,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     _LOGGER.info("Service registered: %s", SERVICE_RUN_MAINTENANCE)
 
+    # Register chorebot.rebuild_streaks service
+    async def handle_rebuild_streaks(call: ServiceCall) -> ServiceResponse:
+        return await _handle_rebuild_streaks(call, hass, completion_history)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REBUILD_STREAKS,
+        handle_rebuild_streaks,
+        schema=REBUILD_STREAKS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    _LOGGER.info("Service registered: %s", SERVICE_REBUILD_STREAKS)
+
+    # Websocket API for dashboard cards (snapshot + incremental list deltas)
+    async_register_websocket_commands(hass)
+
     # Forward to TODO platform
     _LOGGER.info("Forwarding setup to platforms: %s", PLATFORMS)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -1261,10 +1608,22 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if "periodic_sync" in hass.data[DOMAIN]:
         hass.data[DOMAIN]["periodic_sync"]()
 
+    # Stop due-time scheduling
+    if due_scheduler := hass.data[DOMAIN].pop("due_scheduler", None):
+        due_scheduler.async_stop()
+    if completion_history := hass.data[DOMAIN].pop("completion_history", None):
+        completion_history.async_stop()
+
     # Unload platforms
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop("store", None)
+        # Fold journaled changes into the list files before dropping the store
+        if store := hass.data[DOMAIN].pop("store", None):
+            await store.async_shutdown()
+        if database := hass.data[DOMAIN].pop("database", None):
+            await database.async_close()
         hass.data[DOMAIN].pop("sync_coordinator", None)
+        hass.data[DOMAIN].pop("completion_committer", None)
+        hass.data[DOMAIN].pop("sync_tracer", None)
         hass.data[DOMAIN].pop("daily_maintenance", None)
         hass.data[DOMAIN].pop("periodic_sync", None)
 
@@ -0,0 +1,187 @@
+"""Segmented JSON archive of completed recurring instances."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_VERSION
+from .task import Task
+
+_LOGGER = logging.getLogger(__name__)
+
+# Parsed segments kept in memory (paging through history re-reads the same
+# few months)
+SEGMENT_CACHE_SIZE = 4
+
+# Archive position: (modified, uid); history is ordered newest first
+ArchiveKey = tuple[str, str]
+
+
+def archive_key(task: Task) -> ArchiveKey:
+    """Return the sort key of an archived instance.
+
+    Instances are archived by ``modified`` (their completion, for completed
+    instances), so the same time orders the history.
+    """
+    return (task.modified.replace("+00:00", "Z"), task.uid)
+
+
+class ListArchive:
+    """Archive of one list, split into one storage file per month.
+
+    ``chorebot_list_<id>_archive`` holds the manifest (the months that have
+    a segment); each month's instances live in
+    ``chorebot_list_<id>_archive_<YYYY-MM>``. Archiving rewrites only the
+    months it appends to, and a history page reads only the months it
+    needs, newest first. A legacy single-file archive is split into
+    segments the first time it is read.
+    """
+
+    def __init__(self, hass: HomeAssistant, list_id: str) -> None:
+        """Initialize the archive."""
+        self.hass = hass
+        self._list_id = list_id
+        self._manifest_store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}_list_{list_id}_archive"
+        )
+        self._months: list[str] | None = None  # Sorted, None until loaded
+        self._segment_stores: dict[str, Store] = {}
+        # month -> instances sorted newest first (LRU)
+        self._segment_cache: OrderedDict[str, list[Task]] = OrderedDict()
+        # Serializes manifest loading (a legacy split writes) and appends
+        self._lock = asyncio.Lock()
+
+    def _segment_store(self, month: str) -> Store:
+        """Get the storage file of a month."""
+        store = self._segment_stores.get(month)
+        if store is None:
+            store = self._segment_stores[month] = Store(
+                self.hass,
+                STORAGE_VERSION,
+                f"{DOMAIN}_list_{self._list_id}_archive_{month}",
+            )
+        return store
+
+    async def _async_months(self) -> list[str]:
+        """Load the manifest (splitting a legacy archive on first use)."""
+        if self._months is not None:
+            return self._months
+
+        async with self._lock:
+            if self._months is None:
+                await self._async_load_manifest()
+        assert self._months is not None
+        return self._months
+
+    async def _async_load_manifest(self) -> None:
+        """Read the manifest, or split a legacy single-file archive (lock held)."""
+        data = await self._manifest_store.async_load()
+        if data is None:
+            self._months = []
+        elif "months" in data:
+            self._months = sorted(data["months"])
+        else:
+            legacy = [Task.from_dict(t) for t in data.get("tasks", [])]
+            self._months = []
+            await self._async_write(legacy)
+            _LOGGER.info(
+                "Split archive of list %s into %d monthly segments (%d instances)",
+                self._list_id,
+                len(self._months),
+                len(legacy),
+            )
+
+    async def _async_segment(self, month: str) -> list[Task]:
+        """Load a month's instances, newest first."""
+        tasks = self._segment_cache.get(month)
+        if tasks is not None:
+            self._segment_cache.move_to_end(month)
+            return tasks
+
+        data = await self._segment_store(month).async_load()
+        tasks = [Task.from_dict(t) for t in (data or {}).get("tasks", [])]
+        tasks.sort(key=archive_key, reverse=True)
+        self._segment_cache[month] = tasks
+        if len(self._segment_cache) > SEGMENT_CACHE_SIZE:
+            self._segment_cache.popitem(last=False)
+        return tasks
+
+    async def async_append(self, tasks: Iterable[Task]) -> None:
+        """Append archived instances to their monthly segments."""
+        await self._async_months()
+        async with self._lock:
+            await self._async_write(list(tasks))
+
+    async def _async_write(self, tasks: list[Task]) -> None:
+        """Write instances to their segments and save the manifest."""
+        assert self._months is not None
+        by_month: dict[str, list[Task]] = {}
+        for task in tasks:
+            by_month.setdefault(archive_key(task)[0][:7], []).append(task)
+        if not by_month:
+            return
+
+        for month, month_tasks in by_month.items():
+            existing = (
+                await self._async_segment(month) if month in self._months else []
+            )
+            merged = {task.uid: task for task in (*existing, *month_tasks)}
+            await self._segment_store(month).async_save(
+                {"tasks": [task.to_dict() for task in merged.values()]}
+            )
+            self._segment_cache.pop(month, None)
+
+        self._months = sorted({*self._months, *by_month})
+        await self._manifest_store.async_save({"months": self._months})
+
+    async def async_load_all(self) -> list[Task]:
+        """Load every archived instance (newest first)."""
+        tasks: list[Task] = []
+        for month in reversed(await self._async_months()):
+            tasks.extend(await self._async_segment(month))
+        return tasks
+
+    async def async_read_all(self) -> list[Task]:
+        """Load every archived instance without writing (for the SQLite import).
+
+        A legacy single-file archive is returned as is instead of being split.
+        """
+        data = await self._manifest_store.async_load()
+        if data is not None and "months" not in data:
+            return [Task.from_dict(t) for t in data.get("tasks", [])]
+        return await self.async_load_all()
+
+    async def async_page(
+        self,
+        limit: int,
+        before: ArchiveKey | None = None,
+        predicate: Callable[[Task], bool] | None = None,
+    ) -> list[Task]:
+        """Read up to ``limit`` instances older than ``before``, newest first.
+
+        Args:
+            limit: Max instances to return
+            before: Only instances whose archive_key is smaller
+            predicate: Only instances it accepts
+
+        Returns:
+            Matching instances, newest first
+        """
+        result: list[Task] = []
+        for month in reversed(await self._async_months()):
+            if before is not None and month > before[0][:7]:
+                continue
+            for task in await self._async_segment(month):
+                if before is not None and archive_key(task) >= before:
+                    continue
+                if predicate is None or predicate(task):
+                    result.append(task)
+                    if len(result) >= limit:
+                        return result
+        return result
@@ -0,0 +1,318 @@
+"""Calendar platform for ChoreBot integration."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from datetime import UTC, date, datetime, timedelta
+import logging
+from typing import Any
+
+from dateutil.rrule import rrulestr
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, SIGNAL_LIST_ADDED, SIGNAL_LIST_REMOVED
+from .store import ChoreBotStore
+from .task import Task
+
+_LOGGER = logging.getLogger(__name__)
+
+# Timed tasks have a due time, not a duration; show them as short events
+TIMED_EVENT_DURATION = timedelta(minutes=30)
+# Longest event (all-day); bounds how far before a range an overlapping event can start
+MAX_EVENT_DURATION = timedelta(days=1)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up ChoreBot calendar platform (one calendar per list)."""
+    store: ChoreBotStore = hass.data[DOMAIN]["store"]
+    calendars: dict[str, ChoreBotCalendar] = {
+        list_config["id"]: ChoreBotCalendar(
+            store, list_config["id"], list_config["name"]
+        )
+        for list_config in store.get_all_lists()
+    }
+    async_add_entities(calendars.values())
+    _LOGGER.info("Created %d calendar entities", len(calendars))
+
+    @callback
+    def async_add_list(list_id: str) -> None:
+        """Add the calendar of a newly created list."""
+        list_config = store.get_list(list_id)
+        if list_config is None or list_id in calendars:
+            return
+        calendar = calendars[list_id] = ChoreBotCalendar(
+            store, list_id, list_config["name"]
+        )
+        async_add_entities([calendar])
+
+    async def async_remove_list(list_id: str) -> None:
+        """Remove the calendar (and its registry entry) of a deleted list."""
+        calendar = calendars.pop(list_id, None)
+        if calendar is None:
+            return
+        entity_id = calendar.entity_id
+        await calendar.async_remove(force_remove=True)
+        registry = er.async_get(hass)
+        if entity_id and registry.async_get(entity_id):
+            registry.async_remove(entity_id)
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_LIST_ADDED, async_add_list)
+    )
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_LIST_REMOVED, async_remove_list)
+    )
+
+
+class ListCalendarIndex:
+    """Interval index of a list's dated tasks plus recurrence expansions.
+
+    Concrete tasks are kept sorted by start time. Every event is at most
+    MAX_EVENT_DURATION long, so the events overlapping [start, end) all
+    start in [start - MAX_EVENT_DURATION, end): two bisections and a scan of
+    the matches answer a range query in O(log n + k).
+
+    Future occurrences of recurring templates (after their latest instance)
+    are expanded from parsed rrules that are cached per template, rrule and
+    anchor, so an unchanged template is never re-parsed.
+
+    The index is rebuilt lazily when the list's revision changes; parsed
+    due dates are cached per task, so a rebuild only parses changed tasks.
+    """
+
+    def __init__(self, store: ChoreBotStore, list_id: str) -> None:
+        """Initialize the index."""
+        self._store = store
+        self._list_id = list_id
+        self._revision = -1
+        self._starts: list[datetime] = []
+        self._tasks: list[Task] = []
+        # (template, rrule, anchor): occurrences after the anchor are virtual
+        self._recurrences: list[tuple[Task, Any, datetime]] = []
+        # uid -> (due string, parsed due)
+        self._due_cache: dict[str, tuple[str, datetime]] = {}
+        # (template uid, rrule, anchor due) -> parsed rrule
+        self._rrule_cache: dict[tuple[str, str, str], Any] = {}
+
+    def _parse_due(self, task: Task) -> datetime | None:
+        """Return the task's due date as aware UTC datetime (cached)."""
+        assert task.due is not None
+        cached = self._due_cache.get(task.uid)
+        if cached and cached[0] == task.due:
+            return cached[1]
+        try:
+            due_dt = datetime.fromisoformat(task.due.replace("Z", "+00:00"))
+        except ValueError:
+            _LOGGER.warning("Ignoring unparseable due date: %s", task.due)
+            return None
+        if due_dt.tzinfo is None:
+            due_dt = due_dt.replace(tzinfo=UTC)
+        due_dt = due_dt.astimezone(UTC)
+        self._due_cache[task.uid] = (task.due, due_dt)
+        return due_dt
+
+    def _refresh(self) -> None:
+        """Rebuild the index if the list changed since the last build."""
+        snapshot = self._store.get_list_snapshot(self._list_id)
+        if snapshot.revision == self._revision:
+            return
+
+        dated: list[tuple[datetime, Task]] = []
+        latest_instances: dict[str, Task] = {}
+        for task in snapshot.tasks.values():
+            if not task.due or (due_dt := self._parse_due(task)) is None:
+                continue
+            dated.append((due_dt, task))
+            if task.parent_uid:
+                latest = latest_instances.get(task.parent_uid)
+                if latest is None or task.occurrence_index > latest.occurrence_index:
+                    latest_instances[task.parent_uid] = task
+        dated.sort(key=lambda item: item[0])
+        self._starts = [due_dt for due_dt, _ in dated]
+        self._tasks = [task for _, task in dated]
+
+        recurrences = []
+        rrule_cache = {}
+        for template in snapshot.templates.values():
+            latest = latest_instances.get(template.uid)
+            if not template.rrule or template.is_dateless_recurring or latest is None:
+                continue
+            assert latest.due is not None
+            anchor = self._due_cache[latest.uid][1]
+            key = (template.uid, template.rrule, latest.due)
+            rule = self._rrule_cache.get(key)
+            if rule is None:
+                try:
+                    rule = rrulestr(template.rrule, dtstart=anchor, cache=True)
+                except (ValueError, TypeError) as err:
+                    _LOGGER.warning(
+                        "Ignoring invalid rrule %s of %s: %s",
+                        template.rrule,
+                        template.summary,
+                        err,
+                    )
+                    continue
+            rrule_cache[key] = rule
+            recurrences.append((template, rule, anchor))
+
+        self._recurrences = recurrences
+        self._rrule_cache = rrule_cache
+        visible = {task.uid for task in self._tasks}
+        self._due_cache = {
+            uid: cached for uid, cached in self._due_cache.items() if uid in visible
+        }
+        self._revision = snapshot.revision
+
+    def events(self, start: datetime, end: datetime) -> list[CalendarEvent]:
+        """Return the events overlapping [start, end), ordered by start."""
+        self._refresh()
+        start = start.astimezone(UTC)
+        end = end.astimezone(UTC)
+
+        events = []
+        low = bisect_left(self._starts, start - MAX_EVENT_DURATION)
+        high = bisect_left(self._starts, end)
+        for task, due_dt in zip(self._tasks[low:high], self._starts[low:high]):
+            if due_dt + self._duration(task) > start:
+                events.append(self._to_event(task, task.uid, due_dt))
+
+        for template, rule, anchor in self._recurrences:
+            window_start = max(start - MAX_EVENT_DURATION, anchor)
+            for occurrence in rule.between(window_start, end):
+                if occurrence <= anchor:
+                    continue
+                if occurrence + self._duration(template) > start:
+                    events.append(
+                        self._to_event(
+                            template,
+                            f"{template.uid}_{occurrence.isoformat()}",
+                            occurrence,
+                        )
+                    )
+
+        events.sort(key=lambda event: event.start_datetime_local)
+        return events
+
+    def next_event(self, now: datetime) -> CalendarEvent | None:
+        """Return the current or next upcoming event."""
+        self._refresh()
+        now = now.astimezone(UTC)
+
+        candidates: list[tuple[datetime, CalendarEvent]] = []
+        index = bisect_left(self._starts, now - MAX_EVENT_DURATION)
+        for task, due_dt in zip(self._tasks[index:], self._starts[index:]):
+            if due_dt + self._duration(task) > now:
+                candidates.append((due_dt, self._to_event(task, task.uid, due_dt)))
+                break
+
+        for template, rule, anchor in self._recurrences:
+            occurrence = rule.after(max(now - MAX_EVENT_DURATION, anchor))
+            while occurrence and occurrence + self._duration(template) <= now:
+                occurrence = rule.after(occurrence)
+            if occurrence:
+                candidates.append(
+                    (
+                        occurrence,
+                        self._to_event(
+                            template,
+                            f"{template.uid}_{occurrence.isoformat()}",
+                            occurrence,
+                        ),
+                    )
+                )
+
+        if not candidates:
+            return None
+        return min(candidates, key=lambda candidate: candidate[0])[1]
+
+    @staticmethod
+    def _duration(task: Task) -> timedelta:
+        """Return how long a task's event lasts."""
+        return MAX_EVENT_DURATION if task.is_all_day else TIMED_EVENT_DURATION
+
+    @staticmethod
+    def _to_event(task: Task, uid: str, start: datetime) -> CalendarEvent:
+        """Build a calendar event for a task (or recurrence) at ``start``."""
+        event_start: date | datetime = start
+        event_end: date | datetime = start + TIMED_EVENT_DURATION
+        if task.is_all_day:
+            event_start = start.date()
+            event_end = event_start + timedelta(days=1)
+        return CalendarEvent(
+            start=event_start,
+            end=event_end,
+            summary=task.summary,
+            description=task.description,
+            uid=uid,
+        )
+
+
+class ChoreBotCalendar(CalendarEntity):
+    """Calendar of a ChoreBot list's due dates and upcoming recurrences."""
+
+    _attr_has_entity_name = False
+
+    def __init__(self, store: ChoreBotStore, list_id: str, list_name: str) -> None:
+        """Initialize the calendar entity."""
+        self._store = store
+        self._list_id = list_id
+        # Same naming as the todo entity: calendar.chorebot_<list_name>
+        self._attr_name = f"ChoreBot {list_name}"
+        self._attr_unique_id = f"{DOMAIN}_{list_id}_calendar"
+        self._index = ListCalendarIndex(store, list_id)
+        self._state_write_handle: asyncio.Handle | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Update state when the list changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._store.async_add_list_listener(self._list_id, self._list_changed)
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending state write when the entity is removed."""
+        if self._state_write_handle is not None:
+            self._state_write_handle.cancel()
+            self._state_write_handle = None
+
+    @callback
+    def _list_changed(
+        self,
+        list_id: str,
+        revision: int,
+        changed_uids: set[str],
+        structure_changed: bool,
+    ) -> None:
+        """Refresh the current event after a change (once per loop tick)."""
+        if self._state_write_handle is None:
+            self._state_write_handle = self.hass.loop.call_soon(
+                self._async_write_scheduled_state
+            )
+
+    @callback
+    def _async_write_scheduled_state(self) -> None:
+        """Write the state scheduled by _list_changed."""
+        self._state_write_handle = None
+        self.async_write_ha_state()
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current or next upcoming event."""
+        return self._index.next_event(datetime.now(UTC))
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the events in a date range."""
+        return self._index.events(start_date, end_date)
@@ -0,0 +1,193 @@
+"""Atomic completion commits across ChoreBotStore and PeopleStore."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Mapping
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .journal import ListJournal
+from .people import PeopleStore
+from .store import ChoreBotStore
+from .task import Task
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CompletionCommitter:
+    """Commits everything a task completion changes as one unit.
+
+    A completion touches the completed instance, its template (streak), the
+    next instance and the points ledger. Instead of saving each of them as
+    it is changed, the completion stages all changes and commits once:
+
+        1. Under the list lock, every staged task is checked against the
+           version it was staged from (its ``modified``); the instances
+           being completed must still be ``needs_action``. If anything
+           changed meanwhile (an edit, a sync pull, another completion),
+           the commit is rejected and nothing is written.
+        2. The staged changes are appended to an intent journal
+           (``.storage/chorebot_completion.journal``) and fsynced.
+        3. Points are applied (one save of people + ledger), then the tasks
+           are written (one list save), still under the list lock.
+        4. The intent is removed.
+
+    On startup a leftover intent is rolled forward: staged transactions
+    whose points are not yet in the balances are applied, and staged tasks
+    still at the version they were staged from are written. Replays are
+    idempotent: transaction IDs are assigned when staging, and the saved
+    balances record which IDs they include (see
+    PeopleStore.async_apply_transactions).
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, store: ChoreBotStore, people_store: PeopleStore
+    ) -> None:
+        """Initialize the committer."""
+        self._store = store
+        self._people_store = people_store
+        self._journal = ListJournal(hass, f"{DOMAIN}_completion")
+        # One completion at a time, so an intent is never removed while
+        # another completion's intent is still pending
+        self._lock = asyncio.Lock()
+
+    async def async_commit(
+        self,
+        list_id: str,
+        tasks: list[Task],
+        transactions: list[dict[str, Any]],
+        versions: Mapping[str, str | None],
+        completing: Iterable[str] = (),
+    ) -> bool:
+        """Commit a staged completion.
+
+        Args:
+            list_id: List the tasks belong to
+            tasks: Final state of every changed or created task/template
+            transactions: Staged points transactions and stats changes
+                (PeopleStore.stage_transaction / stage_completion_stats)
+            versions: UID -> ``modified`` of the committed version each task
+                was staged from (None for tasks the commit creates)
+            completing: UIDs of the instances being completed
+
+        Returns:
+            False if a task changed since it was staged (nothing committed)
+        """
+        intent = {
+            "list_id": list_id,
+            "tasks": [task.to_dict() for task in tasks],
+            "transactions": transactions,
+            "versions": dict(versions),
+        }
+        async with self._lock:
+            if self._store.get_list(list_id) is None:
+                _LOGGER.warning("Skipping completion in deleted list %s", list_id)
+                return False
+
+            async with self._store.async_edit_tasks(list_id, versions) as current:
+                if stale := _stale_uids(current, tasks, versions):
+                    _LOGGER.warning(
+                        "Not committing task changes in list %s: %s changed "
+                        "since they were staged",
+                        list_id,
+                        ", ".join(stale),
+                    )
+                    current.clear()
+                    return False
+                if done := [
+                    uid for uid in completing if current[uid].status != "needs_action"
+                ]:
+                    _LOGGER.warning(
+                        "Not committing completion in list %s: %s already completed",
+                        list_id,
+                        ", ".join(done),
+                    )
+                    current.clear()
+                    return False
+
+                await self._journal.async_append([intent])
+                if transactions:
+                    await self._people_store.async_apply_transactions(transactions)
+                current.update({task.uid: task for task in tasks})
+
+            await self._journal.async_truncate()
+            return True
+
+    async def async_recover(self) -> int:
+        """Roll forward completions interrupted by a crash or restart.
+
+        Returns:
+            Number of completions replayed
+        """
+        async with self._lock:
+            intents, exists = await self._journal.async_read()
+            if not exists:
+                return 0
+
+            for intent in intents:
+                list_id = intent["list_id"]
+                tasks = [Task.from_dict(data) for data in intent.get("tasks", [])]
+                _LOGGER.warning(
+                    "Replaying interrupted task completion in list %s (%d tasks, %d transactions)",
+                    list_id,
+                    len(tasks),
+                    len(intent.get("transactions", [])),
+                )
+                await self._async_replay(
+                    list_id,
+                    tasks,
+                    intent.get("transactions", []),
+                    intent.get("versions"),
+                )
+
+            await self._journal.async_truncate()
+            return len(intents)
+
+    async def _async_replay(
+        self,
+        list_id: str,
+        tasks: list[Task],
+        transactions: list[dict[str, Any]],
+        versions: dict[str, str | None] | None,
+    ) -> None:
+        """Roll an intent forward (idempotent).
+
+        Tasks already written, or changed since, are left as they are.
+        """
+        if transactions:
+            await self._people_store.async_apply_transactions(
+                transactions, skip_existing=True
+            )
+
+        if self._store.get_list(list_id) is None:
+            _LOGGER.warning(
+                "Skipping task changes of completion in deleted list %s", list_id
+            )
+            return
+        if versions is None:
+            # Intent journaled before versions were recorded
+            await self._store.async_put_tasks(list_id, tasks)
+            return
+
+        async with self._store.async_edit_tasks(list_id, versions) as current:
+            stale = set(_stale_uids(current, tasks, versions))
+            current.clear()
+            current.update({task.uid: task for task in tasks if task.uid not in stale})
+
+
+def _stale_uids(
+    current: Mapping[str, Task],
+    tasks: Iterable[Task],
+    versions: Mapping[str, str | None],
+) -> list[str]:
+    """Return the UIDs of staged tasks whose committed version moved on."""
+    stale = []
+    for task in tasks:
+        committed = current.get(task.uid)
+        if (committed.modified if committed else None) != versions.get(task.uid):
+            stale.append(task.uid)
+    return stale
@@ -154,6 +154,9 @@ class CompletionContextBuilder:
         USER NOTE: Treat ALL timed tasks as all-day for streak purposes.
         Use date-only comparison regardless of is_all_day flag.
 
+        The due day ends at local midnight (Task.overdue_at), the same moment
+        the task turns overdue and its streak is reset.
+
         Args:
             instance: Task instance being checked
 
@@ -163,15 +166,10 @@ class CompletionContextBuilder:
         if not instance.due:
             return True  # No due date = always on-time
 
-        try:
-            due_dt = datetime.fromisoformat(instance.due.replace("Z", "+00:00"))
-            now = datetime.now(UTC)
-
-            # Always compare dates only (user requirement)
-            return now.date() <= due_dt.date()
-        except (ValueError, AttributeError) as e:
-            _LOGGER.error("Failed to parse due date %s: %s", instance.due, e)
+        if (overdue_at := instance.overdue_at()) is None:
+            _LOGGER.error("Failed to parse due date %s", instance.due)
             return True  # Benefit of doubt
+        return datetime.now(UTC) < overdue_at
 
     def _calculate_next_due_date(self, instance: Task, template: Task) -> str | None:
         """Calculate next due date for recurring instance.
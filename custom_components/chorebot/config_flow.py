@@ -17,13 +17,28 @@ from homeassistant.helpers import config_entry_oauth2_flow, selector
 
 from .const import (
     BACKEND_TICKTICK,
-    CONF_POINTS_DISPLAY,
+    CONF_DELTA_SYNC,
+    CONF_JOURNAL_STORAGE,
     CONF_POINTS_ICON,
     CONF_POINTS_TEXT,
+    CONF_SLIM_ATTRIBUTES,
+    CONF_SQLITE_STORAGE,
     CONF_SYNC_BACKEND,
     CONF_SYNC_ENABLED,
+    CONF_SYNC_MAX_INTERVAL_MINUTES,
+    CONF_SYNC_MIN_INTERVAL_MINUTES,
+    CONF_SYNC_TRACE,
+    CONF_TICKTICK_PASSWORD,
+    CONF_TICKTICK_USERNAME,
+    DEFAULT_DELTA_SYNC,
+    DEFAULT_JOURNAL_STORAGE,
     DEFAULT_POINTS_ICON,
     DEFAULT_POINTS_TEXT,
+    DEFAULT_SLIM_ATTRIBUTES,
+    DEFAULT_SQLITE_STORAGE,
+    DEFAULT_SYNC_MAX_INTERVAL_MINUTES,
+    DEFAULT_SYNC_MIN_INTERVAL_MINUTES,
+    DEFAULT_SYNC_TRACE,
     DOMAIN,
 )
 
@@ -120,6 +135,7 @@ class ChoreBotOptionsFlowHandler(OptionsFlow):
         current_config = store.get_points_display()
 
         errors: dict[str, str] = {}
+        sync_enabled = self.config_entry.data.get(CONF_SYNC_ENABLED, False)
 
         if user_input is not None:
             # Validate inputs
@@ -138,19 +154,64 @@ class ChoreBotOptionsFlowHandler(OptionsFlow):
             if len(icon) > 100:
                 errors[CONF_POINTS_ICON] = "icon_too_long"
 
+            # Validate adaptive sync bounds
+            min_interval = user_input.get(
+                CONF_SYNC_MIN_INTERVAL_MINUTES, DEFAULT_SYNC_MIN_INTERVAL_MINUTES
+            )
+            max_interval = user_input.get(
+                CONF_SYNC_MAX_INTERVAL_MINUTES, DEFAULT_SYNC_MAX_INTERVAL_MINUTES
+            )
+            if min_interval > max_interval:
+                errors[CONF_SYNC_MAX_INTERVAL_MINUTES] = "interval_range"
+
+            # Delta sync uses TickTick's web API, which needs a password login
+            username = user_input.get(CONF_TICKTICK_USERNAME, "").strip()
+            password = user_input.get(CONF_TICKTICK_PASSWORD, "")
+            delta_sync = user_input.get(CONF_DELTA_SYNC, DEFAULT_DELTA_SYNC)
+            if delta_sync and not (username and password):
+                errors[CONF_DELTA_SYNC] = "delta_sync_credentials"
+
             if not errors:
                 # Update config in store
-                async with store._lock:
-                    store._config_data[CONF_POINTS_DISPLAY] = {
-                        CONF_POINTS_TEXT: text,
-                        CONF_POINTS_ICON: icon,
-                    }
-                    await store.async_save_config()
+                await store.async_set_points_display(text, icon)
+
+                # Entity and sync options live on the config entry
+                options = dict(self.config_entry.options)
+                options[CONF_SLIM_ATTRIBUTES] = user_input.get(
+                    CONF_SLIM_ATTRIBUTES, DEFAULT_SLIM_ATTRIBUTES
+                )
+                options[CONF_JOURNAL_STORAGE] = user_input.get(
+                    CONF_JOURNAL_STORAGE, DEFAULT_JOURNAL_STORAGE
+                )
+                options[CONF_SQLITE_STORAGE] = user_input.get(
+                    CONF_SQLITE_STORAGE, DEFAULT_SQLITE_STORAGE
+                )
+                if sync_enabled:
+                    options[CONF_DELTA_SYNC] = delta_sync
+                    options[CONF_TICKTICK_USERNAME] = username
+                    options[CONF_TICKTICK_PASSWORD] = password
+                    options[CONF_SYNC_TRACE] = user_input.get(
+                        CONF_SYNC_TRACE, DEFAULT_SYNC_TRACE
+                    )
+                    options[CONF_SYNC_MIN_INTERVAL_MINUTES] = int(min_interval)
+                    options[CONF_SYNC_MAX_INTERVAL_MINUTES] = int(max_interval)
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry, options=options
+                )
+
+                # Saving with Delta Sync on re-enables it after TickTick
+                # rejected it (see TickTickBackend._async_pull_delta)
+                sync_state = store.get_backend_sync_state(BACKEND_TICKTICK)
+                if sync_enabled and delta_sync and "delta_disabled" in sync_state:
+                    await store.async_set_backend_sync_state(
+                        BACKEND_TICKTICK,
+                        {k: v for k, v in sync_state.items() if k != "delta_disabled"},
+                    )
 
                 # Reload integration to apply changes
                 await self.hass.config_entries.async_reload(self.config_entry.entry_id)
 
-                return self.async_create_entry(title="", data={})
+                return self.async_create_entry(title="", data=options)
 
         # Show form with current values
         # Use suggested_value instead of default to allow clearing fields
@@ -161,21 +222,114 @@ class ChoreBotOptionsFlowHandler(OptionsFlow):
         if not text_suggested and not icon_suggested:
             text_suggested = DEFAULT_POINTS_TEXT
 
+        schema: dict[Any, Any] = {
+            vol.Optional(
+                CONF_POINTS_TEXT,
+                description={"suggested_value": text_suggested},
+            ): selector.TextSelector(
+                selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
+            ),
+            vol.Optional(
+                CONF_POINTS_ICON,
+                description={"suggested_value": icon_suggested},
+            ): selector.IconSelector(),
+            vol.Optional(
+                CONF_SLIM_ATTRIBUTES,
+                default=self.config_entry.options.get(
+                    CONF_SLIM_ATTRIBUTES, DEFAULT_SLIM_ATTRIBUTES
+                ),
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_JOURNAL_STORAGE,
+                default=self.config_entry.options.get(
+                    CONF_JOURNAL_STORAGE, DEFAULT_JOURNAL_STORAGE
+                ),
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_SQLITE_STORAGE,
+                default=self.config_entry.options.get(
+                    CONF_SQLITE_STORAGE, DEFAULT_SQLITE_STORAGE
+                ),
+            ): selector.BooleanSelector(),
+        }
+
+        # Sync tuning options only apply when a sync backend is configured
+        if sync_enabled:
+            schema[
+                vol.Optional(
+                    CONF_DELTA_SYNC,
+                    default=self.config_entry.options.get(
+                        CONF_DELTA_SYNC, DEFAULT_DELTA_SYNC
+                    ),
+                )
+            ] = selector.BooleanSelector()
+            schema[
+                vol.Optional(
+                    CONF_TICKTICK_USERNAME,
+                    description={
+                        "suggested_value": self.config_entry.options.get(
+                            CONF_TICKTICK_USERNAME, ""
+                        )
+                    },
+                )
+            ] = selector.TextSelector(
+                selector.TextSelectorConfig(type=selector.TextSelectorType.EMAIL)
+            )
+            schema[
+                vol.Optional(
+                    CONF_TICKTICK_PASSWORD,
+                    description={
+                        "suggested_value": self.config_entry.options.get(
+                            CONF_TICKTICK_PASSWORD, ""
+                        )
+                    },
+                )
+            ] = selector.TextSelector(
+                selector.TextSelectorConfig(type=selector.TextSelectorType.PASSWORD)
+            )
+            schema[
+                vol.Optional(
+                    CONF_SYNC_TRACE,
+                    default=self.config_entry.options.get(
+                        CONF_SYNC_TRACE, DEFAULT_SYNC_TRACE
+                    ),
+                )
+            ] = selector.BooleanSelector()
+            schema[
+                vol.Optional(
+                    CONF_SYNC_MIN_INTERVAL_MINUTES,
+                    default=self.config_entry.options.get(
+                        CONF_SYNC_MIN_INTERVAL_MINUTES,
+                        DEFAULT_SYNC_MIN_INTERVAL_MINUTES,
+                    ),
+                )
+            ] = selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1,
+                    max=1440,
+                    unit_of_measurement="min",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            )
+            schema[
+                vol.Optional(
+                    CONF_SYNC_MAX_INTERVAL_MINUTES,
+                    default=self.config_entry.options.get(
+                        CONF_SYNC_MAX_INTERVAL_MINUTES,
+                        DEFAULT_SYNC_MAX_INTERVAL_MINUTES,
+                    ),
+                )
+            ] = selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1,
+                    max=1440,
+                    unit_of_measurement="min",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            )
+
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_POINTS_TEXT,
-                        description={"suggested_value": text_suggested},
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
-                    ),
-                    vol.Optional(
-                        CONF_POINTS_ICON,
-                        description={"suggested_value": icon_suggested},
-                    ): selector.IconSelector(),
-                }
-            ),
+            data_schema=vol.Schema(schema),
             errors=errors,
         )
@@ -6,6 +6,7 @@ DOMAIN = "chorebot"
 OAUTH2_AUTHORIZE = "https://ticktick.com/oauth/authorize"
 OAUTH2_TOKEN = "https://ticktick.com/oauth/token"
 TICKTICK_API_BASE = "https://api.ticktick.com/open/v1"
+TICKTICK_API_V2_BASE = "https://api.ticktick.com/api/v2"  # Used for batch/check delta sync
 
 # Storage keys
 STORAGE_VERSION = 1
@@ -37,32 +38,61 @@ FIELD_STREAK_AT_COMPLETION = "streak_at_completion"
 CONF_SYNC_ENABLED = "sync_enabled"
 CONF_SYNC_BACKEND = "sync_backend"  # "ticktick", "todoist", etc.
 CONF_SYNC_INTERVAL_MINUTES = "sync_interval_minutes"
+CONF_SYNC_MIN_INTERVAL_MINUTES = "sync_min_interval_minutes"  # Adaptive polling floor
+CONF_SYNC_MAX_INTERVAL_MINUTES = "sync_max_interval_minutes"  # Adaptive polling ceiling
+CONF_DELTA_SYNC = "delta_sync"  # Use TickTick batch/check checkpoints instead of full fetch
+CONF_TICKTICK_USERNAME = "ticktick_username"  # Web API sign-in for delta sync
+CONF_TICKTICK_PASSWORD = "ticktick_password"
+CONF_SYNC_TRACE = "sync_trace"  # Capture raw sync payloads for diagnostics download
+CONF_SLIM_ATTRIBUTES = "slim_attributes"  # Keep heavy entity attributes out of the recorder
+CONF_JOURNAL_STORAGE = "journal_storage"  # Append task changes to a journal instead of rewriting lists
+CONF_SQLITE_STORAGE = "sqlite_storage"  # Keep tasks, archives and points in SQLite instead of JSON
 CONF_POINTS_DISPLAY = "points_display"
 CONF_POINTS_TEXT = "text"
 CONF_POINTS_ICON = "icon"
 
 # Default values
 DEFAULT_SYNC_INTERVAL_MINUTES = 15
+DEFAULT_SYNC_MIN_INTERVAL_MINUTES = 2
+DEFAULT_SYNC_MAX_INTERVAL_MINUTES = 60
 DEFAULT_SYNC_BACKEND = "ticktick"
+DEFAULT_DELTA_SYNC = False
+DEFAULT_SYNC_TRACE = False
+DEFAULT_SLIM_ATTRIBUTES = False
+DEFAULT_JOURNAL_STORAGE = False
+DEFAULT_SQLITE_STORAGE = False
 DEFAULT_POINTS_TEXT = "points"
 DEFAULT_POINTS_ICON = ""
 
+# Events fired on the HA bus (data: list_id, uid, summary, due, template_uid)
+EVENT_TASK_DUE = f"{DOMAIN}_task_due"
+EVENT_TASK_OVERDUE = f"{DOMAIN}_task_overdue"
+
+# Dispatcher signals (payload: list_id)
+SIGNAL_LIST_ADDED = f"{DOMAIN}_list_added"
+SIGNAL_LIST_REMOVED = f"{DOMAIN}_list_removed"
+
 # Sync backends
 BACKEND_TICKTICK = "ticktick"
 # Future: BACKEND_TODOIST = "todoist", etc.
 
 # Services
 SERVICE_ADD_TASK = "add_task"
+SERVICE_ADD_TASKS = "add_tasks"
 SERVICE_ADJUST_POINTS = "adjust_points"
+SERVICE_ADJUST_POINTS_BATCH = "adjust_points_batch"
+SERVICE_COMPLETE_TASKS = "complete_tasks"
 SERVICE_CREATE_LIST = "create_list"
 SERVICE_DELETE_REWARD = "delete_reward"
 SERVICE_DELETE_TASK = "delete_task"
 SERVICE_MANAGE_PERSON = "manage_person"
 SERVICE_MANAGE_REWARD = "manage_reward"
 SERVICE_MANAGE_SECTION = "manage_section"
+SERVICE_REBUILD_STREAKS = "rebuild_streaks"
 SERVICE_REDEEM_REWARD = "redeem_reward"
 SERVICE_RUN_MAINTENANCE = "run_maintenance"
 SERVICE_SYNC = "sync"  # Generic sync service (was sync_ticktick)
 SERVICE_SYNC_PEOPLE = "sync_people"
 SERVICE_UPDATE_LIST = "update_list"
 SERVICE_UPDATE_TASK = "update_task"
+SERVICE_UPDATE_TASKS = "update_tasks"
@@ -0,0 +1,744 @@
+"""SQLite storage engine for ChoreBot.
+
+An alternative to the ``.storage`` JSON files for tasks, archives and the
+points ledger. ``ChoreBotStore`` and ``PeopleStore`` keep their in-memory
+caches and public interfaces; only persistence changes:
+
+- Task changes are written as row upserts/deletes (the same change records
+  the journal uses, see journal.py), so a write costs O(changed rows).
+- Archiving flags rows instead of rewriting the list and archive files.
+- Transactions and redemptions are appended, never rewritten.
+- Indexes on list_id, parent_uid, status, due, section_id and person_id back
+  the query methods.
+
+The database lives in ``.storage/chorebot.db`` and runs in WAL mode. All
+calls go through one connection, serialized by a lock and run in the
+executor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import DOMAIN, FIELD_DELETED_AT, FIELD_PARENT_UID, FIELD_SECTION_ID
+from .journal import OP_METADATA, OP_PUT, OP_REMOVE, OP_SECTIONS
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+DATABASE_FILE = f"{DOMAIN}.db"
+SCHEMA_VERSION = 1
+
+# Meta keys recording the import from the JSON files, and a fingerprint of
+# the files each import read (see async_storage_fingerprint)
+META_TASKS_MIGRATED = "tasks_migrated_at"
+META_PEOPLE_MIGRATED = "people_migrated_at"
+META_TASKS_SOURCE = "tasks_source"
+META_PEOPLE_SOURCE = "people_source"
+# IDs of the staged transactions the saved balances include (see PeopleStore)
+META_APPLIED_TRANSACTIONS = "applied_transactions"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lists (
+    list_id TEXT PRIMARY KEY,
+    sections TEXT NOT NULL DEFAULT '[]',
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    list_id TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    is_template INTEGER NOT NULL,
+    parent_uid TEXT,
+    status TEXT,
+    due TEXT,
+    section_id TEXT,
+    modified TEXT,
+    deleted_at TEXT,
+    archived INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    PRIMARY KEY (list_id, uid)
+);
+CREATE INDEX IF NOT EXISTS tasks_parent ON tasks (list_id, parent_uid);
+CREATE INDEX IF NOT EXISTS tasks_status_due ON tasks (list_id, status, due);
+CREATE INDEX IF NOT EXISTS tasks_section ON tasks (list_id, section_id);
+CREATE TABLE IF NOT EXISTS people (
+    person_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rewards (
+    reward_id TEXT PRIMARY KEY,
+    person_id TEXT,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rewards_person ON rewards (person_id);
+CREATE TABLE IF NOT EXISTS transactions (
+    txn_id TEXT PRIMARY KEY,
+    person_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_person
+    ON transactions (person_id, timestamp);
+CREATE TABLE IF NOT EXISTS redemptions (
+    redemption_id TEXT PRIMARY KEY,
+    person_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS redemptions_person
+    ON redemptions (person_id, timestamp);
+"""
+
+_UPSERT_TASK = """
+INSERT INTO tasks (
+    list_id, uid, is_template, parent_uid, status, due, section_id,
+    modified, deleted_at, archived, data
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
+ON CONFLICT (list_id, uid) DO UPDATE SET
+    is_template = excluded.is_template,
+    parent_uid = excluded.parent_uid,
+    status = excluded.status,
+    due = excluded.due,
+    section_id = excluded.section_id,
+    modified = excluded.modified,
+    deleted_at = excluded.deleted_at,
+    archived = 0,
+    data = excluded.data
+"""
+
+
+def _dumps(data: Any) -> str:
+    """Serialize a row payload compactly."""
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _task_row(list_id: str, is_template: bool, task: dict[str, Any]) -> tuple:
+    """Build the parameters of a task upsert (indexed columns + payload)."""
+    return (
+        list_id,
+        task["uid"],
+        int(is_template),
+        task.get(FIELD_PARENT_UID),
+        task.get("status"),
+        task.get("due"),
+        task.get(FIELD_SECTION_ID),
+        task.get("modified"),
+        task.get(FIELD_DELETED_AT),
+        _dumps(task),
+    )
+
+
+class ChoreBotDatabase:
+    """SQLite persistence for ChoreBot tasks, archives and points."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the database (call async_open before use)."""
+        self.hass = hass
+        self.path = hass.config.path(STORAGE_DIR, DATABASE_FILE)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = asyncio.Lock()
+
+    async def _async_run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a database function in the executor, one at a time."""
+        async with self._lock:
+            return await self.hass.async_add_executor_job(func, *args)
+
+    async def async_open(self) -> None:
+        """Open the database, enable WAL mode and create the schema."""
+        await self._async_run(self._open)
+        _LOGGER.info("Opened ChoreBot database: %s", self.path)
+
+    def _open(self) -> None:
+        """Open the connection (runs in the executor)."""
+        # Autocommit mode; writes use explicit transactions
+        conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        conn.execute(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+            (str(SCHEMA_VERSION),),
+        )
+        self._conn = conn
+
+    async def async_close(self) -> None:
+        """Close the database."""
+        await self._async_run(self._close)
+
+    def _close(self) -> None:
+        """Close the connection (runs in the executor)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """Return the open connection."""
+        if self._conn is None:
+            raise RuntimeError("ChoreBot database is not open")
+        return self._conn
+
+    def _transaction(self, func: Callable[[sqlite3.Connection], _T]) -> _T:
+        """Run func inside a write transaction (runs in the executor)."""
+        conn = self._db
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = func(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return result
+
+    # ==================== Meta ====================
+
+    async def async_get_meta(self, key: str) -> str | None:
+        """Get a meta value (e.g., a migration marker)."""
+        return await self._async_run(self._get_meta, key)
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    async def async_set_meta(self, key: str, value: str) -> None:
+        """Set a meta value."""
+
+        def set_meta(conn: sqlite3.Connection) -> None:
+            self._set_meta(conn, key, value)
+
+        await self._async_run(self._transaction, set_meta)
+
+    @staticmethod
+    def _set_meta(
+        conn: sqlite3.Connection, key: str, value: str | None = None
+    ) -> None:
+        """Record a meta value (a timestamp marker by default) in a transaction."""
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, value or datetime.now(UTC).isoformat().replace("+00:00", "Z")),
+        )
+
+    async def async_storage_fingerprint(self, names: Iterable[str]) -> str:
+        """Fingerprint the JSON storage files an import reads.
+
+        Covers every file in the storage directory whose name starts with one
+        of ``names`` (journals and archive segments included), by name, size
+        and modification time. Only JSON mode writes those files, so a
+        different fingerprint means JSON mode ran since the import.
+        """
+        prefixes = tuple(names)
+
+        def fingerprint() -> str:
+            digest = hashlib.sha256()
+            try:
+                entries = sorted(
+                    (entry.name, entry.stat())
+                    for entry in os.scandir(os.path.dirname(self.path))
+                    if entry.name.startswith(prefixes) and entry.is_file()
+                )
+            except FileNotFoundError:
+                entries = []
+            for name, stat in entries:
+                digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+            return digest.hexdigest()
+
+        return await self.hass.async_add_executor_job(fingerprint)
+
+    # ==================== Tasks ====================
+
+    async def async_load_list(self, list_id: str) -> dict[str, Any] | None:
+        """Load a list in the JSON document shape (None if it has no data).
+
+        Soft-deleted and archived rows are not returned.
+        """
+        return await self._async_run(self._load_list, list_id)
+
+    def _load_list(self, list_id: str) -> dict[str, Any] | None:
+        conn = self._db
+        list_row = conn.execute(
+            "SELECT sections, metadata FROM lists WHERE list_id = ?", (list_id,)
+        ).fetchone()
+        rows = conn.execute(
+            "SELECT is_template, data FROM tasks WHERE list_id = ? AND archived = 0"
+            " AND deleted_at IS NULL ORDER BY rowid",
+            (list_id,),
+        ).fetchall()
+        if list_row is None and not rows:
+            return None
+
+        return {
+            "recurring_templates": [
+                json.loads(data) for is_template, data in rows if is_template
+            ],
+            "tasks": [json.loads(data) for is_template, data in rows if not is_template],
+            "sections": json.loads(list_row[0]) if list_row else [],
+            "metadata": json.loads(list_row[1]) if list_row else {},
+        }
+
+    async def async_apply_records(
+        self, list_id: str, records: list[dict[str, Any]]
+    ) -> None:
+        """Apply change records (see journal.py) to a list in one transaction."""
+        # Sections and metadata records reference the live caches, so
+        # serialize them now; PUT records carry their own to_dict() copy and
+        # are serialized in the executor (_task_row)
+        rows = [
+            (record, _dumps(record["data"]) if record["op"] != OP_PUT else None)
+            for record in records
+        ]
+
+        def apply(conn: sqlite3.Connection) -> None:
+            self._apply(conn, list_id, rows)
+
+        await self._async_run(self._transaction, apply)
+
+    @staticmethod
+    def _apply(
+        conn: sqlite3.Connection,
+        list_id: str,
+        rows: list[tuple[dict[str, Any], str | None]],
+    ) -> None:
+        conn.execute("INSERT OR IGNORE INTO lists (list_id) VALUES (?)", (list_id,))
+        for record, payload in rows:
+            op = record["op"]
+            if op == OP_PUT:
+                conn.execute(
+                    _UPSERT_TASK,
+                    _task_row(list_id, record.get("template", False), record["data"]),
+                )
+            elif op == OP_REMOVE:
+                # Mirrors a full JSON write: soft-deleted rows are kept
+                conn.execute(
+                    "DELETE FROM tasks WHERE list_id = ? AND uid = ?"
+                    " AND deleted_at IS NULL AND archived = 0",
+                    (list_id, record["uid"]),
+                )
+            elif op == OP_SECTIONS:
+                conn.execute(
+                    "UPDATE lists SET sections = ? WHERE list_id = ?",
+                    (payload, list_id),
+                )
+            elif op == OP_METADATA:
+                conn.execute(
+                    "UPDATE lists SET metadata = ? WHERE list_id = ?",
+                    (payload, list_id),
+                )
+
+    async def async_delete_list(self, list_id: str) -> None:
+        """Delete a list with all of its tasks and archived instances."""
+
+        def delete(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM tasks WHERE list_id = ?", (list_id,))
+            conn.execute("DELETE FROM lists WHERE list_id = ?", (list_id,))
+
+        await self._async_run(self._transaction, delete)
+
+    async def async_archive_instances(self, list_id: str, cutoff: str) -> list[str]:
+        """Archive recurring instances completed before cutoff.
+
+        Args:
+            list_id: The list ID
+            cutoff: ISO timestamp; instances modified earlier are archived
+
+        Returns:
+            UIDs of the archived instances
+        """
+
+        def archive(conn: sqlite3.Connection) -> list[str]:
+            where = (
+                "list_id = ? AND archived = 0 AND parent_uid IS NOT NULL"
+                " AND status = 'completed' AND modified < ?"
+            )
+            uids = [
+                row[0]
+                for row in conn.execute(
+                    f"SELECT uid FROM tasks WHERE {where}", (list_id, cutoff)
+                )
+            ]
+            if uids:
+                conn.execute(
+                    f"UPDATE tasks SET archived = 1 WHERE {where}", (list_id, cutoff)
+                )
+            return uids
+
+        return await self._async_run(self._transaction, archive)
+
+    async def async_query_tasks(
+        self,
+        list_id: str,
+        *,
+        parent_uid: str | None = None,
+        status: str | None = None,
+        section_id: str | None = None,
+        due_before: str | None = None,
+        archived: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Query task payloads of a list through the indexes.
+
+        Args:
+            list_id: The list ID
+            parent_uid: Only instances of this template
+            status: Only tasks with this status
+            section_id: Only tasks in this section
+            due_before: Only tasks due before this ISO timestamp
+            archived: Query archived instances instead of live tasks
+            limit: Max rows to return (None = all)
+            offset: Rows to skip (for pagination)
+
+        Returns:
+            Task dicts, most recently modified first
+        """
+        clauses = ["list_id = ?", "archived = ?"]
+        params: list[Any] = [list_id, int(archived)]
+        for column, value in (
+            ("parent_uid", parent_uid),
+            ("status", status),
+            ("section_id", section_id),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if due_before is not None:
+            clauses.append("due < ?")
+            params.append(due_before)
+        sql = (
+            f"SELECT data FROM tasks WHERE {' AND '.join(clauses)}"
+            " ORDER BY modified DESC LIMIT ? OFFSET ?"
+        )
+        params.extend([limit if limit is not None else -1, offset])
+
+        def query() -> list[dict[str, Any]]:
+            return [json.loads(row[0]) for row in self._db.execute(sql, params)]
+
+        return await self._async_run(query)
+
+    async def async_query_archive(
+        self,
+        list_id: str,
+        limit: int,
+        *,
+        before: tuple[str, str] | None = None,
+        parent_uid: str | None = None,
+        section_ids: Iterable[str] | None = None,
+        exclude_section_ids: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Read one page of archived instances, newest first.
+
+        Keyset pagination over (modified, uid), so each page reads only its
+        own rows.
+
+        Args:
+            list_id: The list ID
+            limit: Max rows to return
+            before: Only rows whose (modified, uid) is smaller
+            parent_uid: Only instances of this template
+            section_ids: Only instances in these sections
+            exclude_section_ids: Skip instances in these sections
+
+        Returns:
+            Task dicts, newest first
+        """
+        clauses = ["list_id = ?", "archived = 1"]
+        params: list[Any] = [list_id]
+        if before is not None:
+            clauses.append("(modified, uid) < (?, ?)")
+            params.extend(before)
+        if parent_uid is not None:
+            clauses.append("parent_uid = ?")
+            params.append(parent_uid)
+        if section_ids is not None:
+            section_ids = list(section_ids)
+            clauses.append(f"section_id IN ({', '.join('?' * len(section_ids))})")
+            params.extend(section_ids)
+        if exclude_section_ids:
+            exclude_section_ids = list(exclude_section_ids)
+            clauses.append(
+                "(section_id IS NULL OR section_id NOT IN"
+                f" ({', '.join('?' * len(exclude_section_ids))}))"
+            )
+            params.extend(exclude_section_ids)
+        sql = (
+            f"SELECT data FROM tasks WHERE {' AND '.join(clauses)}"
+            " ORDER BY modified DESC, uid DESC LIMIT ?"
+        )
+        params.append(limit)
+
+        def query() -> list[dict[str, Any]]:
+            return [json.loads(row[0]) for row in self._db.execute(sql, params)]
+
+        return await self._async_run(query)
+
+    async def async_import_lists(
+        self,
+        lists: dict[str, tuple[dict[str, Any] | None, list[dict[str, Any]]]],
+        source: str,
+    ) -> None:
+        """Import JSON list documents and archives, replacing all list data.
+
+        Args:
+            lists: list_id -> (list document or None, archived task dicts)
+            source: Fingerprint of the JSON files read (async_storage_fingerprint)
+        """
+
+        def import_lists(conn: sqlite3.Connection) -> None:
+            # The JSON files hold the whole state: drop an earlier import
+            conn.execute("DELETE FROM tasks")
+            conn.execute("DELETE FROM lists")
+            for list_id, (document, archived) in lists.items():
+                document = document or {}
+                conn.execute(
+                    "INSERT OR REPLACE INTO lists (list_id, sections, metadata)"
+                    " VALUES (?, ?, ?)",
+                    (
+                        list_id,
+                        _dumps(document.get("sections", [])),
+                        _dumps(document.get("metadata", {})),
+                    ),
+                )
+                for task in archived:
+                    conn.execute(_UPSERT_TASK, _task_row(list_id, False, task))
+                    conn.execute(
+                        "UPDATE tasks SET archived = 1 WHERE list_id = ? AND uid = ?",
+                        (list_id, task["uid"]),
+                    )
+                for is_template, key in (
+                    (True, "recurring_templates"),
+                    (False, "tasks"),
+                ):
+                    for task in document.get(key, []):
+                        conn.execute(
+                            _UPSERT_TASK, _task_row(list_id, is_template, task)
+                        )
+            self._set_meta(conn, META_TASKS_MIGRATED)
+            self._set_meta(conn, META_TASKS_SOURCE, source)
+
+        await self._async_run(self._transaction, import_lists)
+
+    # ==================== People & Points ====================
+
+    async def async_load_people(self) -> dict[str, Any]:
+        """Load people, rewards, transactions and redemptions.
+
+        Returns:
+            Dict in the PeopleStore data shape
+        """
+        return await self._async_run(self._load_people)
+
+    def _load_people(self) -> dict[str, Any]:
+        conn = self._db
+        marker = self._get_meta(META_APPLIED_TRANSACTIONS)
+        return {
+            "applied_transactions": json.loads(marker) if marker else None,
+            "people": {
+                person_id: json.loads(data)
+                for person_id, data in conn.execute(
+                    "SELECT person_id, data FROM people"
+                )
+            },
+            "rewards": [
+                json.loads(row[0])
+                for row in conn.execute("SELECT data FROM rewards ORDER BY position")
+            ],
+            "transactions": [
+                json.loads(row[0])
+                for row in conn.execute("SELECT data FROM transactions ORDER BY rowid")
+            ],
+            "redemptions": [
+                json.loads(row[0])
+                for row in conn.execute("SELECT data FROM redemptions ORDER BY rowid")
+            ],
+        }
+
+    async def async_save_people(self, people: dict[str, dict[str, Any]]) -> None:
+        """Upsert person records (one row per person)."""
+        rows = [(person_id, _dumps(data)) for person_id, data in people.items()]
+
+        def save(conn: sqlite3.Connection) -> None:
+            conn.executemany(
+                "INSERT OR REPLACE INTO people (person_id, data) VALUES (?, ?)", rows
+            )
+
+        await self._async_run(self._transaction, save)
+
+    async def async_save_points(
+        self,
+        people: dict[str, dict[str, Any]],
+        transactions: list[dict[str, Any]],
+        applied_ids: list[str],
+    ) -> None:
+        """Upsert person records, append ledger rows and record the applied IDs.
+
+        All in one transaction, so balances, ledger and marker always agree.
+        """
+        marker = _dumps(applied_ids)
+        people_rows = [(person_id, _dumps(data)) for person_id, data in people.items()]
+        transaction_rows = [
+            (txn["id"], txn["person_id"], txn["timestamp"], _dumps(txn))
+            for txn in transactions
+        ]
+
+        def save(conn: sqlite3.Connection) -> None:
+            conn.executemany(
+                "INSERT OR REPLACE INTO people (person_id, data) VALUES (?, ?)",
+                people_rows,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO transactions"
+                " (txn_id, person_id, timestamp, data) VALUES (?, ?, ?, ?)",
+                transaction_rows,
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (META_APPLIED_TRANSACTIONS, marker),
+            )
+
+        await self._async_run(self._transaction, save)
+
+    async def async_save_rewards(self, rewards: list[dict[str, Any]]) -> None:
+        """Replace the rewards catalog (small, kept in display order)."""
+        rows = [
+            (reward["id"], reward.get("person_id"), position, _dumps(reward))
+            for position, reward in enumerate(rewards)
+        ]
+
+        def save(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM rewards")
+            conn.executemany(
+                "INSERT INTO rewards (reward_id, person_id, position, data)"
+                " VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+        await self._async_run(self._transaction, save)
+
+    async def async_append_transactions(
+        self, transactions: list[dict[str, Any]]
+    ) -> None:
+        """Append ledger transactions."""
+        rows = [
+            (txn["id"], txn["person_id"], txn["timestamp"], _dumps(txn))
+            for txn in transactions
+        ]
+
+        def append(conn: sqlite3.Connection) -> None:
+            conn.executemany(
+                "INSERT OR IGNORE INTO transactions"
+                " (txn_id, person_id, timestamp, data) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+        await self._async_run(self._transaction, append)
+
+    async def async_append_redemptions(
+        self, redemptions: list[dict[str, Any]]
+    ) -> None:
+        """Append redemption records."""
+        rows = [
+            (item["id"], item["person_id"], item["timestamp"], _dumps(item))
+            for item in redemptions
+        ]
+
+        def append(conn: sqlite3.Connection) -> None:
+            conn.executemany(
+                "INSERT OR IGNORE INTO redemptions"
+                " (redemption_id, person_id, timestamp, data) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+        await self._async_run(self._transaction, append)
+
+    async def async_query_transactions(
+        self,
+        person_id: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Query ledger transactions through the person index, newest first."""
+        sql = "SELECT data FROM transactions"
+        params: list[Any] = []
+        if person_id is not None:
+            sql += " WHERE person_id = ?"
+            params.append(person_id)
+        sql += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
+        params.extend([limit if limit is not None else -1, offset])
+
+        def query() -> list[dict[str, Any]]:
+            return [json.loads(row[0]) for row in self._db.execute(sql, params)]
+
+        return await self._async_run(query)
+
+    async def async_import_people(self, data: dict[str, Any], source: str) -> None:
+        """Import the JSON people, rewards and ledger files, replacing all rows.
+
+        Args:
+            data: People data in the PeopleStore shape
+            source: Fingerprint of the JSON files read (async_storage_fingerprint)
+        """
+
+        def import_people(conn: sqlite3.Connection) -> None:
+            # The JSON files hold the whole state: drop an earlier import
+            for table in ("people", "rewards", "transactions", "redemptions"):
+                conn.execute(f"DELETE FROM {table}")  # noqa: S608
+            conn.executemany(
+                "INSERT OR REPLACE INTO people (person_id, data) VALUES (?, ?)",
+                [
+                    (person_id, _dumps(person))
+                    for person_id, person in data.get("people", {}).items()
+                ],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO rewards (reward_id, person_id, position, data)"
+                " VALUES (?, ?, ?, ?)",
+                [
+                    (reward["id"], reward.get("person_id"), position, _dumps(reward))
+                    for position, reward in enumerate(data.get("rewards", []))
+                ],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO transactions"
+                " (txn_id, person_id, timestamp, data) VALUES (?, ?, ?, ?)",
+                [
+                    (txn["id"], txn["person_id"], txn["timestamp"], _dumps(txn))
+                    for txn in data.get("transactions", [])
+                ],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO redemptions"
+                " (redemption_id, person_id, timestamp, data) VALUES (?, ?, ?, ?)",
+                [
+                    (item["id"], item["person_id"], item["timestamp"], _dumps(item))
+                    for item in data.get("redemptions", [])
+                ],
+            )
+            self._set_meta(
+                conn,
+                META_APPLIED_TRANSACTIONS,
+                _dumps(data.get("applied_transactions", [])),
+            )
+            self._set_meta(conn, META_PEOPLE_MIGRATED)
+            self._set_meta(conn, META_PEOPLE_SOURCE, source)
+
+        await self._async_run(self._transaction, import_people)
@@ -0,0 +1,63 @@
+"""Diagnostics support for ChoreBot."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_TICKTICK_PASSWORD, CONF_TICKTICK_USERNAME, DOMAIN
+
+# OAuth token data and the TickTick login must never end up in a diagnostics
+# download
+TO_REDACT = {
+    "token",
+    "access_token",
+    "refresh_token",
+    CONF_TICKTICK_USERNAME,
+    CONF_TICKTICK_PASSWORD,
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry (includes the sync trace buffer)."""
+    domain_data = hass.data.get(DOMAIN, {})
+    store = domain_data.get("store")
+    sync_coordinator = domain_data.get("sync_coordinator")
+    tracer = domain_data.get("sync_tracer")
+
+    lists = []
+    if store:
+        for list_config in store.get_all_lists():
+            list_id = list_config["id"]
+            lists.append(
+                {
+                    "id": list_id,
+                    "tasks": len(store.get_tasks_for_list(list_id)),
+                    "templates": len(store.get_templates_for_list(list_id)),
+                    "sections": len(store.get_sections_for_list(list_id)),
+                    "sync": list_config.get("sync", {}),
+                }
+            )
+
+    sync: dict[str, Any] | None = None
+    if sync_coordinator:
+        last_sync_time = sync_coordinator.last_sync_time
+        sync = {
+            "last_sync_time": last_sync_time.isoformat() if last_sync_time else None,
+            "is_syncing": sync_coordinator.is_syncing,
+        }
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "lists": lists,
+        "sync": sync,
+        "sync_trace": tracer.as_dict() if tracer else None,
+    }
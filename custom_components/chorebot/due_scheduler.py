@@ -0,0 +1,326 @@
+"""Due-time scheduler for ChoreBot tasks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import heapq
+import itertools
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    EVENT_TASK_DUE,
+    EVENT_TASK_OVERDUE,
+    SIGNAL_LIST_ADDED,
+    SIGNAL_LIST_REMOVED,
+)
+from .store import ChoreBotStore
+from .task import Task
+
+_LOGGER = logging.getLogger(__name__)
+
+# Entry kinds
+KIND_DUE = "due"  # The due time is reached
+KIND_OVERDUE = "overdue"  # The due date is over (can no longer be completed on time)
+
+
+@dataclass(order=True)
+class _Entry:
+    """A scheduled due-time entry (ordered by time, then insertion)."""
+
+    when: datetime
+    seq: int
+    kind: str = field(compare=False)
+    list_id: str = field(compare=False)
+    uid: str = field(compare=False)
+    due: str = field(compare=False)
+    notify: bool = field(compare=False)  # False if already past when scheduled
+
+
+class DueScheduler:
+    """Fires due/overdue events and streak resets at the exact due times.
+
+    Upcoming due and overdue times of all incomplete tasks are kept in one
+    min-heap, and a single timer is armed for the earliest one. Store changes
+    re-schedule only the changed tasks; superseded heap entries are skipped
+    lazily when they reach the top.
+
+    All-day tasks are due at the start of their date in Home Assistant's
+    timezone. A task is overdue once its due day is over in that timezone
+    (Task.overdue_at, the rule on-time completion and ``is_overdue`` use).
+    At that point the streak of its template is reset if it is still the
+    latest incomplete instance, and the list's state is rewritten so its
+    ``overdue_count`` follows.
+
+    Events are only fired for times still in the future when the task was
+    scheduled; times already past (e.g. while Home Assistant was down) only
+    get their streak resets.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: ChoreBotStore) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._store = store
+        self._heap: list[_Entry] = []
+        self._seq = itertools.count()
+        # (list_id, uid, kind) -> time of the current entry (older ones are stale)
+        self._scheduled: dict[tuple[str, str, str], datetime] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._armed_at: datetime | None = None
+        self._unsub_lists: dict[str, CALLBACK_TYPE] = {}
+        self._unsub_signals: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule every list and start listening for changes."""
+        for list_config in self._store.get_all_lists():
+            self._async_track_list(list_config["id"])
+        self._unsub_signals = [
+            async_dispatcher_connect(
+                self.hass, SIGNAL_LIST_ADDED, self._async_track_list
+            ),
+            async_dispatcher_connect(
+                self.hass, SIGNAL_LIST_REMOVED, self._async_untrack_list
+            ),
+        ]
+        self._async_arm()
+        _LOGGER.debug("Due scheduler started with %d entries", len(self._scheduled))
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the timer and all listeners."""
+        for unsub in self._unsub_signals:
+            unsub()
+        self._unsub_signals = []
+        for unsub in self._unsub_lists.values():
+            unsub()
+        self._unsub_lists.clear()
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._heap.clear()
+        self._scheduled.clear()
+
+    @callback
+    def _async_track_list(self, list_id: str) -> None:
+        """Schedule a list's tasks and listen for its changes."""
+        if list_id in self._unsub_lists:
+            return
+        self._unsub_lists[list_id] = self._store.async_add_list_listener(
+            list_id, self._async_list_changed
+        )
+        for task in self._store.get_tasks_for_list(list_id):
+            self._schedule_task(list_id, task)
+        self._async_arm()
+
+    @callback
+    def _async_untrack_list(self, list_id: str) -> None:
+        """Forget a deleted list (its heap entries become stale)."""
+        if unsub := self._unsub_lists.pop(list_id, None):
+            unsub()
+        for key in [key for key in self._scheduled if key[0] == list_id]:
+            del self._scheduled[key]
+
+    @callback
+    def _async_list_changed(
+        self,
+        list_id: str,
+        revision: int,
+        changed_uids: set[str],
+        structure_changed: bool,
+    ) -> None:
+        """Re-schedule the changed tasks of a list (store listener)."""
+        for uid in changed_uids:
+            self._scheduled.pop((list_id, uid, KIND_DUE), None)
+            self._scheduled.pop((list_id, uid, KIND_OVERDUE), None)
+            if task := self._store.get_task(list_id, uid):
+                self._schedule_task(list_id, task)
+        self._async_arm()
+
+    def _schedule_task(self, list_id: str, task: Task) -> None:
+        """Push a task's due and overdue times (incomplete dated tasks only)."""
+        if task.status == "completed" or task.is_deleted() or not task.due:
+            return
+        due_dt = _parse_due(task.due)
+        overdue_at = task.overdue_at()
+        if due_dt is None or overdue_at is None:
+            return
+
+        now = datetime.now(UTC)
+        # All-day dues are stored as UTC midnight; they are due when their
+        # date starts in the local timezone
+        due_at = (
+            dt_util.as_utc(dt_util.start_of_local_day(due_dt.date()))
+            if task.is_all_day
+            else due_dt
+        )
+        for kind, when in ((KIND_DUE, due_at), (KIND_OVERDUE, overdue_at)):
+            if kind == KIND_DUE and when <= now:
+                continue  # Nothing to do for a due time that already passed
+            self._scheduled[(list_id, task.uid, kind)] = when
+            heapq.heappush(
+                self._heap,
+                _Entry(
+                    when,
+                    next(self._seq),
+                    kind,
+                    list_id,
+                    task.uid,
+                    task.due,
+                    notify=when > now,
+                ),
+            )
+
+    def _is_current(self, entry: _Entry) -> bool:
+        """Check whether a heap entry has not been superseded."""
+        return self._scheduled.get((entry.list_id, entry.uid, entry.kind)) == entry.when
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the timer for the earliest current entry."""
+        # Drop superseded entries once they dominate the heap
+        if len(self._heap) > 2 * len(self._scheduled) + 64:
+            self._heap = [entry for entry in self._heap if self._is_current(entry)]
+            heapq.heapify(self._heap)
+
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+
+        when = self._heap[0].when if self._heap else None
+        if when == self._armed_at:
+            return
+
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._armed_at = when
+        if when is not None:
+            self._unsub_timer = async_track_point_in_utc_time(
+                self.hass, self._async_fire, when
+            )
+
+    async def _async_fire(self, _now: datetime) -> None:
+        """Process every entry that is due."""
+        self._unsub_timer = None
+        self._armed_at = None
+
+        now = datetime.now(UTC)
+        while self._heap and self._heap[0].when <= now:
+            entry = heapq.heappop(self._heap)
+            if not self._is_current(entry):
+                continue
+            del self._scheduled[(entry.list_id, entry.uid, entry.kind)]
+            await self._async_process(entry)
+
+        self._async_arm()
+
+    async def _async_process(self, entry: _Entry) -> None:
+        """Fire the event (and streak reset) for one entry."""
+        task = self._store.get_task(entry.list_id, entry.uid)
+        if (
+            task is None
+            or task.status == "completed"
+            or task.is_deleted()
+            or task.due != entry.due
+        ):
+            return
+
+        if entry.kind == KIND_OVERDUE and task.parent_uid:
+            await self._async_reset_streak(entry.list_id, task)
+
+        # Due and overdue counts changed without a store change
+        if entity := self.hass.data[DOMAIN].get("entities", {}).get(entry.list_id):
+            entity.async_schedule_state_write()
+
+        if not entry.notify:
+            return  # Already past when scheduled (e.g. while HA was down)
+
+        self.hass.bus.async_fire(
+            EVENT_TASK_DUE if entry.kind == KIND_DUE else EVENT_TASK_OVERDUE,
+            {
+                "list_id": entry.list_id,
+                "uid": task.uid,
+                "summary": task.summary,
+                "due": task.due,
+                "template_uid": task.parent_uid,
+            },
+        )
+
+    async def _async_reset_streak(self, list_id: str, instance: Task) -> bool:
+        """Reset the template streak of an overdue latest instance.
+
+        Returns:
+            True if a streak was reset
+        """
+        assert instance.parent_uid is not None
+        instances = self._store.get_instances_for_template(
+            list_id, instance.parent_uid
+        )
+        latest = max(instances, key=lambda t: t.occurrence_index, default=None)
+        if latest is None or latest.uid != instance.uid:
+            return False
+
+        if (history := self.hass.data[DOMAIN].get("completion_history")) and (
+            due_day := instance.due_day()
+        ):
+            history.async_record_missed(list_id, instance.parent_uid, due_day)
+
+        reset = False
+        async with self._store.async_edit_task(list_id, instance.parent_uid) as template:
+            if template is not None and template.streak_current > 0:
+                _LOGGER.info(
+                    "Resetting streak for overdue template: %s (was %d)",
+                    template.summary,
+                    template.streak_current,
+                )
+                template.streak_current = 0
+                template.update_modified()
+                reset = True
+
+        if reset and (
+            entity := self.hass.data[DOMAIN].get("entities", {}).get(list_id)
+        ):
+            entity.async_schedule_state_write()
+        return reset
+
+    async def async_reset_overdue_streaks(self) -> int:
+        """Reset the streaks of all templates whose latest instance is overdue.
+
+        Used by the manual maintenance service; the scheduler applies the
+        same resets on its own as each due date ends.
+
+        Returns:
+            Number of streaks reset
+        """
+        now = dt_util.utcnow()
+        reset_count = 0
+        for list_config in self._store.get_all_lists():
+            list_id = list_config["id"]
+            for task in self._store.get_tasks_for_list(list_id):
+                if (
+                    task.parent_uid
+                    and task.status != "completed"
+                    and not task.is_deleted()
+                    and task.is_overdue(now)
+                    and await self._async_reset_streak(list_id, task)
+                ):
+                    reset_count += 1
+        return reset_count
+
+
+def _parse_due(due: str) -> datetime | None:
+    """Parse a stored due date as an aware UTC datetime."""
+    try:
+        due_dt = datetime.fromisoformat(due.replace("Z", "+00:00"))
+    except ValueError:
+        _LOGGER.warning("Ignoring unparseable due date: %s", due)
+        return None
+    if due_dt.tzinfo is None:
+        due_dt = due_dt.replace(tzinfo=UTC)
+    return due_dt.astimezone(UTC)
@@ -0,0 +1,539 @@
+"""Compact per-template completion history (day-indexed bitsets)."""
+
+from __future__ import annotations
+
+import base64
+from datetime import UTC, date
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SIGNAL_LIST_ADDED, SIGNAL_LIST_REMOVED, STORAGE_VERSION
+from .store import ChoreBotStore
+from .task import Task
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to batch history changes into one save
+SAVE_DELAY = 10
+
+# Heatmap day codes are bit flags
+DAY_COMPLETED = 1
+DAY_ON_TIME = 2
+DAY_MISSED = 4
+
+
+class TemplateHistory:
+    """Completed, on-time and missed bitsets of one recurring template.
+
+    Bit ``i`` of each bytearray is day ``start + i`` (local day ordinals, the
+    days on-time checks and overdue resets use). ``start`` is a multiple of
+    8, so every byte holds one aligned block of 8 days and the three arrays
+    always have the same length. Setting a day is O(1); range queries turn
+    the bytes of the range into one int and use shifts and bit counts, so
+    years of history are answered without a loop over days.
+
+    A day is completed if an instance completed on it still is, and missed
+    if the latest instance, due that day, became overdue while still open.
+    ``day_counts`` holds the number of completions made on each day (one
+    byte per day, saturating at 255). It follows the template's streak
+    counters: every completion counts (late ones too) and an uncomplete does
+    not take it back, so a re-completion counts again.
+    """
+
+    __slots__ = ("start", "completed", "on_time", "missed", "day_counts")
+
+    def __init__(self) -> None:
+        """Initialize an empty history."""
+        self.start = 0
+        self.completed = bytearray()
+        self.on_time = bytearray()
+        self.missed = bytearray()
+        self.day_counts = bytearray()
+
+    def _arrays(self) -> tuple[bytearray, bytearray, bytearray]:
+        """Return the three bitsets."""
+        return (self.completed, self.on_time, self.missed)
+
+    def _offset(self, day: int) -> int:
+        """Return a day's bit offset, growing the bitsets to cover it."""
+        if not self.completed:
+            self.start = day - day % 8
+        elif day < self.start:
+            new_start = day - day % 8
+            padding = bytes((self.start - new_start) // 8)
+            for bits in self._arrays():
+                bits[:0] = padding
+            self.day_counts[:0] = bytes(len(padding) * 8)
+            self.start = new_start
+
+        offset = day - self.start
+        if (missing := offset // 8 + 1 - len(self.completed)) > 0:
+            for bits in self._arrays():
+                bits.extend(bytes(missing))
+            self.day_counts.extend(bytes(missing * 8))
+        return offset
+
+    @staticmethod
+    def _set(bits: bytearray, offset: int, value: bool) -> None:
+        """Set or clear one bit."""
+        if value:
+            bits[offset >> 3] |= 1 << (offset & 7)
+        else:
+            bits[offset >> 3] &= ~(1 << (offset & 7)) & 0xFF
+
+    def record_completion(self, day: date, on_time: bool) -> None:
+        """Count a completion on a day (and mark the day completed/on time)."""
+        offset = self._offset(day.toordinal())
+        self.day_counts[offset] = min(self.day_counts[offset] + 1, 255)
+        self._set(self.completed, offset, True)
+        if on_time:
+            self._set(self.on_time, offset, True)
+
+    def clear_completed(self, day: date) -> None:
+        """Unmark a day with no completed instance left (the count stays)."""
+        ordinal = day.toordinal()
+        if self.completed and self.start <= ordinal < self.end:
+            offset = ordinal - self.start
+            self._set(self.completed, offset, False)
+            self._set(self.on_time, offset, False)
+
+    def record_missed(self, day: date) -> None:
+        """Mark a day missed."""
+        self._set(self.missed, self._offset(day.toordinal()), True)
+
+    @property
+    def end(self) -> int:
+        """Return the ordinal after the last day the bitsets cover."""
+        return self.start + len(self.completed) * 8
+
+    def _window(self, bits: bytearray, first: int, last: int) -> int:
+        """Return the bits of days [first, last] as an int (bit 0 = first)."""
+        low = max(first, self.start)
+        high = min(last, self.end - 1)
+        if low > high:
+            return 0
+        value = int.from_bytes(
+            bits[(low - self.start) >> 3 : ((high - self.start) >> 3) + 1], "little"
+        )
+        value >>= (low - self.start) & 7
+        value &= (1 << (high - low + 1)) - 1
+        return value << (low - first)
+
+    def _sum_counts(self, first: int, last: int | None = None) -> int:
+        """Sum the completions of days [first, last] (bit offsets)."""
+        return sum(self.day_counts[first : None if last is None else last + 1])
+
+    def counts(self, first: date, last: date) -> dict[str, int]:
+        """Count completions and completed, on-time and missed days in [first, last]."""
+        low, high = first.toordinal(), last.toordinal()
+        return {
+            "completions": self._sum_counts(
+                max(low, self.start) - self.start, high - self.start
+            )
+            if high >= self.start
+            else 0,
+            "completed": self._window(self.completed, low, high).bit_count(),
+            "on_time": self._window(self.on_time, low, high).bit_count(),
+            "missed": self._window(self.missed, low, high).bit_count(),
+        }
+
+    def heatmap(self, first: date, last: date) -> list[int]:
+        """Return one DAY_* flag combination per day of [first, last]."""
+        low, high = first.toordinal(), last.toordinal()
+        completed = self._window(self.completed, low, high)
+        on_time = self._window(self.on_time, low, high)
+        missed = self._window(self.missed, low, high)
+        return [
+            (completed >> i & 1)
+            | (on_time >> i & 1) << 1
+            | (missed >> i & 1) << 2
+            for i in range(high - low + 1)
+        ]
+
+    def streaks(self) -> tuple[int, int]:
+        """Recompute (current, longest) streak from the history.
+
+        Mirrors how the template counters are kept: each completion adds
+        one, and the overdue reset at the end of a missed day sets the
+        streak back to zero. A completion on a missed day happened before
+        the day ended, so it belongs to the run before the miss.
+        """
+        if not self.completed:
+            return (0, 0)
+        missed = int.from_bytes(self.missed, "little")
+
+        longest = 0
+        run_start = 0
+        while missed:
+            low_bit = missed & -missed
+            position = low_bit.bit_length() - 1
+            longest = max(longest, self._sum_counts(run_start, position))
+            run_start = position + 1
+            missed ^= low_bit
+        current = self._sum_counts(run_start)
+        return (current, max(longest, current))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for storage."""
+        return {
+            "start": self.start,
+            "completed": base64.b64encode(self.completed).decode(),
+            "on_time": base64.b64encode(self.on_time).decode(),
+            "missed": base64.b64encode(self.missed).decode(),
+            "counts": base64.b64encode(self.day_counts).decode(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TemplateHistory:
+        """Restore from storage."""
+        history = cls()
+        history.start = data.get("start", 0)
+        history.completed = bytearray(base64.b64decode(data.get("completed", "")))
+        history.on_time = bytearray(base64.b64decode(data.get("on_time", "")))
+        history.missed = bytearray(base64.b64decode(data.get("missed", "")))
+        size = max(len(bits) for bits in history._arrays())
+        for bits in history._arrays():
+            bits.extend(bytes(size - len(bits)))
+        if "counts" in data:
+            history.day_counts = bytearray(base64.b64decode(data["counts"]))
+        else:
+            # Saved before per-day counts: one completion per completed day
+            completed = int.from_bytes(history.completed, "little")
+            history.day_counts = bytearray(
+                completed >> offset & 1 for offset in range(size * 8)
+            )
+        history.day_counts.extend(bytes(size * 8 - len(history.day_counts)))
+        return history
+
+
+class CompletionHistory:
+    """Completion history of every recurring template, kept up to date.
+
+    Completions are recorded from store changes (so local completions and
+    synced ones alike), missed days by the due scheduler when a template's
+    latest instance becomes overdue. The history is saved to
+    ``.storage/chorebot_history`` with a short delay; on first use it is
+    backfilled from the active and archived instances.
+
+    The saved file also lists the completions it already holds, so changes
+    made within the save delay before a crash are picked up from the tasks
+    when the history loads again.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: ChoreBotStore) -> None:
+        """Initialize the history."""
+        self.hass = hass
+        self._store = store
+        self._storage = Store(hass, STORAGE_VERSION, f"{DOMAIN}_history")
+        # list_id -> template uid -> history
+        self._histories: dict[str, dict[str, TemplateHistory]] = {}
+        # (list_id, instance uid) -> (template uid, day) of recorded completions
+        self._recorded: dict[tuple[str, str], tuple[str, date]] = {}
+        # Whether _recorded matches the histories (False for files saved
+        # before it was kept: then it is taken from the tasks as they are)
+        self._reconcile = True
+        self._unsub_lists: dict[str, CALLBACK_TYPE] = {}
+        self._unsub_signals: list[CALLBACK_TYPE] = []
+
+    async def async_load(self) -> None:
+        """Load the history (backfilling it on first use)."""
+        data = await self._storage.async_load()
+        if data is None:
+            await self._async_backfill()
+            await self._storage.async_save(self._data_to_save())
+            return
+        self._histories = {
+            list_id: {
+                uid: TemplateHistory.from_dict(history)
+                for uid, history in templates.items()
+            }
+            for list_id, templates in data.get("lists", {}).items()
+        }
+        if "recorded" not in data:
+            self._reconcile = False
+            return
+        self._recorded = {
+            (list_id, uid): (template_uid, date.fromordinal(ordinal))
+            for list_id, instances in data["recorded"].items()
+            for uid, (template_uid, ordinal) in instances.items()
+        }
+
+    async def _async_backfill(self) -> None:
+        """Build the history from active and archived instances."""
+        today = dt_util.now().date()
+        instance_count = 0
+        for list_config in self._store.get_all_lists():
+            list_id = list_config["id"]
+            active = self._store.get_tasks_for_list(list_id)
+            archived = await self._store.async_get_archived_tasks(list_id)
+            for task in (*active, *archived):
+                if not task.parent_uid:
+                    continue
+                history = self._history(list_id, task.parent_uid)
+                due_day = task.due_day()
+                if task.status == "completed":
+                    if task.last_completed and (
+                        day := _local_day(task.last_completed)
+                    ):
+                        history.record_completion(
+                            day, bool(task.due and task.completed_on_time)
+                        )
+                    if due_day and task.completed_on_time is False:
+                        history.record_missed(due_day)
+                elif due_day and due_day < today and not task.is_deleted():
+                    history.record_missed(due_day)
+                instance_count += 1
+            for task in active:
+                if (recorded := _completion(task)) is not None:
+                    self._recorded[(list_id, task.uid)] = recorded
+        _LOGGER.info(
+            "Built completion history of %d templates from %d instances",
+            sum(len(templates) for templates in self._histories.values()),
+            instance_count,
+        )
+
+    @callback
+    def async_start(self) -> None:
+        """Start recording completions from store changes."""
+        for list_config in self._store.get_all_lists():
+            self._async_track_list(list_config["id"])
+        self._reconcile = True
+        self._unsub_signals = [
+            async_dispatcher_connect(
+                self.hass, SIGNAL_LIST_ADDED, self._async_track_list
+            ),
+            async_dispatcher_connect(
+                self.hass, SIGNAL_LIST_REMOVED, self._async_untrack_list
+            ),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening (a pending save still runs)."""
+        for unsub in (*self._unsub_signals, *self._unsub_lists.values()):
+            unsub()
+        self._unsub_signals = []
+        self._unsub_lists.clear()
+
+    @callback
+    def _async_track_list(self, list_id: str) -> None:
+        """Listen for a list's changes and catch up with its instances.
+
+        Completions and uncompletes the saved history missed (e.g. made
+        within the save delay before a crash) are applied like changes.
+        """
+        if list_id in self._unsub_lists:
+            return
+        self._unsub_lists[list_id] = self._store.async_add_list_listener(
+            list_id, self._async_list_changed
+        )
+        tasks = self._store.get_tasks_for_list(list_id)
+        if not self._reconcile:
+            for task in tasks:
+                if (recorded := _completion(task)) is not None:
+                    self._recorded[(list_id, task.uid)] = recorded
+            self._schedule_save()  # Save the recorded completions
+            return
+        uids = {task.uid for task in tasks}
+        uids.update(
+            uid for key_list_id, uid in self._recorded if key_list_id == list_id
+        )
+        self._async_list_changed(list_id, 0, uids, False)
+
+    @callback
+    def _async_untrack_list(self, list_id: str) -> None:
+        """Forget a deleted list and its history."""
+        if unsub := self._unsub_lists.pop(list_id, None):
+            unsub()
+        for key in [key for key in self._recorded if key[0] == list_id]:
+            del self._recorded[key]
+        if self._histories.pop(list_id, None) is not None:
+            self._schedule_save()
+
+    @callback
+    def _async_list_changed(
+        self,
+        list_id: str,
+        revision: int,
+        changed_uids: set[str],
+        structure_changed: bool,
+    ) -> None:
+        """Record completions and uncompletions of changed instances."""
+        changed = False
+        templates = self._histories.get(list_id, {})
+        for uid in changed_uids:
+            if uid in templates and self._store.get_template(list_id, uid) is None:
+                del templates[uid]  # Template deleted
+                changed = True
+                continue
+
+            key = (list_id, uid)
+            recorded = self._recorded.get(key)
+            task = self._store.get_task(list_id, uid)
+            if task is None or task.is_deleted():
+                # Archived or hidden: the history keeps the completion
+                if self._recorded.pop(key, None) is not None:
+                    changed = True
+                continue
+
+            completion = _completion(task)
+            if completion == recorded:
+                continue
+            if recorded is not None:
+                # Uncompleted (or re-completed on another day): the count
+                # stays, like the streak counters; the day is unmarked
+                # unless another instance completed that day still is
+                del self._recorded[key]
+                if (history := templates.get(recorded[0])) and not any(
+                    other == recorded
+                    for (other_list_id, _), other in self._recorded.items()
+                    if other_list_id == list_id
+                ):
+                    history.clear_completed(recorded[1])
+                changed = True
+            if completion is not None:
+                self._history(list_id, completion[0]).record_completion(
+                    completion[1], bool(task.due and task.completed_on_time)
+                )
+                self._recorded[key] = completion
+                changed = True
+        if changed:
+            self._schedule_save()
+
+    @callback
+    def async_record_missed(self, list_id: str, template_uid: str, day: date) -> None:
+        """Mark the due day of a latest instance that became overdue as missed."""
+        self._history(list_id, template_uid).record_missed(day)
+        self._schedule_save()
+
+    def _history(self, list_id: str, template_uid: str) -> TemplateHistory:
+        """Get (or create) the history of a template."""
+        templates = self._histories.setdefault(list_id, {})
+        history = templates.get(template_uid)
+        if history is None:
+            history = templates[template_uid] = TemplateHistory()
+        return history
+
+    def get(self, list_id: str, template_uid: str) -> TemplateHistory | None:
+        """Get the history of a template, if it has any."""
+        return self._histories.get(list_id, {}).get(template_uid)
+
+    async def async_rebuild_streaks(
+        self,
+        list_id: str | None = None,
+        template_uid: str | None = None,
+        dry_run: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Reset template streak counters to the values in the history.
+
+        Args:
+            list_id: Only this list (default: all lists)
+            template_uid: Only this template (requires list_id)
+            dry_run: Only report the differences, change nothing
+
+        Returns:
+            One entry per template whose counters differ(ed) from the history
+        """
+        list_ids = (
+            [list_id]
+            if list_id is not None
+            else [list_config["id"] for list_config in self._store.get_all_lists()]
+        )
+        mismatches: list[dict[str, Any]] = []
+        for current_list_id in list_ids:
+            templates = self._store.get_templates_for_list(current_list_id)
+            for template in templates:
+                if template_uid is not None and template.uid != template_uid:
+                    continue
+                history = self.get(current_list_id, template.uid)
+                current, longest = history.streaks() if history else (0, 0)
+                if (template.streak_current, template.streak_longest) == (
+                    current,
+                    longest,
+                ):
+                    continue
+                mismatches.append(
+                    {
+                        "list_id": current_list_id,
+                        "uid": template.uid,
+                        "summary": template.summary,
+                        "streak_current": template.streak_current,
+                        "streak_longest": template.streak_longest,
+                        "history_current": current,
+                        "history_longest": longest,
+                    }
+                )
+                if dry_run:
+                    _LOGGER.info(
+                        "Streak of %s differs from history: %d/%d, history %d/%d",
+                        template.summary,
+                        template.streak_current,
+                        template.streak_longest,
+                        current,
+                        longest,
+                    )
+                    continue
+                async with self._store.async_edit_task(
+                    current_list_id, template.uid
+                ) as latest:
+                    if latest is None:
+                        continue
+                    _LOGGER.info(
+                        "Rebuilt streak of %s from history: %d/%d -> %d/%d",
+                        latest.summary,
+                        latest.streak_current,
+                        latest.streak_longest,
+                        current,
+                        longest,
+                    )
+                    latest.streak_current = current
+                    latest.streak_longest = longest
+                    latest.update_modified()
+        return mismatches
+
+    def _schedule_save(self) -> None:
+        """Save the history after SAVE_DELAY (changes in between are batched)."""
+        self._storage.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Serialize every history and the completions it holds."""
+        recorded: dict[str, dict[str, list[Any]]] = {}
+        for (list_id, uid), (template_uid, day) in self._recorded.items():
+            recorded.setdefault(list_id, {})[uid] = [template_uid, day.toordinal()]
+        return {
+            "lists": {
+                list_id: {
+                    uid: history.to_dict() for uid, history in templates.items()
+                }
+                for list_id, templates in self._histories.items()
+            },
+            "recorded": recorded,
+        }
+
+
+def _completion(task: Task) -> tuple[str, date] | None:
+    """Return (template uid, local day) of a completed recurring instance."""
+    if (
+        task.status != "completed"
+        or not task.parent_uid
+        or not task.last_completed
+        or (day := _local_day(task.last_completed)) is None
+    ):
+        return None
+    return (task.parent_uid, day)
+
+
+def _local_day(timestamp: str) -> date | None:
+    """Return the local day of a stored timestamp."""
+    parsed = dt_util.parse_datetime(timestamp)
+    if parsed is None:
+        _LOGGER.debug("Ignoring unparseable timestamp: %s", timestamp)
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return dt_util.as_local(parsed).date()
@@ -0,0 +1,161 @@
+"""Write-ahead change journal for ChoreBot task lists.
+
+In journaled storage mode each committed change is appended to a per-list
+journal (JSON lines in ``.storage/chorebot_list_<id>.journal``) instead of
+rewriting the whole list document. A compactor periodically folds the
+journal into the list document and truncates it.
+
+Crash recovery:
+    - Appends are flushed and fsynced before the change is acknowledged.
+    - A torn (partially written) record can only be the last line; replay
+      stops at the first unreadable line and ignores the rest.
+    - The list document records the sequence number of the last record it
+      contains (``journal_seq``). Compaction writes the document atomically
+      before truncating the journal, so a crash in between only leaves
+      records that replay skips.
+    - Whenever a list is loaded with a non-empty journal, the journal is
+      replayed, folded into the document and truncated.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import FIELD_DELETED_AT
+
+_LOGGER = logging.getLogger(__name__)
+
+# Compact after this many records, or once a list has been idle this long
+JOURNAL_COMPACT_RECORDS = 200
+JOURNAL_COMPACT_IDLE_SECONDS = 30
+
+# Record operations
+OP_PUT = "put"  # Upsert a task or template: {"uid", "template", "data"}
+OP_REMOVE = "remove"  # Remove a task or template: {"uid"}
+OP_SECTIONS = "sections"  # Replace the list's sections: {"data"}
+OP_METADATA = "metadata"  # Replace the list's metadata: {"data"}
+
+
+class ListJournal:
+    """Append-only JSON-lines journal (per list, or for completion intents)."""
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the journal.
+
+        Args:
+            hass: Home Assistant instance
+            key: Storage key of the list document the journal belongs to
+        """
+        self.hass = hass
+        self.path = Path(hass.config.path(STORAGE_DIR, f"{key}.journal"))
+
+    async def async_append(self, records: list[dict[str, Any]]) -> None:
+        """Durably append records (one JSON document per line)."""
+        data = "".join(
+            json.dumps(record, separators=(",", ":")) + "\n" for record in records
+        )
+        await self.hass.async_add_executor_job(self._append, data)
+
+    def _append(self, data: str) -> None:
+        """Append and fsync (runs in the executor)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as journal_file:
+            journal_file.write(data)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    async def async_read(self) -> tuple[list[dict[str, Any]], bool]:
+        """Read all readable records.
+
+        Returns:
+            (records, exists) - exists is True if a non-empty journal file
+            was found, even when none of its records were readable
+        """
+        return await self.hass.async_add_executor_job(self._read)
+
+    def _read(self) -> tuple[list[dict[str, Any]], bool]:
+        """Read records, stopping at the first torn or corrupt line."""
+        try:
+            content = self.path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return [], False
+
+        records: list[dict[str, Any]] = []
+        for line_number, line in enumerate(content.splitlines(), start=1):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                _LOGGER.warning(
+                    "Ignoring unreadable journal record at %s:%d and everything after it",
+                    self.path.name,
+                    line_number,
+                )
+                break
+            records.append(record)
+        return records, bool(content)
+
+    async def async_truncate(self) -> None:
+        """Remove the journal (after it has been folded into the document)."""
+        await self.hass.async_add_executor_job(self._truncate)
+
+    def _truncate(self) -> None:
+        """Delete the journal file (runs in the executor)."""
+        self.path.unlink(missing_ok=True)
+
+
+def apply_records(document: dict[str, Any], records: list[dict[str, Any]]) -> int:
+    """Replay journal records onto a list document in place.
+
+    Records at or below the document's ``journal_seq`` are already part of
+    it and are skipped.
+
+    Args:
+        document: List document ({"recurring_templates", "tasks", "sections",
+            "metadata", "journal_seq"})
+        records: Journal records in append order
+
+    Returns:
+        Sequence number of the last record now contained in the document
+    """
+    last_seq = document.get("journal_seq", 0)
+    templates = {t["uid"]: t for t in document.get("recurring_templates", [])}
+    tasks = {t["uid"]: t for t in document.get("tasks", [])}
+
+    for record in records:
+        seq = record.get("seq", 0)
+        if seq <= last_seq:
+            continue
+        last_seq = seq
+
+        op = record.get("op")
+        if op == OP_PUT:
+            uid = record["uid"]
+            target, other = (
+                (templates, tasks) if record.get("template") else (tasks, templates)
+            )
+            other.pop(uid, None)
+            target[uid] = record["data"]
+        elif op == OP_REMOVE:
+            # Mirrors a full write: soft-deleted items already on disk are kept
+            uid = record["uid"]
+            for bucket in (templates, tasks):
+                if uid in bucket and not bucket[uid].get(FIELD_DELETED_AT):
+                    del bucket[uid]
+        elif op == OP_SECTIONS:
+            document["sections"] = record["data"]
+        elif op == OP_METADATA:
+            document["metadata"] = record["data"]
+        else:
+            _LOGGER.warning("Skipping unknown journal operation: %s", op)
+
+    document["recurring_templates"] = list(templates.values())
+    document["tasks"] = list(tasks.values())
+    document["journal_seq"] = last_seq
+    return last_seq
@@ -3,21 +3,37 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 import logging
-from typing import Any
+from typing import Any, TypeVar
 from uuid import uuid4
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, STORAGE_VERSION
+from .database import META_PEOPLE_MIGRATED, META_PEOPLE_SOURCE, ChoreBotDatabase
+from .stats import RollingStats
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
 
-@dataclass
+# View kinds, invalidated separately (a transaction never rebuilds rewards)
+VIEW_PEOPLE = "people"
+VIEW_REWARDS = "rewards"
+VIEW_TRANSACTIONS = "transactions"
+VIEW_REDEMPTIONS = "redemptions"
+
+# Recently applied transaction IDs kept in the people document (JSON
+# storage), so replaying a completion never applies its points twice
+APPLIED_MARKER_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
 class PersonProfile:
     """Person profile data."""
 
@@ -49,7 +65,7 @@ class PersonProfile:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Transaction:
     """Point transaction record."""
 
@@ -87,7 +103,7 @@ class Transaction:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Reward:
     """Configurable reward."""
 
@@ -131,7 +147,7 @@ class Reward:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Redemption:
     """Reward redemption record."""
 
@@ -167,11 +183,33 @@ class Redemption:
 
 
 class PeopleStore:
-    """Manages JSON storage for person points, transactions, and rewards."""
+    """Manages JSON storage for person points, transactions, and rewards.
+
+    The raw dicts in ``_data`` are what gets persisted. Reads are served
+    from a typed model built from them lazily: frozen, slotted objects and
+    derived views (total balance, sorted rewards, enabled rewards per
+    person, newest-first ledgers) cached until the next change of their
+    kind. ``revision`` is bumped on every change (and the person's own
+    revision for changes to one person), so callers can cache their own
+    renders too. Returned objects and containers are shared; do not mutate
+    them. Listeners are told which people each change affected.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, database: ChoreBotDatabase | None = None
+    ) -> None:
+        """Initialize the people store.
 
-    def __init__(self, hass: HomeAssistant) -> None:
-        """Initialize the people store."""
+        Args:
+            hass: Home Assistant instance
+            database: Keep people, rewards and the ledger in SQLite instead of
+                the JSON files (transactions/redemptions are appended as rows)
+        """
         self.hass = hass
+        self._database = database
+        # Ledger entries already persisted to the database (append-only)
+        self._saved_transactions = 0
+        self._saved_redemptions = 0
         # Split into separate stores for better performance
         self._people_store = Store(hass, STORAGE_VERSION, f"{DOMAIN}_people")
         self._rewards_store = Store(hass, STORAGE_VERSION, f"{DOMAIN}_rewards")
@@ -181,26 +219,22 @@ class PeopleStore:
         self._redemptions_store = Store(hass, STORAGE_VERSION, f"{DOMAIN}_redemptions")
         self._data: dict[str, Any] = {}
         self._lock = asyncio.Lock()
+        # Typed read model: kind -> view name -> cached value
+        self.revision = 0
+        self._person_revisions: dict[str, int] = {}
+        self._views: dict[str, dict[str, Any]] = {}
+        self._listeners: list[Callable[[set[str]], None]] = []
+        # Typed ledger entries, converted incrementally (the ledger only grows)
+        self._transaction_objs: list[Transaction] = []
+        self._redemption_objs: list[Redemption] = []
 
     async def async_load(self) -> None:
         """Load people data from storage."""
         async with self._lock:
-            # Load from split files
-            people_data = await self._people_store.async_load()
-            rewards_data = await self._rewards_store.async_load()
-            transactions_data = await self._transactions_store.async_load()
-            redemptions_data = await self._redemptions_store.async_load()
-
-            self._data = {
-                "people": people_data.get("people", {}) if people_data else {},
-                "rewards": rewards_data.get("rewards", []) if rewards_data else [],
-                "transactions": transactions_data.get("transactions", [])
-                if transactions_data
-                else [],
-                "redemptions": redemptions_data.get("redemptions", [])
-                if redemptions_data
-                else [],
-            }
+            if self._database is not None:
+                await self._async_load_database()
+            else:
+                await self._async_load_json()
 
             _LOGGER.info(
                 "Loaded people data: %d people, %d transactions, %d rewards, %d redemptions",
@@ -236,6 +270,152 @@ class PeopleStore:
                             "Completed reward migration to person-specific model"
                         )
 
+            self._transaction_objs = []
+            self._redemption_objs = []
+            self._mark_changed(
+                VIEW_PEOPLE,
+                VIEW_REWARDS,
+                VIEW_TRANSACTIONS,
+                VIEW_REDEMPTIONS,
+                person_ids=self._data.get("people", {}),
+            )
+
+    # ==================== Read Model ====================
+
+    def _mark_changed(self, *kinds: str, person_ids: Iterable[str] = ()) -> None:
+        """Bump the revisions, drop stale views and notify listeners.
+
+        Args:
+            kinds: View kinds that changed
+            person_ids: People whose data changed
+        """
+        self.revision += 1
+        for kind in kinds:
+            self._views.pop(kind, None)
+        changed = set(person_ids)
+        for person_id in changed:
+            self._person_revisions[person_id] = (
+                self._person_revisions.get(person_id, 0) + 1
+            )
+        for listener in list(self._listeners):
+            listener(changed)
+
+    def get_person_revision(self, person_id: str) -> int:
+        """Get a person's revision (bumped on every change to their data)."""
+        return self._person_revisions.get(person_id, 0)
+
+    @callback
+    def async_add_listener(
+        self, listener: Callable[[set[str]], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for changes; called with the IDs of the people affected.
+
+        Returns:
+            Callback that removes the listener.
+        """
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove_listener
+
+    def _view(self, kind: str, name: str, build: Callable[[], _T]) -> _T:
+        """Get a cached view, building it if its kind changed since."""
+        views = self._views.setdefault(kind, {})
+        if name not in views:
+            views[name] = build()
+        return views[name]
+
+    @staticmethod
+    def _typed_ledger(
+        raw: list[dict[str, Any]],
+        typed: list[_T],
+        from_dict: Callable[[dict[str, Any]], _T],
+    ) -> list[_T]:
+        """Convert the ledger entries appended since the last call."""
+        typed.extend(from_dict(entry) for entry in raw[len(typed) :])
+        return typed
+
+    async def _async_load_json(self) -> None:
+        """Load people data from the split JSON files."""
+        people_data = await self._people_store.async_load()
+        rewards_data = await self._rewards_store.async_load()
+        transactions_data = await self._transactions_store.async_load()
+        redemptions_data = await self._redemptions_store.async_load()
+
+        self._data = {
+            "people": people_data.get("people", {}) if people_data else {},
+            "applied_transactions": people_data.get("applied_transactions", [])
+            if people_data
+            else [],
+            "rewards": rewards_data.get("rewards", []) if rewards_data else [],
+            "transactions": transactions_data.get("transactions", [])
+            if transactions_data
+            else [],
+            "redemptions": redemptions_data.get("redemptions", [])
+            if redemptions_data
+            else [],
+        }
+        if people_data is not None and "applied_transactions" not in people_data:
+            # Older files saved balances before the ledger: every ledger entry
+            # is already included in the balances
+            self._data["applied_transactions"] = [
+                t["id"] for t in self._data["transactions"][-APPLIED_MARKER_SIZE:]
+            ]
+
+    async def _async_load_database(self) -> None:
+        """Load people data from SQLite, importing the JSON files when needed.
+
+        The files are imported on the first start with SQLite, and again when
+        they changed since the import (JSON storage was used in between; see
+        ChoreBotStore._async_import_to_database).
+        """
+        assert self._database is not None
+        source = await self._database.async_storage_fingerprint(
+            [
+                self._people_store.key,
+                self._rewards_store.key,
+                self._transactions_store.key,
+                self._redemptions_store.key,
+            ]
+        )
+        imported_from = await self._database.async_get_meta(META_PEOPLE_SOURCE)
+        if not await self._database.async_get_meta(META_PEOPLE_MIGRATED):
+            reimport = True
+        elif imported_from is None:
+            # Imported before fingerprints were stored: take the files as
+            # they are now
+            await self._database.async_set_meta(META_PEOPLE_SOURCE, source)
+            reimport = False
+        elif imported_from != source:
+            _LOGGER.warning(
+                "The JSON people files changed since they were imported into SQLite"
+                " (JSON storage was used in between); importing them again"
+            )
+            reimport = True
+        else:
+            reimport = False
+
+        if reimport:
+            await self._async_load_json()
+            await self._database.async_import_people(self._data, source)
+            _LOGGER.info("Imported people, rewards and ledger from JSON into SQLite")
+        else:
+            self._data = await self._database.async_load_people()
+            if self._data["applied_transactions"] is None:
+                # Saved before the marker existed: the balances include
+                # every ledger entry
+                self._data["applied_transactions"] = [
+                    t["id"]
+                    for t in self._data["transactions"][-APPLIED_MARKER_SIZE:]
+                ]
+
+        self._saved_transactions = len(self._data["transactions"])
+        self._saved_redemptions = len(self._data["redemptions"])
+
     async def async_save(self) -> None:
         """Save all people data to storage. Must be called with lock held.
 
@@ -245,31 +425,51 @@ class PeopleStore:
         - async_save_transactions() for transaction log
         - async_save_redemptions() for redemption history
         """
-        await self._people_store.async_save({"people": self._data.get("people", {})})
-        await self._rewards_store.async_save({"rewards": self._data.get("rewards", [])})
-        await self._transactions_store.async_save(
-            {"transactions": self._data.get("transactions", [])}
-        )
-        await self._redemptions_store.async_save(
-            {"redemptions": self._data.get("redemptions", [])}
-        )
+        await self.async_save_people()
+        await self.async_save_rewards()
+        await self.async_save_transactions()
+        await self.async_save_redemptions()
 
     async def async_save_people(self) -> None:
         """Save only people balances. Must be called with lock held."""
-        await self._people_store.async_save({"people": self._data.get("people", {})})
+        if self._database is not None:
+            await self._database.async_save_people(self._data.get("people", {}))
+            return
+        await self._people_store.async_save(
+            {
+                "people": self._data.get("people", {}),
+                "applied_transactions": self._data.get("applied_transactions", []),
+            }
+        )
 
     async def async_save_rewards(self) -> None:
         """Save only rewards catalog. Must be called with lock held."""
+        if self._database is not None:
+            await self._database.async_save_rewards(self._data.get("rewards", []))
+            return
         await self._rewards_store.async_save({"rewards": self._data.get("rewards", [])})
 
     async def async_save_transactions(self) -> None:
         """Save only transaction log. Must be called with lock held."""
+        if self._database is not None:
+            # The ledger is append-only: write just the new rows
+            transactions = self._data.get("transactions", [])
+            if new := transactions[self._saved_transactions :]:
+                await self._database.async_append_transactions(new)
+            self._saved_transactions = len(transactions)
+            return
         await self._transactions_store.async_save(
             {"transactions": self._data.get("transactions", [])}
         )
 
     async def async_save_redemptions(self) -> None:
         """Save only redemption history. Must be called with lock held."""
+        if self._database is not None:
+            redemptions = self._data.get("redemptions", [])
+            if new := redemptions[self._saved_redemptions :]:
+                await self._database.async_append_redemptions(new)
+            self._saved_redemptions = len(redemptions)
+            return
         await self._redemptions_store.async_save(
             {"redemptions": self._data.get("redemptions", [])}
         )
@@ -284,12 +484,29 @@ class PeopleStore:
         return 0
 
     def async_get_all_people(self) -> dict[str, PersonProfile]:
-        """Get all people with their balances (synchronous, no await needed)."""
-        people_data = self._data.get("people", {})
-        return {
-            person_id: PersonProfile.from_dict(data)
-            for person_id, data in people_data.items()
-        }
+        """Get all people with their balances (synchronous, no await needed).
+
+        Returns the cached model; do not mutate it.
+        """
+        return self._view(
+            VIEW_PEOPLE,
+            "all",
+            lambda: {
+                person_id: PersonProfile.from_dict(data)
+                for person_id, data in self._data.get("people", {}).items()
+            },
+        )
+
+    def get_total_balance(self) -> int:
+        """Get the total points balance across all people (cached)."""
+        return self._view(
+            VIEW_PEOPLE,
+            "total_balance",
+            lambda: sum(
+                person.points_balance
+                for person in self.async_get_all_people().values()
+            ),
+        )
 
     async def async_add_points(
         self,
@@ -309,63 +526,233 @@ class PeopleStore:
         Returns:
             Transaction ID
         """
+        transaction = self.stage_transaction(
+            person_id, amount, transaction_type, metadata
+        )
+        await self.async_apply_transactions([transaction])
+        return transaction["id"]
+
+    async def async_add_points_batch(self, entries: list[dict[str, Any]]) -> list[str]:
+        """Add/subtract points for many entries with one save of each file.
+
+        All entries are applied in order under a single lock, so a batch is
+        never interleaved with other points changes.
+
+        Args:
+            entries: Dicts with person_id, amount, type and optional metadata
+
+        Returns:
+            Transaction IDs, in entry order
+        """
+        transactions = [
+            self.stage_transaction(
+                entry["person_id"],
+                entry["amount"],
+                entry["type"],
+                entry.get("metadata", {}),
+            )
+            for entry in entries
+        ]
+        await self.async_apply_transactions(transactions)
+        return [transaction["id"] for transaction in transactions]
+
+    @staticmethod
+    def stage_transaction(
+        person_id: str,
+        amount: int,
+        transaction_type: str,
+        metadata: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build a transaction record without applying it.
+
+        The ID and timestamp are assigned up front, so applying a staged
+        transaction again (e.g. when replaying a completion commit after a
+        crash) can be detected and skipped.
+
+        Args:
+            person_id: HA Person entity_id
+            amount: Points to add (negative to subtract)
+            transaction_type: Type of transaction
+            metadata: Type-specific metadata
+
+        Returns:
+            Staged transaction (without balance_after)
+        """
+        return {
+            "id": f"txn_{uuid4().hex[:12]}",
+            "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+            "person_id": person_id,
+            "amount": amount,
+            "type": transaction_type,
+            "metadata": metadata,
+        }
+
+    @staticmethod
+    def stage_completion_stats(
+        person_id: str, completed_at: str, on_time: bool | None, count: int = 1
+    ) -> dict[str, Any]:
+        """Build a rolling-stats completion count change without applying it.
+
+        Applied like a staged transaction (in the same save and replay), but
+        it only updates the person's stats: no balance or ledger change.
+
+        Args:
+            person_id: HA Person entity_id
+            completed_at: ISO timestamp of the completion
+            on_time: Whether it was on time; None for tasks without a due date
+            count: 1 for a completion, -1 to take one back (uncomplete)
+
+        Returns:
+            Staged stats change
+        """
+        return {
+            "id": f"cmp_{uuid4().hex[:12]}",
+            "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+            "person_id": person_id,
+            "completion": {
+                "timestamp": completed_at,
+                "on_time": on_time,
+                "count": count,
+            },
+        }
+
+    async def async_apply_transactions(
+        self, staged: list[dict[str, Any]], skip_existing: bool = False
+    ) -> int:
+        """Apply staged transactions under one lock with one points save.
+
+        Args:
+            staged: Transactions from stage_transaction (and stats changes
+                from stage_completion_stats), applied in order
+            skip_existing: Skip transactions whose points were already applied
+                (when replaying a completion commit)
+
+        Returns:
+            Number of transactions applied
+        """
         async with self._lock:
-            people = self._data.setdefault("people", {})
-            transactions = self._data.setdefault("transactions", [])
+            applied_ids = self._data.setdefault("applied_transactions", [])
+            skip: set[str] = set()
+            in_ledger: set[str] = set()
+            if skip_existing:
+                # The saved balances record the IDs they include
+                skip = set(applied_ids)
+                in_ledger = {t["id"] for t in self._data.get("transactions", [])}
+
+            applied: list[str] = []
+            for transaction in staged:
+                if transaction["id"] in skip:
+                    continue
+                self._apply_transaction_locked(
+                    transaction, append=transaction["id"] not in in_ledger
+                )
+                applied.append(transaction["id"])
 
-            # Get or create person record
-            if person_id not in people:
-                now = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-                people[person_id] = {
-                    "entity_id": person_id,
-                    "points_balance": 0,
-                    "lifetime_points": 0,
-                    "last_updated": now,
-                    "accent_color": "",
-                }
+            if applied:
+                applied_ids.extend(applied)
+                del applied_ids[:-APPLIED_MARKER_SIZE]
+                await self._async_save_points()
+            return len(applied)
 
-            person = people[person_id]
+    async def _async_save_points(self) -> None:
+        """Save balances and ledger after applying transactions (lock held).
 
-            # Update balance
-            old_balance = person["points_balance"]
-            new_balance = old_balance + amount
-            person["points_balance"] = new_balance
+        SQLite writes both (and the applied-ID marker) in one transaction.
+        JSON storage writes the ledger first and then the people document
+        with the applied-ID marker, so a crash in between is repaired by a
+        replay without double counting.
+        """
+        if self._database is not None:
+            transactions = self._data.get("transactions", [])
+            await self._database.async_save_points(
+                self._data.get("people", {}),
+                transactions[self._saved_transactions :],
+                self._data.get("applied_transactions", []),
+            )
+            self._saved_transactions = len(transactions)
+            return
+        await self.async_save_transactions()
+        await self.async_save_people()
 
-            # Update lifetime points (only if positive amount)
-            if amount > 0:
-                person["lifetime_points"] += amount
+    def _apply_transaction_locked(
+        self, staged: dict[str, Any], append: bool = True
+    ) -> None:
+        """Apply one staged transaction in memory. Lock must be held.
 
-            # Update timestamp
-            now = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-            person["last_updated"] = now
+        Args:
+            staged: Transaction from stage_transaction, or stats change from
+                stage_completion_stats
+            append: Append it to the ledger (False when a replay finds it
+                already saved there)
+        """
+        people = self._data.setdefault("people", {})
+        person_id = staged["person_id"]
+
+        if "amount" not in staged:
+            # Stats-only: count (or take back) a completion
+            if (person := people.get(person_id)) is not None:
+                completion = staged["completion"]
+                RollingStats(person.setdefault("stats", {})).add_completion(
+                    _local_day(completion["timestamp"]),
+                    completion["on_time"],
+                    completion["count"],
+                )
+                self._mark_changed(VIEW_PEOPLE, person_ids=[person_id])
+            return
 
-            # Create transaction record
-            transaction_id = f"txn_{uuid4().hex[:12]}"
-            transaction = {
-                "id": transaction_id,
-                "timestamp": now,
-                "person_id": person_id,
-                "amount": amount,
-                "balance_after": new_balance,
-                "type": transaction_type,
-                "metadata": metadata,
-            }
-            transactions.append(transaction)
+        amount = staged["amount"]
 
-            # Save only the affected files for performance
-            await self.async_save_people()
-            await self.async_save_transactions()
+        # Get or create person record
+        if person_id not in people:
+            people[person_id] = {
+                "entity_id": person_id,
+                "points_balance": 0,
+                "lifetime_points": 0,
+                "last_updated": staged["timestamp"],
+                "accent_color": "",
+            }
+        person = people[person_id]
 
-            _LOGGER.info(
-                "Points transaction: %s %+d pts (%d -> %d) [%s]",
-                person_id,
-                amount,
-                old_balance,
-                new_balance,
-                transaction_type,
+        old_balance = person["points_balance"]
+        new_balance = old_balance + amount
+        person["points_balance"] = new_balance
+        if amount > 0:
+            person["lifetime_points"] += amount
+        person["last_updated"] = staged["timestamp"]
+        if staged["type"] == "task_uncomplete" and (
+            completed_at := staged["metadata"].get("completed_at")
+        ):
+            # Reverse the award in the bucket it was booked to
+            RollingStats(person.setdefault("stats", {})).reverse_points(
+                _local_day(completed_at), -amount
+            )
+        elif staged["type"] != "reward_redemption":
+            RollingStats(person.setdefault("stats", {})).add_points(
+                _local_day(staged["timestamp"]), amount
             )
 
-            return transaction_id
+        if append:
+            self._data.setdefault("transactions", []).append(
+                {
+                    "id": staged["id"],
+                    "timestamp": staged["timestamp"],
+                    "person_id": person_id,
+                    "amount": amount,
+                    "balance_after": new_balance,
+                    "type": staged["type"],
+                    "metadata": staged["metadata"],
+                }
+            )
+        self._mark_changed(VIEW_PEOPLE, VIEW_TRANSACTIONS, person_ids=[person_id])
+
+        _LOGGER.info(
+            "Points transaction: %s %+d pts (%d -> %d) [%s]",
+            person_id,
+            amount,
+            old_balance,
+            new_balance,
+            staged["type"],
+        )
 
     def async_get_transactions(
         self,
@@ -381,21 +768,88 @@ class PeopleStore:
         Returns:
             List of transactions, newest first
         """
-        transactions_data = self._data.get("transactions", [])
-        transactions = [Transaction.from_dict(t) for t in transactions_data]
-
-        # Filter by person if specified
         if person_id:
-            transactions = [t for t in transactions if t.person_id == person_id]
+            transactions = self._view(
+                VIEW_TRANSACTIONS, "by_person", self._transactions_by_person
+            ).get(person_id, [])
+        else:
+            transactions = self._view(
+                VIEW_TRANSACTIONS, "newest_first", self._transactions_newest_first
+            )
+        return transactions[:limit] if limit else list(transactions)
+
+    async def async_query_transactions(
+        self,
+        person_id: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Transaction]:
+        """Page through the ledger, newest first.
+
+        With SQLite storage this is an indexed query on person_id; otherwise
+        the cached ledger view is sliced.
+
+        Args:
+            person_id: Filter by person (None = all)
+            limit: Max transactions to return (None = all)
+            offset: Transactions to skip
+
+        Returns:
+            List of transactions, newest first
+        """
+        if self._database is not None:
+            # Ledger rows are appended under the lock; read a settled ledger
+            async with self._lock:
+                rows = await self._database.async_query_transactions(
+                    person_id, limit, offset
+                )
+            return [Transaction.from_dict(row) for row in rows]
 
-        # Sort by timestamp descending (newest first)
-        transactions.sort(key=lambda t: t.timestamp, reverse=True)
+        transactions = self.async_get_transactions(person_id)
+        return transactions[offset : offset + limit if limit is not None else None]
 
-        # Apply limit
-        if limit:
-            transactions = transactions[:limit]
+    def _transactions_newest_first(self) -> list[Transaction]:
+        """Build the newest-first ledger view."""
+        transactions = self._typed_ledger(
+            self._data.get("transactions", []),
+            self._transaction_objs,
+            Transaction.from_dict,
+        )
+        # The ledger is appended in time order, so this is a near-linear sort
+        return sorted(transactions, key=lambda t: t.timestamp, reverse=True)
 
-        return transactions
+    def _transactions_by_person(self) -> dict[str, list[Transaction]]:
+        """Build the newest-first ledger view per person."""
+        by_person: dict[str, list[Transaction]] = {}
+        for transaction in self._view(
+            VIEW_TRANSACTIONS, "newest_first", self._transactions_newest_first
+        ):
+            by_person.setdefault(transaction.person_id, []).append(transaction)
+        return by_person
+
+    # ==================== Stats Methods ====================
+
+    def get_stats(self, person_id: str) -> dict[str, Any]:
+        """Get a person's rolling stats as of today (local time).
+
+        Returns:
+            Points and completions today, this week, over 7/30 days, the
+            30-day on-time rate and points of the last weeks
+        """
+        person = self._data.get("people", {}).get(person_id, {})
+        return RollingStats(person.get("stats") or {}).summary(dt_util.now().date())
+
+    def get_leaderboard(self) -> list[dict[str, Any]]:
+        """Get every person's stats, ranked by points this week."""
+        board = [
+            {"person_id": person_id, **self.get_stats(person_id)}
+            for person_id in self._data.get("people", {})
+        ]
+        board.sort(
+            key=lambda entry: (entry["points_this_week"], entry["points_30d"]),
+            reverse=True,
+        )
+        return board
 
     # ==================== Reward Methods ====================
 
@@ -436,9 +890,11 @@ class PeopleStore:
                     existing_reward = i
                     break
 
+            affected = {person_id}
             if existing_reward is not None:
                 # Update existing reward
                 reward = rewards[existing_reward]
+                affected.add(reward["person_id"])
                 reward["name"] = name
                 reward["cost"] = cost
                 reward["icon"] = icon
@@ -462,6 +918,7 @@ class PeopleStore:
                 rewards.append(reward)
                 _LOGGER.info("Created reward: %s (cost: %d pts)", name, cost)
 
+            self._mark_changed(VIEW_REWARDS, person_ids=affected)
             await self.async_save_rewards()
             return reward_id
 
@@ -494,6 +951,7 @@ class PeopleStore:
                         datetime.now(UTC).isoformat().replace("+00:00", "Z")
                     )
 
+                    self._mark_changed(VIEW_REWARDS, person_ids=[reward["person_id"]])
                     await self.async_save_rewards()
                     _LOGGER.info("Updated reward %s: %s", reward_id, updates)
                     return True
@@ -518,6 +976,10 @@ class PeopleStore:
             self._data["rewards"] = [r for r in rewards if r["id"] != reward_id]
 
             if len(self._data["rewards"]) < initial_count:
+                self._mark_changed(
+                    VIEW_REWARDS,
+                    person_ids=[r["person_id"] for r in rewards if r["id"] == reward_id],
+                )
                 await self.async_save_rewards()
                 _LOGGER.info("Deleted reward: %s", reward_id)
                 return True
@@ -532,18 +994,49 @@ class PeopleStore:
             enabled_only: Only return enabled rewards
 
         Returns:
-            List of rewards
+            List of rewards, cheapest first
         """
-        rewards_data = self._data.get("rewards", [])
-        rewards = [Reward.from_dict(r) for r in rewards_data]
-
         if enabled_only:
-            rewards = [r for r in rewards if r.enabled]
-
-        # Sort by cost ascending
+            return list(self._view(VIEW_REWARDS, "enabled", self._enabled_rewards))
+        return list(self._view(VIEW_REWARDS, "all", self._sorted_rewards))
+
+    def get_rewards(self, person_id: str) -> tuple[Reward, ...]:
+        """Get a person's rewards (enabled or not), cheapest first (cached)."""
+        return self._view(
+            VIEW_REWARDS, "by_person", self._rewards_by_person
+        ).get(person_id, ())
+
+    def get_enabled_rewards(self, person_id: str) -> tuple[Reward, ...]:
+        """Get a person's enabled rewards, cheapest first (cached)."""
+        return self._view(
+            VIEW_REWARDS, "enabled_by_person", self._enabled_rewards_by_person
+        ).get(person_id, ())
+
+    def _sorted_rewards(self) -> tuple[Reward, ...]:
+        """Build the rewards view, sorted by cost ascending."""
+        rewards = [Reward.from_dict(r) for r in self._data.get("rewards", [])]
         rewards.sort(key=lambda r: r.cost)
+        return tuple(rewards)
 
-        return rewards
+    def _enabled_rewards(self) -> tuple[Reward, ...]:
+        """Build the enabled rewards view."""
+        return tuple(
+            r for r in self._view(VIEW_REWARDS, "all", self._sorted_rewards) if r.enabled
+        )
+
+    def _rewards_by_person(self) -> dict[str, tuple[Reward, ...]]:
+        """Build the rewards view per person."""
+        by_person: dict[str, list[Reward]] = {}
+        for reward in self._view(VIEW_REWARDS, "all", self._sorted_rewards):
+            by_person.setdefault(reward.person_id, []).append(reward)
+        return {person_id: tuple(rewards) for person_id, rewards in by_person.items()}
+
+    def _enabled_rewards_by_person(self) -> dict[str, tuple[Reward, ...]]:
+        """Build the enabled rewards view per person."""
+        by_person: dict[str, list[Reward]] = {}
+        for reward in self._view(VIEW_REWARDS, "enabled", self._enabled_rewards):
+            by_person.setdefault(reward.person_id, []).append(reward)
+        return {person_id: tuple(rewards) for person_id, rewards in by_person.items()}
 
     async def async_redeem_reward(
         self,
@@ -616,6 +1109,7 @@ class PeopleStore:
                 "cost": cost,
             }
             redemptions.append(redemption)
+            self._mark_changed(VIEW_REDEMPTIONS, person_ids=[person_id])
 
             # Save only affected files for performance
             await self.async_save_people()
@@ -639,49 +1133,11 @@ class PeopleStore:
         metadata: dict[str, Any],
     ) -> str:
         """Internal method to add points when lock is already held."""
-        people = self._data.setdefault("people", {})
-        transactions = self._data.setdefault("transactions", [])
-
-        # Get or create person record
-        if person_id not in people:
-            now = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-            people[person_id] = {
-                "entity_id": person_id,
-                "points_balance": 0,
-                "lifetime_points": 0,
-                "last_updated": now,
-                "accent_color": "",
-            }
-
-        person = people[person_id]
-
-        # Update balance
-        old_balance = person["points_balance"]
-        new_balance = old_balance + amount
-        person["points_balance"] = new_balance
-
-        # Update lifetime points (only if positive amount)
-        if amount > 0:
-            person["lifetime_points"] += amount
-
-        # Update timestamp
-        now = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-        person["last_updated"] = now
-
-        # Create transaction record
-        transaction_id = f"txn_{uuid4().hex[:12]}"
-        transaction = {
-            "id": transaction_id,
-            "timestamp": now,
-            "person_id": person_id,
-            "amount": amount,
-            "balance_after": new_balance,
-            "type": transaction_type,
-            "metadata": metadata,
-        }
-        transactions.append(transaction)
-
-        return transaction_id
+        transaction = self.stage_transaction(
+            person_id, amount, transaction_type, metadata
+        )
+        self._apply_transaction_locked(transaction)
+        return transaction["id"]
 
     async def async_sync_people(self, person_entity_ids: list[str]) -> int:
         """Sync people records with HA person entities.
@@ -697,7 +1153,7 @@ class PeopleStore:
         async with self._lock:
             people = self._data.setdefault("people", {})
             now = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-            created_count = 0
+            created: list[str] = []
 
             for person_id in person_entity_ids:
                 if person_id not in people:
@@ -709,16 +1165,17 @@ class PeopleStore:
                         "last_updated": now,
                         "accent_color": "",
                     }
-                    created_count += 1
+                    created.append(person_id)
                     _LOGGER.info("Created person record: %s", person_id)
 
-            if created_count > 0:
+            if created:
+                self._mark_changed(VIEW_PEOPLE, person_ids=created)
                 await self.async_save_people()
-                _LOGGER.info("Synced %d new people records", created_count)
+                _LOGGER.info("Synced %d new people records", len(created))
             else:
                 _LOGGER.debug("All person entities already have records")
 
-            return created_count
+            return len(created)
 
     async def async_update_person_profile(
         self,
@@ -758,6 +1215,7 @@ class PeopleStore:
                 datetime.now(UTC).isoformat().replace("+00:00", "Z")
             )
 
+            self._mark_changed(VIEW_PEOPLE, person_ids=[person_id])
             await self.async_save_people()
             return True
 
@@ -775,18 +1233,26 @@ class PeopleStore:
         Returns:
             List of redemptions, newest first
         """
-        redemptions_data = self._data.get("redemptions", [])
-        redemptions = [Redemption.from_dict(r) for r in redemptions_data]
-
-        # Filter by person if specified
+        redemptions = self._view(
+            VIEW_REDEMPTIONS, "newest_first", self._redemptions_newest_first
+        )
         if person_id:
             redemptions = [r for r in redemptions if r.person_id == person_id]
+        return redemptions[:limit] if limit else list(redemptions)
+
+    def _redemptions_newest_first(self) -> list[Redemption]:
+        """Build the newest-first redemption history view."""
+        redemptions = self._typed_ledger(
+            self._data.get("redemptions", []),
+            self._redemption_objs,
+            Redemption.from_dict,
+        )
+        return sorted(redemptions, key=lambda r: r.timestamp, reverse=True)
 
-        # Sort by timestamp descending (newest first)
-        redemptions.sort(key=lambda r: r.timestamp, reverse=True)
-
-        # Apply limit
-        if limit:
-            redemptions = redemptions[:limit]
 
-        return redemptions
+def _local_day(timestamp: str) -> date:
+    """Return the local calendar day of an ISO timestamp."""
+    parsed = dt_util.parse_datetime(timestamp)
+    if parsed is None:
+        return dt_util.now().date()
+    return dt_util.as_local(parsed).date()
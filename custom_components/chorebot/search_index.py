@@ -0,0 +1,221 @@
+"""Full-text search index over ChoreBot tasks and archived history."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+import math
+import re
+from typing import Any
+
+from .task import Task
+
+# Field weights: a match in the summary counts more than one in the tags,
+# which counts more than one in the description
+WEIGHT_SUMMARY = 3.0
+WEIGHT_TAGS = 2.0
+WEIGHT_DESCRIPTION = 1.0
+# A query term matching only as a prefix ("gutt" -> "gutters") scores less
+PREFIX_FACTOR = 0.5
+
+_TOKEN_RE = re.compile(r"\w+")
+
+DocKey = tuple[str, str]  # (list_id, uid)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchDocument:
+    """What the index keeps of one task (no full Task objects)."""
+
+    list_id: str
+    uid: str
+    summary: str
+    tags: tuple[str, ...]
+    status: str
+    due: str | None
+    last_completed: str | None
+    when: str  # Time used by filters and recency: completion, due or modified
+    is_template: bool
+    archived: bool
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for API responses."""
+        return {
+            "list_id": self.list_id,
+            "uid": self.uid,
+            "summary": self.summary,
+            "tags": list(self.tags),
+            "status": self.status,
+            "due": self.due,
+            "last_completed": self.last_completed,
+            "is_template": self.is_template,
+            "archived": self.archived,
+        }
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Split text into lower-case word tokens."""
+    return _TOKEN_RE.findall(text.casefold()) if text else []
+
+
+class SearchIndex:
+    """Inverted index over summary, tags and description of tasks.
+
+    Postings map each token to the documents containing it, with the
+    summed field weights as term weight. Active tasks and archived
+    instances share the index; a document is keyed by (list_id, uid), so
+    archiving a task just replaces its document.
+
+    Query terms must all match (exactly, or as a prefix of an indexed
+    token via the sorted vocabulary). Matches are ranked by the sum of
+    term weight times inverse document frequency, then by recency.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._docs: dict[DocKey, SearchDocument] = {}
+        self._doc_terms: dict[DocKey, tuple[str, ...]] = {}
+        self._postings: dict[str, dict[DocKey, float]] = {}
+        self._vocabulary: list[str] = []  # Sorted keys of _postings
+
+    def __len__(self) -> int:
+        """Return the number of indexed documents."""
+        return len(self._docs)
+
+    def update(self, list_id: str, task: Task, archived: bool = False) -> None:
+        """Index (or re-index) a task; deleted tasks are removed."""
+        key = (list_id, task.uid)
+        self.remove(key)
+        if task.is_deleted():
+            return
+
+        weights: dict[str, float] = {}
+        for tokens, weight in (
+            (tokenize(task.summary), WEIGHT_SUMMARY),
+            ([tok for tag in task.tags for tok in tokenize(tag)], WEIGHT_TAGS),
+            (tokenize(task.description), WEIGHT_DESCRIPTION),
+        ):
+            for token in tokens:
+                weights[token] = weights.get(token, 0.0) + weight
+
+        self._docs[key] = SearchDocument(
+            list_id=list_id,
+            uid=task.uid,
+            summary=task.summary,
+            tags=tuple(task.tags),
+            status=task.status,
+            due=task.due,
+            last_completed=task.last_completed,
+            when=_normalize(task.last_completed or task.due or task.modified),
+            is_template=task.is_template,
+            archived=archived,
+        )
+        self._doc_terms[key] = tuple(weights)
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                insort(self._vocabulary, token)
+            postings[key] = weight
+
+    def remove(self, key: DocKey) -> None:
+        """Remove a document if indexed."""
+        if self._docs.pop(key, None) is None:
+            return
+        for token in self._doc_terms.pop(key, ()):
+            postings = self._postings[token]
+            del postings[key]
+            if not postings:
+                del self._postings[token]
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+
+    def remove_list(self, list_id: str) -> None:
+        """Remove every document of a list."""
+        for key in [key for key in self._docs if key[0] == list_id]:
+            self.remove(key)
+
+    def _matches(self, term: str) -> dict[DocKey, float]:
+        """Return the weighted documents matching a term or its prefix."""
+        scores: dict[DocKey, float] = {}
+        total = len(self._docs) or 1
+        index = bisect_left(self._vocabulary, term)
+        while index < len(self._vocabulary) and self._vocabulary[index].startswith(
+            term
+        ):
+            token = self._vocabulary[index]
+            postings = self._postings[token]
+            factor = math.log(1 + total / len(postings))
+            if token != term:
+                factor *= PREFIX_FACTOR
+            for key, weight in postings.items():
+                score = weight * factor
+                if score > scores.get(key, 0.0):
+                    scores[key] = score
+            index += 1
+        return scores
+
+    def search(
+        self,
+        query: str,
+        *,
+        list_ids: Iterable[str] | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        include_archived: bool = True,
+        sort: str = "relevance",
+    ) -> list[tuple[float, SearchDocument]]:
+        """Find the documents matching every term of a query.
+
+        Args:
+            query: Free text; every term must match
+            list_ids: Only search these lists
+            after: Only documents whose time is at or after this ISO timestamp
+            before: Only documents whose time is before this ISO timestamp
+            include_archived: Also search archived history
+            sort: "relevance" (score, then recency) or "recent"
+
+        Returns:
+            (score, document) pairs in ranked order
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        # Rarest term first: its match set bounds all the others
+        matches = sorted((self._matches(term) for term in terms), key=len)
+        scores = dict(matches[0])
+        for term_scores in matches[1:]:
+            scores = {
+                key: score + term_scores[key]
+                for key, score in scores.items()
+                if key in term_scores
+            }
+            if not scores:
+                return []
+
+        wanted_lists = set(list_ids) if list_ids is not None else None
+        after = _normalize(after) if after else None
+        before = _normalize(before) if before else None
+        results: list[tuple[float, SearchDocument]] = []
+        for key, score in scores.items():
+            doc = self._docs[key]
+            if (
+                (wanted_lists is not None and doc.list_id not in wanted_lists)
+                or (doc.archived and not include_archived)
+                or (after is not None and doc.when < after)
+                or (before is not None and doc.when >= before)
+            ):
+                continue
+            results.append((score, doc))
+
+        if sort == "recent":
+            results.sort(key=lambda item: (item[1].when, item[0]), reverse=True)
+        else:
+            results.sort(key=lambda item: (item[0], item[1].when), reverse=True)
+        return results
+
+
+def _normalize(timestamp: str) -> str:
+    """Normalize a UTC offset suffix so timestamps compare as strings."""
+    return timestamp.replace("+00:00", "Z")
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import date, datetime
 import logging
+from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import CONF_SLIM_ATTRIBUTES, DEFAULT_SLIM_ATTRIBUTES, DOMAIN
 from .people import PeopleStore
+from .sync_coordinator import SyncCoordinator
+from .sync_trace import SyncTracer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,44 +33,176 @@ async def async_setup_entry(
     people_store: PeopleStore = hass.data[DOMAIN]["people_store"]
     store = hass.data[DOMAIN]["store"]
 
-    # Create sensor entity
+    # Create sensor entity (its rewards/transactions are never recorded)
     sensor = ChoreBotPointsSensor(people_store, store)
     async_add_entities([sensor])
 
-    # Store sensor entity in hass.data for triggering updates
+    # Store sensor entity in hass.data (served by the chorebot/points websocket)
     hass.data[DOMAIN]["points_sensor"] = sensor
 
     _LOGGER.info("Sensor entity created: sensor.chorebot_points")
 
+    # One small sensor per person, so a change to one person writes only theirs
+    person_class = (
+        ChoreBotSlimPersonPointsSensor
+        if config_entry.options.get(CONF_SLIM_ATTRIBUTES, DEFAULT_SLIM_ATTRIBUTES)
+        else ChoreBotPersonPointsSensor
+    )
+    person_sensors: dict[str, ChoreBotPersonPointsSensor] = {
+        person_id: person_class(hass, people_store, person_id)
+        for person_id in people_store.async_get_all_people()
+    }
+    async_add_entities(person_sensors.values())
 
-class ChoreBotPointsSensor(SensorEntity):
-    """Sensor exposing points and rewards data."""
+    leaderboard = ChoreBotLeaderboardSensor(people_store)
+    async_add_entities([leaderboard])
+
+    @callback
+    def async_people_changed(person_ids: set[str]) -> None:
+        """Write the sensors of changed people; add sensors for new people.
+
+        Points changes write only the changed people's sensors. The summary
+        and leaderboard are written on the next loop tick (a burst of awards
+        re-renders them once); their heavy attributes are not recorded, so
+        those writes stay small in the recorder.
+        """
+        sensor.async_schedule_state_write()
+        leaderboard.async_schedule_state_write()
+        new_sensors = []
+        for person_id in person_ids:
+            if person_sensor := person_sensors.get(person_id):
+                person_sensor.async_schedule_state_write()
+            elif person_id in people_store.async_get_all_people():
+                person_sensor = person_sensors[person_id] = person_class(
+                    hass, people_store, person_id
+                )
+                new_sensors.append(person_sensor)
+        if new_sensors:
+            async_add_entities(new_sensors)
+
+    config_entry.async_on_unload(
+        people_store.async_add_listener(async_people_changed)
+    )
+
+    @callback
+    def async_day_changed(now: datetime) -> None:
+        """Roll the stats windows over at local midnight."""
+        leaderboard.async_schedule_state_write()
+        for person_sensor in person_sensors.values():
+            person_sensor.async_schedule_state_write()
+
+    config_entry.async_on_unload(
+        async_track_time_change(hass, async_day_changed, hour=0, minute=0, second=0)
+    )
+
+    # Diagnostic sensors for the adaptive sync schedule and sync run metrics
+    sync_coordinator: SyncCoordinator | None = hass.data[DOMAIN].get(
+        "sync_coordinator"
+    )
+    if sync_coordinator and sync_coordinator.enabled:
+        tracer: SyncTracer = hass.data[DOMAIN]["sync_tracer"]
+        async_add_entities(
+            [
+                ChoreBotSyncIntervalSensor(sync_coordinator),
+                ChoreBotSyncMetricsSensor(sync_coordinator, tracer),
+            ]
+        )
+        _LOGGER.info(
+            "Sensor entities created: sensor.chorebot_sync_interval, "
+            "sensor.chorebot_last_sync_duration"
+        )
+
+
+class _ScheduledWriteSensor(SensorEntity):
+    """Sensor whose state writes are coalesced to one per loop iteration."""
+
+    _state_write_handle: asyncio.Handle | None = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending state write when the entity is removed."""
+        if self._state_write_handle is not None:
+            self._state_write_handle.cancel()
+            self._state_write_handle = None
+
+    @callback
+    def async_schedule_state_write(self) -> None:
+        """Write the state soon (bursts of changes result in one write)."""
+        if self.hass is None or self._state_write_handle is not None:
+            return
+        self._state_write_handle = self.hass.loop.call_soon(
+            self._async_write_scheduled_state
+        )
+
+    @callback
+    def _async_write_scheduled_state(self) -> None:
+        """Write the state scheduled by async_schedule_state_write."""
+        self._state_write_handle = None
+        self.async_write_ha_state()
+
+
+class ChoreBotPointsSensor(_ScheduledWriteSensor):
+    """Sensor exposing points and rewards data.
+
+    Written after every points change, so only the counts are recorded; the
+    full data is in the state and the chorebot/points websocket.
+    """
 
     _attr_has_entity_name = False
     _attr_name = "ChoreBot Points"
     _attr_unique_id = f"{DOMAIN}_points_sensor"
+    _unrecorded_attributes = frozenset(
+        {"people", "rewards", "recent_transactions", "points_display"}
+    )
 
     def __init__(self, people_store: PeopleStore, store) -> None:
         """Initialize the sensor."""
         self._people_store = people_store
         self._store = store
+        # Renders cached per people store revision and points display
+        self._data_key: tuple[int, dict[str, str]] | None = None
+        self._data: dict[str, Any] = {}
+        self._attributes: dict[str, Any] | None = None
 
     @property
     def native_value(self) -> int:  # pyright: ignore[reportIncompatibleVariableOverride]
         """Return total points across all people."""
-        people = self._people_store.async_get_all_people()
-        return sum(p.points_balance for p in people.values())
+        return self._people_store.get_total_balance()
 
     @property
     def extra_state_attributes(self) -> dict:  # pyright: ignore[reportIncompatibleVariableOverride]
         """Return people balances, rewards, and transactions."""
+        data = self.points_data()
+        if self._attributes is None:
+            self._attributes = {
+                "people_count": len(data["people"]),
+                "reward_count": len(data["rewards"]),
+                "last_transaction_at": (
+                    data["recent_transactions"][0]["timestamp"]
+                    if data["recent_transactions"]
+                    else None
+                ),
+                **data,
+            }
+        return self._attributes
+
+    def points_data(self) -> dict:
+        """Return full points data (also served by the chorebot/points websocket).
+
+        Rebuilt only when the people store or the points display changed.
+        """
+        key = (self._people_store.revision, self._store.get_points_display())
+        if key != self._data_key:
+            self._data = self._build_points_data(key[1])
+            self._data_key = key
+            self._attributes = None
+        return self._data
+
+    def _build_points_data(self, points_display: dict[str, str]) -> dict[str, Any]:
+        """Serialize people, rewards and recent transactions."""
         people_data = self._people_store.async_get_all_people()
         rewards = self._people_store.async_get_all_rewards()
         transactions = self._people_store.async_get_transactions(limit=20)
 
-        # Get points display config from main store
-        points_display = self._store.get_points_display()
-
         return {
             "people": {
                 pid: {
@@ -100,3 +240,216 @@ class ChoreBotPointsSensor(SensorEntity):
             ],
             "points_display": points_display,
         }
+
+
+class ChoreBotPersonPointsSensor(_ScheduledWriteSensor):
+    """One person's balance, with their rewards and recent transactions."""
+
+    _attr_has_entity_name = False
+    _attr_icon = "mdi:star-circle"
+
+    def __init__(
+        self, hass: HomeAssistant, people_store: PeopleStore, person_id: str
+    ) -> None:
+        """Initialize the sensor."""
+        self._people_store = people_store
+        self._person_id = person_id
+        person_state = hass.states.get(person_id)
+        name = (
+            person_state.name
+            if person_state
+            else person_id.split(".", 1)[-1].replace("_", " ").title()
+        )
+        self._attr_name = f"ChoreBot Points {name}"
+        self._attr_unique_id = f"{DOMAIN}_points_{person_id}"
+        # Attributes cached per person revision and day (stats windows roll)
+        self._attributes_key: tuple[int, date] | None = None
+        self._attributes: dict[str, Any] = {}
+
+    @property
+    def native_value(self) -> int:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Return the person's points balance."""
+        return self._people_store.async_get_person_balance(self._person_id)
+
+    @property
+    def extra_state_attributes(self) -> dict:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Return the person's profile, rewards and recent transactions."""
+        key = (
+            self._people_store.get_person_revision(self._person_id),
+            dt_util.now().date(),
+        )
+        if key != self._attributes_key:
+            self._attributes = self._build_attributes()
+            self._attributes_key = key
+        return self._attributes
+
+    def _build_attributes(self) -> dict[str, Any]:
+        """Serialize the person's data."""
+        person = self._people_store.async_get_all_people().get(self._person_id)
+        return {
+            "person_id": self._person_id,
+            "lifetime_points": person.lifetime_points if person else 0,
+            "accent_color": person.accent_color if person else "",
+            "last_updated": person.last_updated if person else None,
+            "rewards": [
+                {
+                    "id": r.id,
+                    "name": r.name,
+                    "cost": r.cost,
+                    "icon": r.icon,
+                    "enabled": r.enabled,
+                    "description": r.description,
+                }
+                for r in self._people_store.get_rewards(self._person_id)
+            ],
+            "recent_transactions": [
+                {
+                    "id": t.id,
+                    "timestamp": t.timestamp,
+                    "amount": t.amount,
+                    "balance_after": t.balance_after,
+                    "type": t.type,
+                    "metadata": t.metadata,
+                }
+                for t in self._people_store.async_get_transactions(
+                    self._person_id, limit=10
+                )
+            ],
+            "stats": self._people_store.get_stats(self._person_id),
+        }
+
+
+class ChoreBotSlimPersonPointsSensor(ChoreBotPersonPointsSensor):
+    """Person points sensor whose rewards and transactions are not recorded."""
+
+    _unrecorded_attributes = frozenset({"rewards", "recent_transactions"})
+
+
+class ChoreBotLeaderboardSensor(_ScheduledWriteSensor):
+    """The person leading this week's points, with everyone's rolling stats."""
+
+    _attr_has_entity_name = False
+    _attr_name = "ChoreBot Leaderboard"
+    _attr_unique_id = f"{DOMAIN}_leaderboard_sensor"
+    _attr_icon = "mdi:podium"
+    # Rewritten on every points change; keep the ranking out of the recorder
+    _unrecorded_attributes = frozenset({"leaderboard"})
+
+    def __init__(self, people_store: PeopleStore) -> None:
+        """Initialize the sensor."""
+        self._people_store = people_store
+        # Ranking cached per people store revision and day
+        self._leaderboard_key: tuple[int, date] | None = None
+        self._leaderboard: list[dict[str, Any]] = []
+
+    def _ranking(self) -> list[dict[str, Any]]:
+        """Return the (cached) ranking."""
+        key = (self._people_store.revision, dt_util.now().date())
+        if key != self._leaderboard_key:
+            self._leaderboard = self._people_store.get_leaderboard()
+            self._leaderboard_key = key
+        return self._leaderboard
+
+    @property
+    def native_value(self) -> str | None:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Return the leader's person entity ID (None without points)."""
+        ranking = self._ranking()
+        if not ranking or ranking[0]["points_this_week"] <= 0:
+            return None
+        return ranking[0]["person_id"]
+
+    @property
+    def extra_state_attributes(self) -> dict:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Return everyone's stats, ranked by points this week."""
+        return {"leaderboard": self._ranking()}
+
+
+class ChoreBotSyncIntervalSensor(SensorEntity):
+    """Diagnostic sensor exposing the current adaptive sync interval."""
+
+    _attr_has_entity_name = False
+    _attr_name = "ChoreBot Sync Interval"
+    _attr_unique_id = f"{DOMAIN}_sync_interval_sensor"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_icon = "mdi:timer-sync-outline"
+    _attr_should_poll = False
+
+    def __init__(self, sync_coordinator: SyncCoordinator) -> None:
+        """Initialize the sensor."""
+        self._sync_coordinator = sync_coordinator
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to polling schedule changes."""
+        self.async_on_remove(
+            self._sync_coordinator.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> float | None:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Return the current polling interval in minutes."""
+        interval = self._sync_coordinator.poll_interval
+        if interval is None:
+            return None
+        return round(interval.total_seconds() / 60, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Return the next scheduled poll and last sync time."""
+        next_poll = self._sync_coordinator.next_poll
+        last_sync = self._sync_coordinator.last_sync_time
+        return {
+            "next_poll": (
+                next_poll.isoformat().replace("+00:00", "Z") if next_poll else None
+            ),
+            "last_sync": (
+                last_sync.isoformat().replace("+00:00", "Z") if last_sync else None
+            ),
+        }
+
+
+class ChoreBotSyncMetricsSensor(SensorEntity):
+    """Diagnostic sensor exposing per-run sync metrics and timing histograms."""
+
+    _attr_has_entity_name = False
+    _attr_name = "ChoreBot Last Sync Duration"
+    _attr_unique_id = f"{DOMAIN}_sync_metrics_sensor"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:chart-timeline-variant"
+    _attr_should_poll = False
+    # Histograms change every run; keep them out of the recorder database
+    _unrecorded_attributes = frozenset({"histograms", "lists"})
+
+    def __init__(self, sync_coordinator: SyncCoordinator, tracer: SyncTracer) -> None:
+        """Initialize the sensor."""
+        self._sync_coordinator = sync_coordinator
+        self._tracer = tracer
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh after every sync run."""
+        self.async_on_remove(
+            self._sync_coordinator.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> float | None:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Return the duration of the last sync run in milliseconds."""
+        last_run = self._tracer.last_run
+        return last_run["duration_ms"] if last_run else None
+
+    @property
+    def extra_state_attributes(self) -> dict:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Return the last run's stats, counters and phase timings."""
+        last_run = self._tracer.last_run or {}
+        return {
+            "started_at": last_run.get("started_at"),
+            "mode": last_run.get("mode"),
+            "stats": last_run.get("stats", {}),
+            "counters": last_run.get("counters", {}),
+            "phases": last_run.get("phases", {}),
+            "lists": last_run.get("lists", {}),
+            "histograms": self._tracer.histograms(),
+        }
@@ -0,0 +1,170 @@
+"""Rolling-window points and completion stats for ChoreBot people."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+# Day buckets cover the longest day window (30 days) plus slack; week
+# buckets cover a quarter
+DAY_BUCKETS = 35
+WEEK_BUCKETS = 13
+
+# Bucket layouts: [day ordinal, points, completions, on_time, with_due]
+# and [week ordinal, points, completions]
+_DAY, _POINTS, _COMPLETIONS, _ON_TIME, _WITH_DUE = range(5)
+
+
+def _week(day: int) -> int:
+    """Return the ordinal of the (Monday-based) week of a day ordinal."""
+    return (day - 1) // 7  # Ordinal 1 (0001-01-01) is a Monday
+
+
+class RollingStats:
+    """Day and week ring buffers of one person's points and completions.
+
+    Operates in place on the person's persisted ``stats`` dict, so updates
+    are saved with the people data and cost O(1): the slot of a day is its
+    ordinal modulo the buffer size, and a slot still holding an older day
+    is reset on first use. Updates for days older than the buffer are
+    dropped.
+
+    Reversals (uncompletes) only touch buckets that still hold the day they
+    reverse, and never for days before ``since`` (the first day the stats
+    counted anything), so taking back a completion the stats never saw
+    cannot drive a bucket negative.
+    """
+
+    __slots__ = ("_data", "_days", "_weeks")
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Wrap (and initialize, if missing or resized) a stats dict."""
+        if len(data.get("days", ())) != DAY_BUCKETS:
+            data["days"] = [[-1, 0, 0, 0, 0] for _ in range(DAY_BUCKETS)]
+            data.pop("since", None)
+        if len(data.get("weeks", ())) != WEEK_BUCKETS:
+            data["weeks"] = [[-1, 0, 0] for _ in range(WEEK_BUCKETS)]
+        if "since" not in data and (
+            used := [bucket[_DAY] for bucket in data["days"] if bucket[_DAY] >= 0]
+        ):
+            # Saved before "since" was kept: the oldest day still counted
+            data["since"] = min(used)
+        self._data = data
+        self._days: list[list[int]] = data["days"]
+        self._weeks: list[list[int]] = data["weeks"]
+
+    def _counted(self, ordinal: int) -> bool:
+        """Return whether the stats were already counting on a day."""
+        return ordinal >= self._data.get("since", ordinal + 1)
+
+    def _start(self, ordinal: int) -> None:
+        """Note the first day the stats count."""
+        if "since" not in self._data:
+            self._data["since"] = ordinal
+
+    @staticmethod
+    def _slot(buckets: list[list[int]], key: int) -> list[int] | None:
+        """Get the bucket of a key, resetting a slot that holds an older key."""
+        bucket = buckets[key % len(buckets)]
+        if bucket[0] == key:
+            return bucket
+        if bucket[0] > key:
+            return None  # Older than the buffer
+        bucket[0] = key
+        for field in range(1, len(bucket)):
+            bucket[field] = 0
+        return bucket
+
+    def add_points(self, day: date, amount: int) -> None:
+        """Add (or subtract) points on a day."""
+        ordinal = day.toordinal()
+        self._start(ordinal)
+        if (bucket := self._slot(self._days, ordinal)) is not None:
+            bucket[_POINTS] += amount
+        if (bucket := self._slot(self._weeks, _week(ordinal))) is not None:
+            bucket[_POINTS] += amount
+
+    def reverse_points(self, day: date, amount: int) -> None:
+        """Take points back out of the buckets of the day they were awarded."""
+        ordinal = day.toordinal()
+        if not self._counted(ordinal):
+            return
+        if (bucket := self._slot_value(self._days, ordinal)) is not None:
+            bucket[_POINTS] -= amount
+        if (bucket := self._slot_value(self._weeks, _week(ordinal))) is not None:
+            bucket[_POINTS] -= amount
+
+    def add_completion(self, day: date, on_time: bool | None, count: int = 1) -> None:
+        """Count a completion (or, with count=-1, an uncompletion) on a day.
+
+        Args:
+            day: Day of the completion
+            on_time: Whether it was on time; None for tasks without a due date
+            count: 1 to add, -1 to remove
+        """
+        ordinal = day.toordinal()
+        if count < 0:
+            self._remove_completion(ordinal, on_time, -count)
+            return
+        self._start(ordinal)
+        if (bucket := self._slot(self._days, ordinal)) is not None:
+            bucket[_COMPLETIONS] += count
+            if on_time is not None:
+                bucket[_WITH_DUE] += count
+                if on_time:
+                    bucket[_ON_TIME] += count
+        if (bucket := self._slot(self._weeks, _week(ordinal))) is not None:
+            bucket[_COMPLETIONS] += count
+
+    def _remove_completion(
+        self, ordinal: int, on_time: bool | None, count: int
+    ) -> None:
+        """Take completions back out of buckets that still hold their day."""
+        if not self._counted(ordinal):
+            return  # Completed before the stats started counting
+        if (bucket := self._slot_value(self._days, ordinal)) is not None:
+            bucket[_COMPLETIONS] = max(bucket[_COMPLETIONS] - count, 0)
+            if on_time is not None:
+                bucket[_WITH_DUE] = max(bucket[_WITH_DUE] - count, 0)
+                if on_time:
+                    bucket[_ON_TIME] = max(bucket[_ON_TIME] - count, 0)
+        if (bucket := self._slot_value(self._weeks, _week(ordinal))) is not None:
+            bucket[_COMPLETIONS] = max(bucket[_COMPLETIONS] - count, 0)
+
+    def _sum_days(self, today: int, days: int, field: int) -> int:
+        """Sum a field over the last ``days`` days (today included)."""
+        return sum(
+            bucket[field]
+            for bucket in self._days
+            if today - days < bucket[_DAY] <= today
+        )
+
+    def summary(self, today: date) -> dict[str, Any]:
+        """Return the rolling aggregates as of ``today``."""
+        ordinal = today.toordinal()
+        week = self._slot_value(self._weeks, _week(ordinal))
+        on_time = self._sum_days(ordinal, 30, _ON_TIME)
+        with_due = self._sum_days(ordinal, 30, _WITH_DUE)
+        return {
+            "points_today": self._sum_days(ordinal, 1, _POINTS),
+            "points_this_week": week[_POINTS] if week else 0,
+            "points_7d": self._sum_days(ordinal, 7, _POINTS),
+            "points_30d": self._sum_days(ordinal, 30, _POINTS),
+            "completions_today": self._sum_days(ordinal, 1, _COMPLETIONS),
+            "completions_this_week": week[_COMPLETIONS] if week else 0,
+            "completions_30d": self._sum_days(ordinal, 30, _COMPLETIONS),
+            "on_time_rate_30d": round(on_time / with_due, 3) if with_due else None,
+            "weekly_points": [
+                bucket[_POINTS] if bucket else 0
+                for bucket in (
+                    self._slot_value(self._weeks, _week(ordinal) - weeks_ago)
+                    for weeks_ago in range(WEEK_BUCKETS)
+                )
+            ],
+        }
+
+    @staticmethod
+    def _slot_value(buckets: list[list[int]], key: int) -> list[int] | None:
+        """Get the bucket of a key without modifying the buffer."""
+        bucket = buckets[key % len(buckets)]
+        return bucket if bucket[0] == key else None
@@ -3,28 +3,89 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime, timedelta
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from contextlib import AbstractContextManager, asynccontextmanager, nullcontext
+import copy
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
 import logging
+from types import MappingProxyType
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN, STORAGE_VERSION
+from .archive import ArchiveKey, ListArchive, archive_key
+from .const import DOMAIN, SIGNAL_LIST_ADDED, SIGNAL_LIST_REMOVED, STORAGE_VERSION
+from .database import META_TASKS_MIGRATED, META_TASKS_SOURCE, ChoreBotDatabase
+from .journal import (
+    JOURNAL_COMPACT_IDLE_SECONDS,
+    JOURNAL_COMPACT_RECORDS,
+    OP_METADATA,
+    OP_PUT,
+    OP_REMOVE,
+    OP_SECTIONS,
+    ListJournal,
+    apply_records,
+)
+from .search_index import SearchDocument, SearchIndex
+from .sync_trace import SyncTracer
 from .task import Task
+from .task_index import ListTaskIndex
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ListSnapshot:
+    """Consistent, read-only view of a list at one revision.
+
+    Task objects in a snapshot are committed versions: the store never
+    mutates them (writers work on copies and commit replacements), so a
+    snapshot can be read without locks or defensive copies. Do not mutate.
+    """
+
+    revision: int
+    tasks: Mapping[str, Task]  # Visible (non-deleted) tasks and instances
+    templates: Mapping[str, Task]  # Visible recurring templates
+    sections: tuple[dict[str, Any], ...]
+    metadata: Mapping[str, Any]
+    tags: tuple[str, ...]  # Sorted tags across visible tasks and templates
+
+
 class ChoreBotStore:
-    """Manages JSON storage for ChoreBot lists and tasks."""
+    """Manages JSON storage for ChoreBot lists and tasks.
+
+    Reads: ``get_list_snapshot`` returns an immutable view for rendering;
+    the ``get_task``/``get_tasks_for_list``/... getters return working
+    copies. Writes: mutate a copy, then commit it with ``async_update_task``
+    (or ``async_commit_tasks`` for several), or use ``async_edit_task`` for
+    a read-modify-write of the latest version under the list lock.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        journal_storage: bool = False,
+        database: ChoreBotDatabase | None = None,
+    ) -> None:
+        """Initialize the store.
 
-    def __init__(self, hass: HomeAssistant) -> None:
-        """Initialize the store."""
+        Args:
+            hass: Home Assistant instance
+            journal_storage: Append each change to a per-list journal instead
+                of rewriting the whole list document (see journal.py)
+            database: Keep tasks and archives in SQLite instead of the JSON
+                list documents (takes precedence over journal_storage)
+        """
         self.hass = hass
+        self._journal_storage = journal_storage and database is None
+        self._database = database
         self._config_store = Store(hass, STORAGE_VERSION, f"{DOMAIN}_config")
         self._task_stores: dict[str, Store] = {}
-        self._archive_stores: dict[str, Store] = {}
+        self._archives: dict[str, ListArchive] = {}  # JSON storage only
         self._config_data: dict[str, Any] = {}
         # New two-array structure: templates separate from tasks
         self._tasks_cache: dict[str, dict[str, dict[str, Task]]] = {}
@@ -32,11 +93,52 @@ class ChoreBotStore:
         self._sections_cache: dict[str, list[dict[str, Any]]] = {}
         # Metadata cache: list_id -> dict with person_id, etc.
         self._metadata_cache: dict[str, dict[str, Any]] = {}
-        self._lock = asyncio.Lock()
+        # Config lock guards the list registry and global config; each list has
+        # its own lock so work on one list never blocks another. When both are
+        # needed, take the config lock first.
+        self._config_lock = asyncio.Lock()
+        self._list_locks: dict[str, asyncio.Lock] = {}
+        # Set when sync is enabled so saves made during a sync run are timed
+        self.tracer: SyncTracer | None = None
+        # Per-list revision, bumped on every committed change
+        self._revisions: dict[str, int] = {}
+        # list_id -> callbacks(list_id, revision, changed_uids, structure_changed)
+        self._list_listeners: dict[
+            str, list[Callable[[str, int, set[str], bool], None]]
+        ] = {}
+        # Snapshot cache: list_id -> snapshot of the current revision
+        self._snapshots: dict[str, ListSnapshot] = {}
+        # Inverted indexes: list_id -> index (built on first use, then kept
+        # up to date with the UIDs of each commit)
+        self._indexes: dict[str, ListTaskIndex] = {}
+        # Full-text index of all lists (built on first search, then kept up
+        # to date like the list indexes); archives are added on first use
+        self._search_index: SearchIndex | None = None
+        self._search_archives_loaded = False
+        self._search_lock = asyncio.Lock()
+        # Journaled storage: per-list journal, last sequence number written,
+        # records not yet compacted, and pending idle-compaction timers
+        self._journals: dict[str, ListJournal] = {}
+        self._journal_seq: dict[str, int] = {}
+        self._journal_pending: dict[str, int] = {}
+        self._compact_timers: dict[str, CALLBACK_TYPE] = {}
+
+    def _list_lock(self, list_id: str) -> asyncio.Lock:
+        """Get (or create) the lock for a list."""
+        lock = self._list_locks.get(list_id)
+        if lock is None:
+            lock = self._list_locks[list_id] = asyncio.Lock()
+        return lock
+
+    def _trace_save(self, list_id: str | None = None) -> AbstractContextManager:
+        """Return a context manager timing a save as the "save" sync phase."""
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.phase("save", list_id)
 
     async def async_load(self) -> None:
         """Load configuration and task data."""
-        async with self._lock:
+        async with self._config_lock:
             # Load config (list registry)
             config_data = await self._config_store.async_load()
             if config_data is None:
@@ -44,10 +146,16 @@ class ChoreBotStore:
             else:
                 self._config_data = config_data
 
-            # Load tasks for each list
-            for list_config in self._config_data.get("lists", []):
-                list_id = list_config["id"]
-                await self._load_tasks_for_list(list_id)
+            if self._database is not None:
+                await self._async_import_to_database()
+
+            # Load tasks for all lists concurrently
+            await asyncio.gather(
+                *(
+                    self._load_tasks_for_list(list_config["id"])
+                    for list_config in self._config_data.get("lists", [])
+                )
+            )
 
     async def _load_tasks_for_list(self, list_id: str) -> None:
         """Load tasks for a specific list."""
@@ -55,13 +163,17 @@ class ChoreBotStore:
         store = Store(self.hass, STORAGE_VERSION, f"{DOMAIN}_list_{list_id}")
         self._task_stores[list_id] = store
 
-        # Initialize archive store with chorebot_list_ prefix
-        archive_store = Store(
-            self.hass, STORAGE_VERSION, f"{DOMAIN}_list_{list_id}_archive"
-        )
-        self._archive_stores[list_id] = archive_store
+        # Archive segments are stored with the chorebot_list_ prefix too
+        self._archives[list_id] = ListArchive(self.hass, list_id)
+
+        if self._database is not None:
+            task_data = await self._database.async_load_list(list_id)
+        else:
+            task_data = await self._async_load_json_document(list_id)
 
-        task_data = await store.async_load()
+        self._indexes.pop(list_id, None)
+        self._search_index = None
+        self._search_archives_loaded = False
         if task_data is None:
             self._tasks_cache[list_id] = {"templates": {}, "tasks": {}}
             self._sections_cache[list_id] = []
@@ -86,16 +198,102 @@ class ChoreBotStore:
             # Load metadata (person_id, etc.)
             self._metadata_cache[list_id] = metadata
 
+    async def _async_read_json_document(
+        self, list_id: str
+    ) -> tuple[dict[str, Any] | None, ListJournal, list[dict[str, Any]] | None]:
+        """Read a list's JSON document with its journal folded in (no writes).
+
+        Returns:
+            (document, journal, journaled records or None if there is no journal)
+        """
+        task_data = await self._task_stores[list_id].async_load()
+        journal = ListJournal(self.hass, f"{DOMAIN}_list_{list_id}")
+        records, journal_exists = await journal.async_read()
+        if not journal_exists:
+            return task_data, journal, None
+        task_data = task_data or {}
+        apply_records(task_data, records)
+        return task_data, journal, records
+
+    async def _async_load_json_document(self, list_id: str) -> dict[str, Any] | None:
+        """Load a list's JSON document, recovering any journaled changes."""
+        # Recover journaled changes (also when journaling has since been
+        # turned off) by folding them into the list document
+        task_data, journal, records = await self._async_read_json_document(list_id)
+        self._journals[list_id] = journal
+        if records is not None:
+            await self._task_stores[list_id].async_save(task_data)
+            await journal.async_truncate()
+            _LOGGER.info(
+                "Recovered %d journaled changes for list %s", len(records), list_id
+            )
+        self._journal_seq[list_id] = (task_data or {}).get("journal_seq", 0)
+        self._journal_pending[list_id] = 0
+        return task_data
+
+    async def _async_import_to_database(self) -> None:
+        """Import the JSON list files into SQLite (again if they have changed).
+
+        The first start with SQLite imports them. The import only reads: the
+        JSON files keep the state they had, so turning SQLite off returns to
+        it. A fingerprint of the files read is stored with the import; if it
+        no longer matches, JSON mode ran in between and the files are
+        imported again, replacing the SQLite list data.
+        """
+        assert self._database is not None
+        source = await self._database.async_storage_fingerprint([f"{DOMAIN}_list_"])
+        imported_from = await self._database.async_get_meta(META_TASKS_SOURCE)
+        if await self._database.async_get_meta(META_TASKS_MIGRATED):
+            if imported_from is None:
+                # Imported before fingerprints were stored: take the files as
+                # they are now
+                await self._database.async_set_meta(META_TASKS_SOURCE, source)
+                return
+            if imported_from == source:
+                return
+            _LOGGER.warning(
+                "The JSON list files changed since they were imported into SQLite"
+                " (JSON storage was used in between); importing them again"
+            )
+
+        lists: dict[str, tuple[dict[str, Any] | None, list[dict[str, Any]]]] = {}
+        for list_config in self._config_data.get("lists", []):
+            list_id = list_config["id"]
+            self._task_stores[list_id] = Store(
+                self.hass, STORAGE_VERSION, f"{DOMAIN}_list_{list_id}"
+            )
+            archived = await ListArchive(self.hass, list_id).async_read_all()
+            document, _, _ = await self._async_read_json_document(list_id)
+            lists[list_id] = (document, [task.to_dict() for task in archived])
+
+        await self._database.async_import_lists(lists, source)
+        _LOGGER.info("Imported %d lists from JSON storage into SQLite", len(lists))
+
     async def async_save_config(self) -> None:
-        """Save configuration data. Must be called with lock held."""
-        await self._config_store.async_save(self._config_data)
+        """Save configuration data. Must be called with the config lock held."""
+        with self._trace_save():
+            await self._config_store.async_save(self._config_data)
 
     async def async_save_tasks(self, list_id: str) -> None:
-        """Save tasks for a specific list. Must be called with lock held."""
+        """Save tasks for a specific list. Must be called with its list lock held."""
         if list_id not in self._task_stores:
             _LOGGER.error("Cannot save tasks for unknown list: %s", list_id)
             return
 
+        with self._trace_save(list_id):
+            if self._database is not None:
+                cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
+                await self._database.async_apply_records(
+                    list_id,
+                    self._change_records(
+                        list_id, [*cache["templates"], *cache["tasks"]], True
+                    ),
+                )
+            else:
+                await self._async_write_tasks(list_id)
+
+    async def _async_write_tasks(self, list_id: str) -> None:
+        """Merge cached tasks with soft-deleted ones on disk and write the list."""
         # Get cache for this list
         cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
 
@@ -135,8 +333,204 @@ class ChoreBotStore:
             "sections": sections,
             "metadata": metadata,
         }
+        if self._journal_storage:
+            data["journal_seq"] = self._journal_seq.get(list_id, 0)
         await store.async_save(data)
 
+    async def _async_commit(
+        self,
+        list_id: str,
+        uids: Iterable[str] = (),
+        structure_changed: bool = False,
+    ) -> None:
+        """Persist committed changes and notify listeners (list lock held).
+
+        Args:
+            list_id: The list ID
+            uids: Tasks/templates that were added, updated or removed
+            structure_changed: Whether sections or list metadata changed
+        """
+        uids = list(uids)
+        if self._database is not None:
+            if records := self._change_records(list_id, uids, structure_changed):
+                with self._trace_save(list_id):
+                    await self._database.async_apply_records(list_id, records)
+        elif self._journal_storage:
+            await self._async_journal_changes(list_id, uids, structure_changed)
+        else:
+            await self.async_save_tasks(list_id)
+        self._mark_changed(list_id, uids, structure_changed)
+
+    def _change_records(
+        self, list_id: str, uids: Iterable[str], structure_changed: bool
+    ) -> list[dict[str, Any]]:
+        """Describe a commit as change records (see journal.py)."""
+        cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
+        records: list[dict[str, Any]] = []
+        for uid in uids:
+            template = cache["templates"].get(uid)
+            task = template or cache["tasks"].get(uid)
+            if task is None:
+                records.append({"op": OP_REMOVE, "uid": uid})
+            else:
+                records.append(
+                    {
+                        "op": OP_PUT,
+                        "uid": uid,
+                        "template": template is not None,
+                        "data": task.to_dict(),
+                    }
+                )
+        if structure_changed:
+            records.append(
+                {"op": OP_SECTIONS, "data": self._sections_cache.get(list_id, [])}
+            )
+            records.append(
+                {"op": OP_METADATA, "data": self._metadata_cache.get(list_id, {})}
+            )
+        return records
+
+    # === Journaled Storage ===
+
+    async def _async_journal_changes(
+        self, list_id: str, uids: list[str], structure_changed: bool
+    ) -> None:
+        """Append change records for a commit to the list's journal."""
+        if list_id not in self._journals:
+            _LOGGER.error("Cannot save tasks for unknown list: %s", list_id)
+            return
+
+        seq = self._journal_seq.get(list_id, 0)
+        records = [
+            {"seq": seq + offset, **record}
+            for offset, record in enumerate(
+                self._change_records(list_id, uids, structure_changed), start=1
+            )
+        ]
+        if not records:
+            return
+        seq += len(records)
+
+        with self._trace_save(list_id):
+            await self._journals[list_id].async_append(records)
+        self._journal_seq[list_id] = seq
+        self._journal_pending[list_id] = (
+            self._journal_pending.get(list_id, 0) + len(records)
+        )
+
+        if self._journal_pending[list_id] >= JOURNAL_COMPACT_RECORDS:
+            self._schedule_compaction(list_id, 0)
+        else:
+            self._schedule_compaction(list_id, JOURNAL_COMPACT_IDLE_SECONDS)
+
+    @callback
+    def _schedule_compaction(self, list_id: str, delay: float) -> None:
+        """(Re)schedule a background compaction of a list's journal."""
+        if unsub := self._compact_timers.pop(list_id, None):
+            unsub()
+
+        async def _async_compact_later(_now: datetime) -> None:
+            self._compact_timers.pop(list_id, None)
+            await self.async_compact(list_id)
+
+        self._compact_timers[list_id] = async_call_later(
+            self.hass, delay, _async_compact_later
+        )
+
+    async def async_compact(self, list_id: str) -> None:
+        """Fold a list's journal into its document and truncate the journal."""
+        async with self._list_lock(list_id):
+            await self._async_compact_locked(list_id)
+
+    async def _async_compact_locked(self, list_id: str) -> None:
+        """Compact a list's journal. Must be called with its list lock held."""
+        journal = self._journals.get(list_id)
+        if journal is None or not self._journal_pending.get(list_id):
+            return
+
+        with self._trace_save(list_id):
+            store = self._task_stores[list_id]
+            document = await store.async_load() or {}
+            records, _ = await journal.async_read()
+            apply_records(document, records)
+            # Write the document before truncating: if we crash in between,
+            # replay skips the records it already contains (journal_seq)
+            await store.async_save(document)
+            await journal.async_truncate()
+
+        _LOGGER.debug(
+            "Compacted %d journal records for list %s",
+            self._journal_pending[list_id],
+            list_id,
+        )
+        self._journal_pending[list_id] = 0
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending compactions and fold all journals (on unload)."""
+        for unsub in self._compact_timers.values():
+            unsub()
+        self._compact_timers.clear()
+        for list_id in list(self._journals):
+            await self.async_compact(list_id)
+
+    # === Change Tracking ===
+
+    def get_revision(self, list_id: str) -> int:
+        """Get the current revision of a list (bumped on every change)."""
+        return self._revisions.get(list_id, 0)
+
+    @callback
+    def async_add_list_listener(
+        self,
+        list_id: str,
+        listener: Callable[[str, int, set[str], bool], None],
+    ) -> CALLBACK_TYPE:
+        """Listen for committed changes to a list.
+
+        The listener is called with (list_id, revision, changed_uids,
+        structure_changed). Changed UIDs cover added, updated and removed
+        tasks/templates; structure_changed means sections or list metadata
+        changed.
+
+        Returns:
+            Callback that removes the listener.
+        """
+        self._list_listeners.setdefault(list_id, []).append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            listeners = self._list_listeners.get(list_id, [])
+            if listener in listeners:
+                listeners.remove(listener)
+
+        return remove_listener
+
+    def _mark_changed(
+        self,
+        list_id: str,
+        uids: Iterable[str] = (),
+        structure_changed: bool = False,
+    ) -> None:
+        """Bump a list's revision and notify its listeners."""
+        revision = self._revisions.get(list_id, 0) + 1
+        self._revisions[list_id] = revision
+        self._snapshots.pop(list_id, None)
+        changed_uids = set(uids)
+        index = self._indexes.get(list_id)
+        if index is not None or self._search_index is not None:
+            cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
+            for uid in changed_uids:
+                task = cache["templates"].get(uid) or cache["tasks"].get(uid)
+                if index is not None:
+                    index.update(uid, task)
+                if self._search_index is not None:
+                    if task is None:
+                        self._search_index.remove((list_id, uid))
+                    else:
+                        self._search_index.update(list_id, task)
+        for listener in list(self._list_listeners.get(list_id, [])):
+            listener(list_id, revision, changed_uids, structure_changed)
+
     def get_all_lists(self) -> list[dict[str, Any]]:
         """Get all list configurations."""
         return self._config_data.get("lists", [])
@@ -182,40 +576,45 @@ class ChoreBotStore:
         Returns:
             bool: True if successful, False if list not found
         """
-        async with self._lock:
-            # Check if list exists
-            list_exists = any(
-                config["id"] == list_id for config in self._config_data.get("lists", [])
-            )
-            if not list_exists:
-                return False
+        # Check if list exists
+        list_exists = any(
+            config["id"] == list_id for config in self._config_data.get("lists", [])
+        )
+        if not list_exists:
+            return False
 
-            # Split updates into global config vs list-specific metadata
-            global_updates = {}
-            metadata_updates = {}
+        # Split updates into global config vs list-specific metadata
+        global_updates = {}
+        metadata_updates = {}
 
-            for key, value in updates.items():
-                if key in ("name", "sync"):
-                    global_updates[key] = value
-                elif key == "person_id":
-                    metadata_updates[key] = value
+        for key, value in updates.items():
+            if key in ("name", "sync"):
+                global_updates[key] = value
+            elif key == "person_id":
+                metadata_updates[key] = value
 
-            # Update global config if needed
-            if global_updates:
+        # Update global config if needed
+        if global_updates:
+            async with self._config_lock:
                 for list_config in self._config_data.get("lists", []):
                     if list_config["id"] == list_id:
                         list_config.update(global_updates)
                         await self.async_save_config()
                         break
 
-            # Update list-specific metadata if needed
-            if metadata_updates:
+        # Update list-specific metadata if needed
+        if metadata_updates:
+            async with self._list_lock(list_id):
                 if list_id not in self._metadata_cache:
                     self._metadata_cache[list_id] = {}
                 self._metadata_cache[list_id].update(metadata_updates)
-                await self.async_save_tasks(list_id)
+                await self._async_commit(list_id, structure_changed=True)
+
+        return True
 
-            return True
+    def get_list_metadata(self, list_id: str) -> dict[str, Any]:
+        """Get list-specific metadata (person_id, etc.)."""
+        return self._metadata_cache.get(list_id, {})
 
     def get_list_sync_info(self, list_id: str, backend: str) -> dict[str, Any] | None:
         """Get sync information for a list and backend.
@@ -257,16 +656,42 @@ class ChoreBotStore:
         list_config["sync"][backend] = sync_info
 
         # Save config
-        async with self._lock:
+        async with self._config_lock:
             await self.async_save_config()
 
         return True
 
+    def get_backend_sync_state(self, backend: str) -> dict[str, Any]:
+        """Get account-level sync state for a backend (e.g., delta checkpoint).
+
+        Args:
+            backend: The backend name (e.g., "ticktick")
+
+        Returns:
+            dict with backend sync state (empty if none stored)
+        """
+        return self._config_data.get("sync_state", {}).get(backend, {})
+
+    async def async_set_backend_sync_state(
+        self, backend: str, state: dict[str, Any]
+    ) -> None:
+        """Set account-level sync state for a backend.
+
+        Args:
+            backend: The backend name (e.g., "ticktick")
+            state: Dict with checkpoint, etc.
+        """
+        async with self._config_lock:
+            self._config_data.setdefault("sync_state", {})[backend] = state
+            await self.async_save_config()
+
     async def async_create_list(
         self, list_id: str, name: str, **kwargs: Any
     ) -> dict[str, Any]:
         """Create a new list.
 
+        The todo platform adds the list's entity when SIGNAL_LIST_ADDED is sent.
+
         Args:
             list_id: The list ID
             name: The list name
@@ -274,7 +699,7 @@ class ChoreBotStore:
                 - "sync": saved to global config
                 - "person_id": saved to list-specific metadata
         """
-        async with self._lock:
+        async with self._config_lock, self._list_lock(list_id):
             # Separate person_id from other kwargs
             person_id = kwargs.pop("person_id", None)
 
@@ -296,11 +721,12 @@ class ChoreBotStore:
             # Create the storage file immediately with empty tasks (and metadata)
             await self.async_save_tasks(list_id)
 
-            return list_config
+        async_dispatcher_send(self.hass, SIGNAL_LIST_ADDED, list_id)
+        return list_config
 
     async def async_delete_list(self, list_id: str) -> None:
-        """Delete a list."""
-        async with self._lock:
+        """Delete a list (its entity is removed via SIGNAL_LIST_REMOVED)."""
+        async with self._config_lock, self._list_lock(list_id):
             self._config_data["lists"] = [
                 lst
                 for lst in self._config_data.get("lists", [])
@@ -313,89 +739,343 @@ class ChoreBotStore:
             self._sections_cache.pop(list_id, None)
             self._metadata_cache.pop(list_id, None)
             self._task_stores.pop(list_id, None)
+            self._revisions.pop(list_id, None)
+            if unsub := self._compact_timers.pop(list_id, None):
+                unsub()
+            if journal := self._journals.pop(list_id, None):
+                await journal.async_truncate()
+            if self._database is not None:
+                await self._database.async_delete_list(list_id)
+            self._journal_seq.pop(list_id, None)
+            self._journal_pending.pop(list_id, None)
+            self._snapshots.pop(list_id, None)
+            self._indexes.pop(list_id, None)
+            if self._search_index is not None:
+                self._search_index.remove_list(list_id)
+        self._list_locks.pop(list_id, None)
+
+        async_dispatcher_send(self.hass, SIGNAL_LIST_REMOVED, list_id)
+
+    def get_list_snapshot(self, list_id: str) -> ListSnapshot:
+        """Get a consistent read-only view of a list (cached per revision)."""
+        snapshot = self._snapshots.get(list_id)
+        if snapshot is not None:
+            return snapshot
+
+        cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
+        tasks = {uid: t for uid, t in cache["tasks"].items() if not t.is_deleted()}
+        templates = {
+            uid: t for uid, t in cache["templates"].items() if not t.is_deleted()
+        }
+        snapshot = ListSnapshot(
+            revision=self._revisions.get(list_id, 0),
+            tasks=MappingProxyType(tasks),
+            templates=MappingProxyType(templates),
+            sections=tuple(
+                copy.deepcopy(self._sections_cache.get(list_id, []))
+            ),
+            metadata=MappingProxyType(
+                copy.deepcopy(self._metadata_cache.get(list_id, {}))
+            ),
+            tags=tuple(self._task_index(list_id).tags()),
+        )
+        self._snapshots[list_id] = snapshot
+        return snapshot
+
+    def _task_index(self, list_id: str) -> ListTaskIndex:
+        """Get (or build) the inverted index of a list."""
+        index = self._indexes.get(list_id)
+        if index is None:
+            cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
+            index = self._indexes[list_id] = ListTaskIndex.build(
+                (*cache["templates"].values(), *cache["tasks"].values())
+            )
+        return index
+
+    def get_overdue_count(self, list_id: str, now: datetime | None = None) -> int:
+        """Return the number of open tasks of a list that are overdue."""
+        return self._task_index(list_id).overdue_count(now or datetime.now(UTC))
+
+    def query_tasks(
+        self,
+        list_id: str,
+        *,
+        tags: Iterable[str] | None = None,
+        section_id: str | None = None,
+        status: str | None = None,
+        due_after: date | None = None,
+        due_before: date | None = None,
+        include_templates: bool = False,
+    ) -> list[Task]:
+        """Find tasks by combining the list's inverted indexes.
+
+        Filters are combined with AND. Results are committed versions (as in
+        a snapshot; do not mutate), ordered by due date (undated last), then
+        summary.
+
+        Args:
+            list_id: The list ID
+            tags: Tags that must all be present
+            section_id: Section the task must be in
+            status: Task status ("needs_action" or "completed")
+            due_after: First due day (UTC, inclusive)
+            due_before: Last due day (UTC, inclusive)
+            include_templates: Also return recurring templates
+
+        Returns:
+            Matching tasks
+        """
+        uids = self._task_index(list_id).query(
+            tags=tags,
+            section_id=section_id,
+            status=status,
+            due_after=due_after,
+            due_before=due_before,
+            include_templates=include_templates,
+        )
+        snapshot = self.get_list_snapshot(list_id)
+        tasks = [
+            task
+            for uid in uids
+            if (task := snapshot.tasks.get(uid) or snapshot.templates.get(uid))
+        ]
+        tasks.sort(key=lambda t: (t.due is None, t.due or "", t.summary, t.uid))
+        return tasks
+
+    async def async_search(
+        self,
+        query: str,
+        *,
+        list_ids: Iterable[str] | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        include_archived: bool = True,
+        sort: str = "relevance",
+    ) -> list[tuple[float, SearchDocument]]:
+        """Full-text search over tasks, templates and archived instances.
+
+        Args:
+            query: Free text; every term must match summary, tags or
+                description (the last characters of a term may be missing)
+            list_ids: Only search these lists (default: all)
+            after: Only tasks completed/due/modified at or after this ISO time
+            before: Only tasks completed/due/modified before this ISO time
+            include_archived: Also search archived history
+            sort: "relevance" or "recent"
+
+        Returns:
+            (score, document) pairs in ranked order
+        """
+        index = self._search_index
+        if index is None:
+            index = self._search_index = SearchIndex()
+            for list_id, cache in self._tasks_cache.items():
+                for task in (*cache["templates"].values(), *cache["tasks"].values()):
+                    index.update(list_id, task)
+
+        if include_archived and not self._search_archives_loaded:
+            async with self._search_lock:
+                if not self._search_archives_loaded:
+                    for list_id in list(self._tasks_cache):
+                        for task in await self._async_load_archive(list_id):
+                            index.update(list_id, task, archived=True)
+                    # The index may have been dropped (list reload) meanwhile
+                    self._search_archives_loaded = index is self._search_index
+
+        return index.search(
+            query,
+            list_ids=list_ids,
+            after=after,
+            before=before,
+            include_archived=include_archived,
+            sort=sort,
+        )
+
+    async def async_get_archived_tasks(self, list_id: str) -> list[Task]:
+        """Get all archived instances of a list (reads the whole archive)."""
+        return await self._async_load_archive(list_id)
+
+    async def _async_load_archive(self, list_id: str) -> list[Task]:
+        """Load the archived instances of a list."""
+        if self._database is not None:
+            return [
+                Task.from_dict(data)
+                for data in await self._database.async_query_tasks(
+                    list_id, archived=True
+                )
+            ]
+        archive = self._archives.get(list_id)
+        return await archive.async_load_all() if archive else []
 
     def get_tasks_for_list(self, list_id: str) -> list[Task]:
-        """Get all active (non-deleted) tasks for a list (not including templates)."""
+        """Get working copies of all tasks for a list (not including templates)."""
         cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
-        return list(cache["tasks"].values())
+        return [task.copy() for task in cache["tasks"].values()]
 
     def get_templates_for_list(self, list_id: str) -> list[Task]:
-        """Get all recurring task templates for a list."""
+        """Get working copies of all recurring task templates for a list."""
         cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
-        return list(cache["templates"].values())
+        return [template.copy() for template in cache["templates"].values()]
 
     def get_task(self, list_id: str, task_uid: str) -> Task | None:
-        """Get a specific task by UID (not template)."""
+        """Get a working copy of a specific task by UID (not template)."""
         cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
-        return cache["tasks"].get(task_uid)
+        task = cache["tasks"].get(task_uid)
+        return task.copy() if task else None
 
     async def async_add_task(self, list_id: str, task: Task) -> None:
         """Add a new task or template to a list."""
-        async with self._lock:
+        async with self._list_lock(list_id):
             if list_id not in self._tasks_cache:
                 _LOGGER.error("Cannot add task to unknown list: %s", list_id)
                 return
 
             cache = self._tasks_cache[list_id]
 
-            # Route to correct cache based on type
+            # Route to correct cache based on type (commit a copy so later
+            # changes to the caller's object stay invisible until committed)
             if task.is_recurring_template():
-                cache["templates"][task.uid] = task
+                cache["templates"][task.uid] = task.copy()
             else:
-                cache["tasks"][task.uid] = task
+                cache["tasks"][task.uid] = task.copy()
 
-            await self.async_save_tasks(list_id)
+            await self._async_commit(list_id, [task.uid])
 
     async def async_update_task(self, list_id: str, task: Task) -> None:
-        """Update an existing task or template."""
-        async with self._lock:
+        """Commit a modified task or template."""
+        await self.async_commit_tasks(list_id, [task])
+
+    async def async_commit_tasks(self, list_id: str, tasks: Iterable[Task]) -> None:
+        """Commit several modified tasks/templates of one list with a single save.
+
+        Args:
+            list_id: The list ID
+            tasks: Working copies to commit (must already exist in the list)
+        """
+        async with self._list_lock(list_id):
             if list_id not in self._tasks_cache:
                 _LOGGER.error("Cannot update task in unknown list: %s", list_id)
                 return
 
+            committed = [
+                task.uid for task in tasks if self._replace_cached(list_id, task)
+            ]
+            if committed:
+                await self._async_commit(list_id, committed)
+
+    async def async_put_tasks(self, list_id: str, tasks: Iterable[Task]) -> None:
+        """Add or replace several tasks/templates of one list with a single save.
+
+        Args:
+            list_id: The list ID
+            tasks: Tasks to write (new or existing)
+        """
+        async with self._list_lock(list_id):
+            if list_id not in self._tasks_cache:
+                _LOGGER.error("Cannot write tasks to unknown list: %s", list_id)
+                return
+
             cache = self._tasks_cache[list_id]
+            uids = []
+            for task in tasks:
+                bucket = "templates" if task.is_recurring_template() else "tasks"
+                cache[bucket][task.uid] = task.copy()
+                uids.append(task.uid)
+            if uids:
+                await self._async_commit(list_id, uids)
+
+    @asynccontextmanager
+    async def async_edit_task(
+        self, list_id: str, task_uid: str
+    ) -> AsyncIterator[Task | None]:
+        """Read-modify-write the latest version of a task or template.
 
-            # Route to correct cache based on type
-            if task.is_recurring_template():
-                if task.uid in cache["templates"]:
-                    cache["templates"][task.uid] = task
-                    await self.async_save_tasks(list_id)
-                else:
-                    _LOGGER.warning(
-                        "Template %s not found in list %s for update", task.uid, list_id
-                    )
-            elif task.uid in cache["tasks"]:
-                cache["tasks"][task.uid] = task
-                await self.async_save_tasks(list_id)
-            else:
-                _LOGGER.warning(
-                    "Task %s not found in list %s for update", task.uid, list_id
-                )
+        Yields a working copy (None if the UID is unknown) while holding the
+        list lock, and commits it when the block exits without an exception.
+        Do not call other store writers for the same list inside the block.
+
+        Args:
+            list_id: The list ID
+            task_uid: UID of the task or template to edit
+        """
+        async with self._list_lock(list_id):
+            cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
+            current = cache["templates"].get(task_uid) or cache["tasks"].get(task_uid)
+            working = current.copy() if current else None
+
+            yield working
+
+            if working is not None and self._replace_cached(list_id, working):
+                await self._async_commit(list_id, [task_uid])
+
+    @asynccontextmanager
+    async def async_edit_tasks(
+        self, list_id: str, task_uids: Iterable[str]
+    ) -> AsyncIterator[dict[str, Task]]:
+        """Read-modify-write the latest versions of several tasks/templates.
+
+        Like async_edit_task, but yields working copies keyed by UID (unknown
+        UIDs are left out) and commits all of them with a single save. Tasks
+        added to the dict under a new UID are created.
+
+        Args:
+            list_id: The list ID
+            task_uids: UIDs of the tasks or templates to edit
+        """
+        async with self._list_lock(list_id):
+            cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
+            working: dict[str, Task] = {}
+            for uid in task_uids:
+                current = cache["templates"].get(uid) or cache["tasks"].get(uid)
+                if current:
+                    working[uid] = current.copy()
+            existing = set(working)
+
+            yield working
+
+            committed = []
+            for uid, task in working.items():
+                if uid in existing:
+                    if self._replace_cached(list_id, task):
+                        committed.append(uid)
+                elif list_id in self._tasks_cache:
+                    bucket = "templates" if task.is_recurring_template() else "tasks"
+                    cache[bucket][uid] = task.copy()
+                    committed.append(uid)
+            if committed:
+                await self._async_commit(list_id, committed)
+
+    def _replace_cached(self, list_id: str, task: Task) -> bool:
+        """Replace a cached task/template with a copy of ``task`` (lock held)."""
+        cache = self._tasks_cache[list_id]
+        bucket = "templates" if task.is_recurring_template() else "tasks"
+        if task.uid not in cache[bucket]:
+            _LOGGER.warning(
+                "%s %s not found in list %s for update",
+                "Template" if bucket == "templates" else "Task",
+                task.uid,
+                list_id,
+            )
+            return False
+        cache[bucket][task.uid] = task.copy()
+        return True
 
     async def async_delete_task(self, list_id: str, task_uid: str) -> None:
-        """Soft delete a task or template (set deleted_at timestamp)."""
-        async with self._lock:
+        """Delete a task or template (dropped from the cache and from storage)."""
+        async with self._list_lock(list_id):
             if list_id not in self._tasks_cache:
                 _LOGGER.error("Cannot delete task from unknown list: %s", list_id)
                 return
 
             cache = self._tasks_cache[list_id]
 
-            # Check templates first
-            if task_uid in cache["templates"]:
-                template = cache["templates"][task_uid]
-                template.mark_deleted()
-                del cache["templates"][task_uid]
-                await self.async_save_tasks(list_id)
-                return
-
-            # Then check tasks
-            if task_uid in cache["tasks"]:
-                task = cache["tasks"][task_uid]
-                task.mark_deleted()
-                del cache["tasks"][task_uid]
-                await self.async_save_tasks(list_id)
-                return
+            # Check templates first, then tasks. Committed objects are never
+            # mutated (snapshots may hold them), so they are only removed.
+            for bucket in ("templates", "tasks"):
+                if task_uid in cache[bucket]:
+                    del cache[bucket][task_uid]
+                    await self._async_commit(list_id, [task_uid])
+                    return
 
             _LOGGER.warning(
                 "Task %s not found in list %s for deletion", task_uid, list_id
@@ -420,7 +1100,7 @@ class ChoreBotStore:
         Returns:
             list[str]: List of all deleted UIDs (for sync purposes)
         """
-        async with self._lock:
+        async with self._list_lock(list_id):
             if list_id not in self._tasks_cache:
                 _LOGGER.error(
                     "Cannot delete recurring task from unknown list: %s", list_id
@@ -451,9 +1131,8 @@ class ChoreBotStore:
                         "Task %s is not a recurring task, falling back to regular delete",
                         task_uid,
                     )
-                    task.mark_deleted()
                     del cache["tasks"][task_uid]
-                    await self.async_save_tasks(list_id)
+                    await self._async_commit(list_id, [task_uid])
                     return [task_uid]
             else:
                 _LOGGER.error("Task %s not found in list %s", task_uid, list_id)
@@ -470,9 +1149,8 @@ class ChoreBotStore:
                 # Fallback: just delete the orphaned instance (inline logic, we already hold lock)
                 if task_uid in cache["tasks"]:
                     task = cache["tasks"][task_uid]
-                    task.mark_deleted()
                     del cache["tasks"][task_uid]
-                    await self.async_save_tasks(list_id)
+                    await self._async_commit(list_id, [task_uid])
                     return [task_uid]
                 else:
                     _LOGGER.error(
@@ -501,7 +1179,6 @@ class ChoreBotStore:
                         instance.uid,
                         instance.status,
                     )
-                    instance.mark_deleted()
                     del cache["tasks"][instance.uid]
                     deleted_uids.append(instance.uid)
                 else:
@@ -513,8 +1190,6 @@ class ChoreBotStore:
                     )
 
             # Delete the template
-            template = cache["templates"][template_uid]
-            template.mark_deleted()
             del cache["templates"][template_uid]
             deleted_uids.append(template_uid)
 
@@ -525,7 +1200,7 @@ class ChoreBotStore:
             )
 
             # Save changes
-            await self.async_save_tasks(list_id)
+            await self._async_commit(list_id, deleted_uids)
 
             return deleted_uids
 
@@ -544,13 +1219,16 @@ class ChoreBotStore:
     def get_template(self, list_id: str, uid: str) -> Task | None:
         """Get a template task by UID."""
         cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
-        return cache["templates"].get(uid)
+        template = cache["templates"].get(uid)
+        return template.copy() if template else None
 
     def get_instances_for_template(self, list_id: str, parent_uid: str) -> list[Task]:
         """Get all instances for a template."""
         cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
         return [
-            task for task in cache["tasks"].values() if task.parent_uid == parent_uid
+            task.copy()
+            for task in cache["tasks"].values()
+            if task.parent_uid == parent_uid
         ]
 
     async def async_get_all_recurring_templates(self) -> list[tuple[str, Task]]:
@@ -564,7 +1242,7 @@ class ChoreBotStore:
 
     async def async_archive_old_instances(self, list_id: str, days: int = 30) -> int:
         """Archive instances completed more than N days ago. Returns count archived."""
-        async with self._lock:
+        async with self._list_lock(list_id):
             if list_id not in self._task_stores:
                 _LOGGER.error("Cannot archive for unknown list: %s", list_id)
                 return 0
@@ -573,7 +1251,12 @@ class ChoreBotStore:
             cutoff = datetime.now(UTC) - timedelta(days=days)
             cutoff_str = cutoff.isoformat().replace("+00:00", "Z")
 
-            # Load all tasks from storage (including completed instances)
+            if self._database is not None:
+                return await self._async_archive_in_database(list_id, cutoff_str)
+
+            # Load all tasks from storage (including completed instances);
+            # fold pending journaled changes in first so the document is current
+            await self._async_compact_locked(list_id)
             store = self._task_stores[list_id]
             task_data = await store.async_load()
             if task_data is None:
@@ -604,24 +1287,159 @@ class ChoreBotStore:
                 cache["tasks"].pop(task.uid, None)
 
             # Save remaining tasks
-            await self.async_save_tasks(list_id)
+            await self._async_commit(list_id, [task.uid for task in to_archive])
 
-            # Append to archive
-            archive_store = self._archive_stores[list_id]
-            archive_data = await archive_store.async_load()
-            if archive_data is None:
-                archived_tasks = []
-            else:
-                archived_tasks = [
-                    Task.from_dict(t) for t in archive_data.get("tasks", [])
-                ]
+            # Append to archive (only the affected monthly segments)
+            await self._archives[list_id].async_append(to_archive)
 
-            archived_tasks.extend(to_archive)
-            archive_data = {"tasks": [t.to_dict() for t in archived_tasks]}
-            await archive_store.async_save(archive_data)
+            if self._search_index is not None:
+                for task in to_archive:
+                    self._search_index.update(list_id, task, archived=True)
 
             return len(to_archive)
 
+    async def _async_archive_in_database(self, list_id: str, cutoff: str) -> int:
+        """Archive old instances by flagging their rows (list lock held)."""
+        assert self._database is not None
+        archived_uids = await self._database.async_archive_instances(list_id, cutoff)
+        if not archived_uids:
+            return 0
+
+        _LOGGER.info(
+            "Archiving %d old instances from list %s", len(archived_uids), list_id
+        )
+        cache = self._tasks_cache.get(list_id, {"templates": {}, "tasks": {}})
+        archived = [
+            task for uid in archived_uids if (task := cache["tasks"].pop(uid, None))
+        ]
+        self._mark_changed(list_id, archived_uids)
+        if self._search_index is not None:
+            for task in archived:
+                self._search_index.update(list_id, task, archived=True)
+        return len(archived_uids)
+
+    async def async_get_archive_history(
+        self,
+        limit: int,
+        *,
+        list_ids: Iterable[str] | None = None,
+        parent_uid: str | None = None,
+        person_id: str | None = None,
+        before: tuple[str, str, str] | None = None,
+    ) -> tuple[list[tuple[str, Task]], tuple[str, str, str] | None]:
+        """Read one page of archived instances, newest first.
+
+        Each list is read from its cursor position only (keyset query in
+        SQLite, monthly segments in JSON storage), and at most ``limit + 1``
+        instances per list.
+
+        Args:
+            limit: Max instances to return
+            list_ids: Lists to read (default: all)
+            parent_uid: Only instances of this template
+            person_id: Only instances assigned to this person (section, then
+                list assignment, as for points)
+            before: Cursor returned by the previous page
+
+        Returns:
+            ((list_id, instance) pairs, cursor of the next page or None)
+        """
+        if list_ids is None:
+            list_ids = list(self._tasks_cache)
+
+        candidates: list[tuple[tuple[str, str, str], str, Task]] = []
+        for list_id in list_ids:
+            sections: tuple[set[str] | None, set[str]] | None = None
+            if person_id is not None:
+                sections = self._person_sections(list_id, person_id)
+                if sections is None:
+                    continue
+
+            list_before: ArchiveKey | None = None
+            if before is not None:
+                modified, cursor_list, cursor_uid = before
+                if list_id < cursor_list:
+                    # Sorts after every UID: the cursor's own time comes next
+                    list_before = (modified, "\uffff")
+                elif list_id == cursor_list:
+                    list_before = (modified, cursor_uid)
+                else:
+                    list_before = (modified, "")
+
+            for task in await self._async_archive_page(
+                list_id, limit + 1, list_before, parent_uid, sections
+            ):
+                key = archive_key(task)
+                candidates.append(((key[0], list_id, key[1]), list_id, task))
+
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        page = candidates[:limit]
+        next_cursor = page[-1][0] if len(candidates) > limit else None
+        return [(list_id, task) for _, list_id, task in page], next_cursor
+
+    async def _async_archive_page(
+        self,
+        list_id: str,
+        limit: int,
+        before: ArchiveKey | None,
+        parent_uid: str | None,
+        sections: tuple[set[str] | None, set[str]] | None,
+    ) -> list[Task]:
+        """Read archived instances of one list (see async_get_archive_history)."""
+        include, exclude = sections if sections is not None else (None, set())
+        if self._database is not None:
+            return [
+                Task.from_dict(data)
+                for data in await self._database.async_query_archive(
+                    list_id,
+                    limit,
+                    before=before,
+                    parent_uid=parent_uid,
+                    section_ids=include,
+                    exclude_section_ids=exclude,
+                )
+            ]
+
+        archive = self._archives.get(list_id)
+        if archive is None:
+            return []
+
+        def predicate(task: Task) -> bool:
+            if parent_uid is not None and task.parent_uid != parent_uid:
+                return False
+            if include is not None:
+                return task.section_id in include
+            return task.section_id not in exclude
+
+        return await archive.async_page(limit, before, predicate)
+
+    def _person_sections(
+        self, list_id: str, person_id: str
+    ) -> tuple[set[str] | None, set[str]] | None:
+        """Describe which tasks of a list are assigned to a person.
+
+        A section's person_id (if set) overrides the list's.
+
+        Returns:
+            None if no task of the list can be assigned to the person, else
+            (sections to include or None for all, sections to exclude)
+        """
+        owned: set[str] = set()
+        others: set[str] = set()
+        for section in self._sections_cache.get(list_id, []):
+            if "person_id" in section:
+                if section["person_id"] == person_id:
+                    owned.add(section["id"])
+                else:
+                    others.add(section["id"])
+
+        list_config = self.get_list(list_id) or {}
+        if list_config.get("person_id") == person_id:
+            return None, others
+        if owned:
+            return owned, set()
+        return None
+
     def get_sections_for_list(self, list_id: str) -> list[dict[str, Any]]:
         """Get all sections for a list.
 
@@ -646,14 +1464,14 @@ class ChoreBotStore:
             list_id: The list ID
             sections: List of section dicts with id, name, and sort_order
         """
-        async with self._lock:
+        async with self._list_lock(list_id):
             if list_id not in self._tasks_cache:
                 _LOGGER.error("Cannot set sections for unknown list: %s", list_id)
                 return
 
             # Store the sections list directly - caller has already modified it
             self._sections_cache[list_id] = sections
-            await self.async_save_tasks(list_id)
+            await self._async_commit(list_id, structure_changed=True)
 
     def get_default_section_id(self, list_id: str) -> str | None:
         """Get the default section ID for a list (highest sort_order).
@@ -700,3 +1518,19 @@ class ChoreBotStore:
             CONF_POINTS_TEXT: text,
             CONF_POINTS_ICON: icon,
         }
+
+    async def async_set_points_display(self, text: str, icon: str) -> None:
+        """Set points display configuration.
+
+        Args:
+            text: Points terminology (e.g., "stars")
+            icon: MDI icon (e.g., "mdi:star"), may be empty
+        """
+        from .const import CONF_POINTS_DISPLAY, CONF_POINTS_ICON, CONF_POINTS_TEXT
+
+        async with self._config_lock:
+            self._config_data[CONF_POINTS_DISPLAY] = {
+                CONF_POINTS_TEXT: text,
+                CONF_POINTS_ICON: icon,
+            }
+            await self.async_save_config()
@@ -31,6 +31,25 @@ class SyncBackend(ABC):
             bool: True if successful, False otherwise.
         """
 
+    async def async_push_tasks(self, list_id: str, tasks: list[Task]) -> int:
+        """Push several local tasks of one list to the remote backend.
+
+        Backends that can coalesce pushes (batch endpoints, one local save of
+        the sync metadata) override this; the default pushes one by one.
+
+        Args:
+            list_id: Local list ID
+            tasks: Tasks to push
+
+        Returns:
+            int: Number of tasks pushed successfully.
+        """
+        pushed = 0
+        for task in tasks:
+            if await self.async_push_task(list_id, task):
+                pushed += 1
+        return pushed
+
     @abstractmethod
     async def async_delete_task(self, list_id: str, task: Task) -> bool:
         """Delete a task from the remote backend.
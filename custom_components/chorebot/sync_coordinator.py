@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 
 from .sync_backend import SyncBackend
 from .task import Task
@@ -29,6 +31,16 @@ class SyncCoordinator:
         self._lock = asyncio.Lock()
         self._sync_in_progress = False
         self._last_sync_time: datetime | None = None
+        self._last_sync_stats: dict[str, int] = {}
+
+        # Adaptive polling state (see async_start_polling)
+        self._poll_interval: timedelta | None = None
+        self._min_interval = timedelta(0)
+        self._max_interval = timedelta(0)
+        self._next_poll: datetime | None = None
+        self._unsub_poll: CALLBACK_TYPE | None = None
+        self._on_poll: Callable[[dict[str, int]], Awaitable[None]] | None = None
+        self._listeners: list[Callable[[], None]] = []
 
     @property
     def enabled(self) -> bool:
@@ -56,10 +68,33 @@ class SyncCoordinator:
             return False
 
         try:
-            return await self.backend.async_push_task(list_id, task)
+            result = await self.backend.async_push_task(list_id, task)
         except Exception as err:  # noqa: BLE001
             _LOGGER.error("Error pushing task: %s", err)
             return False
+        self._note_local_activity()
+        return result
+
+    async def async_push_tasks(self, list_id: str, tasks: list[Task]) -> int:
+        """Push several local tasks of one list as one coalesced batch.
+
+        Args:
+            list_id: Local list ID
+            tasks: Tasks to push
+
+        Returns:
+            int: Number of tasks pushed successfully.
+        """
+        if not self.backend or not tasks:
+            return 0
+
+        try:
+            pushed = await self.backend.async_push_tasks(list_id, tasks)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.error("Error pushing %d tasks: %s", len(tasks), err)
+            return 0
+        self._note_local_activity()
+        return pushed
 
     async def async_delete_task(self, list_id: str, task: Task) -> bool:
         """Delete a task from the remote backend.
@@ -75,10 +110,12 @@ class SyncCoordinator:
             return False
 
         try:
-            return await self.backend.async_delete_task(list_id, task)
+            result = await self.backend.async_delete_task(list_id, task)
         except Exception as err:  # noqa: BLE001
             _LOGGER.error("Error deleting task: %s", err)
             return False
+        self._note_local_activity()
+        return result
 
     async def async_complete_task(self, list_id: str, task: Task) -> bool:
         """Mark a task as completed on the remote backend.
@@ -94,10 +131,12 @@ class SyncCoordinator:
             return False
 
         try:
-            return await self.backend.async_complete_task(list_id, task)
+            result = await self.backend.async_complete_task(list_id, task)
         except Exception as err:  # noqa: BLE001
             _LOGGER.error("Error completing task: %s", err)
             return False
+        self._note_local_activity()
+        return result
 
     async def async_pull_changes(self, list_id: str | None = None) -> dict[str, int]:
         """Pull changes from the remote backend.
@@ -125,6 +164,9 @@ class SyncCoordinator:
                 return {"created": 0, "updated": 0, "deleted": 0}
             else:
                 self._last_sync_time = datetime.now(UTC)
+                self._last_sync_stats = stats
+                self._adapt_poll_interval(stats)
+                self._notify_listeners()
                 return stats
             finally:
                 self._sync_in_progress = False
@@ -174,11 +216,150 @@ class SyncCoordinator:
             _LOGGER.error("Error getting remote lists: %s", err)
             return []
 
+    # === Adaptive Polling ===
+
+    @callback
+    def async_start_polling(
+        self,
+        on_poll: Callable[[dict[str, int]], Awaitable[None]],
+        interval: timedelta,
+        min_interval: timedelta,
+        max_interval: timedelta,
+    ) -> CALLBACK_TYPE:
+        """Start adaptive periodic pulls from the remote backend.
+
+        Polling starts at ``interval``. Any pull that brings in remote changes,
+        and any local edit pushed to the backend, drops the interval to
+        ``min_interval``; every quiet pull doubles it up to ``max_interval``.
+
+        Args:
+            on_poll: Coroutine called with the pull stats after each scheduled poll
+            interval: Initial polling interval
+            min_interval: Shortest interval (used right after activity)
+            max_interval: Longest interval (reached during quiet periods)
+
+        Returns:
+            Callback that stops polling.
+        """
+        self._on_poll = on_poll
+        self._min_interval = min_interval
+        self._max_interval = max(max_interval, min_interval)
+        self._poll_interval = min(max(interval, self._min_interval), self._max_interval)
+        self._schedule_poll(self._poll_interval)
+        return self._async_stop_polling
+
+    @callback
+    def _async_stop_polling(self) -> None:
+        """Stop adaptive polling."""
+        if self._unsub_poll:
+            self._unsub_poll()
+            self._unsub_poll = None
+        self._next_poll = None
+        self._poll_interval = None
+        self._on_poll = None
+
+    @callback
+    def _schedule_poll(self, delay: timedelta) -> None:
+        """(Re)schedule the next poll ``delay`` from now."""
+        if self._unsub_poll:
+            self._unsub_poll()
+        self._next_poll = datetime.now(UTC) + delay
+        self._unsub_poll = async_call_later(self.hass, delay, self._async_poll)
+        self._notify_listeners()
+
+    async def _async_poll(self, _now: datetime) -> None:
+        """Run a scheduled poll and schedule the next one."""
+        self._unsub_poll = None
+        _LOGGER.debug("Running periodic sync")
+        try:
+            stats = await self.async_pull_changes()
+            if self._on_poll:
+                await self._on_poll(stats)
+        finally:
+            # Polling may have been stopped while the pull was running
+            if self._poll_interval is not None and self._unsub_poll is None:
+                self._schedule_poll(self._poll_interval)
+
+    def _adapt_poll_interval(self, stats: dict[str, int]) -> None:
+        """Speed up after remote changes, back off exponentially when quiet."""
+        if self._poll_interval is None:
+            return
+
+        changed = (
+            stats.get("created", 0) + stats.get("updated", 0) + stats.get("deleted", 0)
+        ) > 0
+        if changed:
+            new_interval = self._min_interval
+        else:
+            new_interval = min(self._poll_interval * 2, self._max_interval)
+
+        if new_interval != self._poll_interval:
+            _LOGGER.debug(
+                "Sync interval %s -> %s (%s)",
+                self._poll_interval,
+                new_interval,
+                "remote changes" if changed else "no changes",
+            )
+            self._poll_interval = new_interval
+            self._notify_listeners()
+
+    def _note_local_activity(self) -> None:
+        """Poll at the minimum interval after a local edit was pushed."""
+        if self._poll_interval is None:
+            return
+
+        self._poll_interval = self._min_interval
+        # Bring the next poll forward unless it is already due sooner
+        # (a poll in progress reschedules itself when it finishes)
+        if self._unsub_poll and (
+            self._next_poll is None
+            or self._next_poll > datetime.now(UTC) + self._min_interval
+        ):
+            self._schedule_poll(self._min_interval)
+        else:
+            self._notify_listeners()
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Register a callback invoked after each sync and on schedule changes.
+
+        Returns:
+            Callback that removes the listener.
+        """
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _notify_listeners(self) -> None:
+        """Notify listeners of a completed sync or polling schedule change."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @property
+    def poll_interval(self) -> timedelta | None:
+        """Return the current polling interval (None if not polling)."""
+        return self._poll_interval
+
+    @property
+    def next_poll(self) -> datetime | None:
+        """Return when the next scheduled poll will run."""
+        return self._next_poll
+
     @property
     def last_sync_time(self) -> datetime | None:
         """Return the last successful sync time."""
         return self._last_sync_time
 
+    @property
+    def last_sync_stats(self) -> dict[str, int]:
+        """Return the stats of the last successful sync."""
+        return self._last_sync_stats
+
     @property
     def is_syncing(self) -> bool:
         """Return whether a sync is currently in progress."""
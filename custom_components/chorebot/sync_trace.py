@@ -0,0 +1,245 @@
+"""Structured sync tracing for ChoreBot."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bounds for in-memory trace buffers
+DEFAULT_MAX_PAYLOADS = 200
+DEFAULT_MAX_RUNS = 20
+DEFAULT_MAX_SAMPLES = 100
+
+# Upper bucket bounds (ms) for timing histograms; the last bucket is open-ended
+HISTOGRAM_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# The run being traced by the current asyncio task. Context variables are
+# per-task, so work done concurrently by other tasks (e.g. a user edit saving
+# the store mid-sync) is not attributed to the sync run.
+_ACTIVE_RUN: ContextVar[dict[str, Any] | None] = ContextVar(
+    "chorebot_sync_run", default=None
+)
+# Enclosing phase of the current task: [child time in ms]
+_PHASE_FRAME: ContextVar[list[float] | None] = ContextVar(
+    "chorebot_sync_phase", default=None
+)
+
+
+class SyncTracer:
+    """Per-sync summaries plus an opt-in bounded ring buffer of raw payloads.
+
+    Summaries are always kept (a handful of counters and phase timings per
+    run), logged at INFO and folded into rolling timing histograms. Raw
+    payloads are only captured when payload capture is enabled, and are
+    stored by reference: nothing is serialized until the buffer is
+    downloaded through the diagnostics handler.
+    """
+
+    def __init__(
+        self,
+        capture_payloads: bool = False,
+        max_payloads: int = DEFAULT_MAX_PAYLOADS,
+        max_runs: int = DEFAULT_MAX_RUNS,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+    ) -> None:
+        """Initialize the tracer.
+
+        Args:
+            capture_payloads: Whether raw remote payloads are captured
+            max_payloads: Ring buffer size for captured payloads
+            max_runs: Number of recent run summaries to keep
+            max_samples: Rolling window size for timing histograms
+        """
+        self.capture_payloads = capture_payloads
+        self._payloads: deque[dict[str, Any]] = deque(maxlen=max_payloads)
+        self._runs: deque[dict[str, Any]] = deque(maxlen=max_runs)
+        self._current: dict[str, Any] | None = None
+        self._started: float = 0.0
+        self._max_samples = max_samples
+        # Rolling per-run timing samples (ms), keyed by phase and by list
+        self._phase_samples: dict[str, deque[float]] = {}
+        self._list_samples: dict[str, deque[float]] = {}
+
+    def start_run(self, mode: str, list_id: str | None = None) -> None:
+        """Begin tracing a sync run.
+
+        Args:
+            mode: Sync mode ("full" or "delta")
+            list_id: List being synced (None = all lists)
+        """
+        self._started = time.monotonic()
+        self._current = {
+            "started_at": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+            "mode": mode,
+            "list_id": list_id,
+            "counters": {},
+            "phases": {},
+            "lists": {},
+        }
+        _ACTIVE_RUN.set(self._current)
+        _PHASE_FRAME.set(None)
+
+    def set_mode(self, mode: str) -> None:
+        """Update the mode of the current run (e.g., delta fell back to full)."""
+        if self._current is not None:
+            self._current["mode"] = mode
+
+    def count(self, key: str, amount: int = 1) -> None:
+        """Increment a counter on the current run."""
+        if self._current is None:
+            return
+        counters = self._current["counters"]
+        counters[key] = counters.get(key, 0) + amount
+
+    @contextmanager
+    def phase(self, name: str, list_id: str | None = None) -> Iterator[None]:
+        """Time a phase of the current run (no-op outside a run).
+
+        Phases nest: time spent in an inner phase (e.g. "fetch" inside
+        "reconcile") is only attributed to the inner phase.
+
+        Args:
+            name: Phase name ("fetch", "reconcile", "push_retry", "save")
+            list_id: List the work belongs to (None = not list specific)
+        """
+        run = _ACTIVE_RUN.get()
+        if run is None or run is not self._current:
+            yield
+            return
+
+        parent = _PHASE_FRAME.get()
+        frame = [0.0]
+        token = _PHASE_FRAME.set(frame)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            _PHASE_FRAME.reset(token)
+            elapsed = (time.monotonic() - started) * 1000
+            if parent is not None:
+                parent[0] += elapsed
+            exclusive = elapsed - frame[0]
+
+            phases = run["phases"]
+            phases[name] = phases.get(name, 0.0) + exclusive
+            if list_id is not None:
+                list_phases = run["lists"].setdefault(list_id, {})
+                list_phases[name] = list_phases.get(name, 0.0) + exclusive
+
+    def capture(self, kind: str, payload: Any, **context: Any) -> None:
+        """Capture a raw payload into the ring buffer (no-op unless enabled).
+
+        Args:
+            kind: Payload kind (e.g., "project", "task_new", "task_updated")
+            payload: Raw payload (stored by reference, must not be mutated later)
+            **context: Small identifying fields (list_id, task id, ...)
+        """
+        if not self.capture_payloads:
+            return
+        self._payloads.append(
+            {
+                "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+                "kind": kind,
+                "context": context,
+                "payload": payload,
+            }
+        )
+
+    def finish_run(self, stats: dict[str, int]) -> None:
+        """Finish the current run, log its summary at INFO and keep it."""
+        if self._current is None:
+            return
+        summary = self._current
+        self._current = None
+        _ACTIVE_RUN.set(None)
+        summary["duration_ms"] = round((time.monotonic() - self._started) * 1000, 1)
+        summary["stats"] = dict(stats)
+        summary["phases"] = {
+            name: round(ms, 1) for name, ms in summary["phases"].items()
+        }
+        summary["lists"] = {
+            list_id: {name: round(ms, 1) for name, ms in phases.items()}
+            for list_id, phases in summary["lists"].items()
+        }
+        self._runs.append(summary)
+
+        self._add_sample(self._phase_samples, "total", summary["duration_ms"])
+        for name, ms in summary["phases"].items():
+            self._add_sample(self._phase_samples, name, ms)
+        for list_id, phases in summary["lists"].items():
+            self._add_sample(self._list_samples, list_id, sum(phases.values()))
+
+        _LOGGER.info(
+            "Pull sync completed (%s) in %.0f ms: %s %s phases=%s",
+            summary["mode"],
+            summary["duration_ms"],
+            summary["stats"],
+            summary["counters"],
+            summary["phases"],
+        )
+
+    def _add_sample(
+        self, samples: dict[str, deque[float]], key: str, value: float
+    ) -> None:
+        """Append a timing sample to a rolling window."""
+        if key not in samples:
+            samples[key] = deque(maxlen=self._max_samples)
+        samples[key].append(value)
+
+    @staticmethod
+    def _histogram(samples: deque[float]) -> dict[str, Any]:
+        """Summarize timing samples as percentiles plus bucket counts."""
+        ordered = sorted(samples)
+        count = len(ordered)
+        buckets: dict[str, int] = {f"le_{bound}": 0 for bound in HISTOGRAM_BUCKETS_MS}
+        buckets["gt_max"] = 0
+        for value in ordered:
+            for bound in HISTOGRAM_BUCKETS_MS:
+                if value <= bound:
+                    buckets[f"le_{bound}"] += 1
+                    break
+            else:
+                buckets["gt_max"] += 1
+
+        return {
+            "count": count,
+            "p50": ordered[int(0.5 * (count - 1))] if count else None,
+            "p95": ordered[int(0.95 * (count - 1))] if count else None,
+            "max": ordered[-1] if count else None,
+            "buckets": buckets,
+        }
+
+    @property
+    def last_run(self) -> dict[str, Any] | None:
+        """Return the summary of the most recent finished run."""
+        return self._runs[-1] if self._runs else None
+
+    def histograms(self) -> dict[str, dict[str, Any]]:
+        """Return rolling timing histograms per phase and per list."""
+        return {
+            "phases": {
+                name: self._histogram(samples)
+                for name, samples in self._phase_samples.items()
+            },
+            "lists": {
+                list_id: self._histogram(samples)
+                for list_id, samples in self._list_samples.items()
+            },
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return trace data for diagnostics download."""
+        return {
+            "capture_payloads": self.capture_payloads,
+            "runs": list(self._runs),
+            "histograms": self.histograms(),
+            "payloads": list(self._payloads),
+        }
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
+import copy
+from dataclasses import dataclass, field, replace
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
+from homeassistant.util import dt as dt_util
+
 from .const import (
     FIELD_COMPLETED_ON_TIME,
     FIELD_DELETED_AT,
@@ -108,6 +111,15 @@ class Task:
             section_id=section_id,
         )
 
+    def copy(self) -> Task:
+        """Return an independent working copy (safe to mutate before committing)."""
+        return replace(
+            self,
+            tags=list(self.tags),
+            custom_fields=copy.deepcopy(self.custom_fields),
+            sync=copy.deepcopy(self.sync),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert task to dictionary for JSON storage."""
         result: dict[str, Any] = {
@@ -245,15 +257,38 @@ class Task:
         """Check if task is a recurring task (template or instance)."""
         return self.is_recurring_template() or self.is_recurring_instance()
 
-    def is_overdue(self) -> bool:
-        """Check if task is overdue (past due date and not completed)."""
-        if not self.due or self.status == "completed":
-            return False
-        try:
-            due_dt = datetime.fromisoformat(self.due)
-            return datetime.now(due_dt.tzinfo) > due_dt
-        except (ValueError, AttributeError):
+    def due_day(self) -> date | None:
+        """Return the calendar day the task is due.
+
+        All-day dues are stored as UTC midnight of their date; timed dues
+        fall on their date in Home Assistant's timezone.
+        """
+        if not self.due:
+            return None
+        due_dt = dt_util.parse_datetime(self.due)
+        if due_dt is None:
+            return None
+        if self.is_all_day:
+            return due_dt.date()
+        if due_dt.tzinfo is None:
+            due_dt = due_dt.replace(tzinfo=UTC)
+        return dt_util.as_local(due_dt).date()
+
+    def overdue_at(self) -> datetime | None:
+        """Return when the task becomes overdue (UTC).
+
+        That is the end of its due day in Home Assistant's timezone: until
+        then it can still be completed on time (streaks compare days only).
+        """
+        if (day := self.due_day()) is None:
+            return None
+        return dt_util.as_utc(dt_util.start_of_local_day(day + timedelta(days=1)))
+
+    def is_overdue(self, now: datetime | None = None) -> bool:
+        """Check if task is overdue (its due day is over and not completed)."""
+        if self.status == "completed" or (overdue_at := self.overdue_at()) is None:
             return False
+        return (now or dt_util.utcnow()) >= overdue_at
 
     def mark_deleted(self) -> None:
         """Soft delete this task."""
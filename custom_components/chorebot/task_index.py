@@ -0,0 +1,197 @@
+"""Inverted indexes over the tasks of a ChoreBot list."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from datetime import UTC, date, datetime
+import logging
+from operator import itemgetter
+
+from .task import Task
+
+_LOGGER = logging.getLogger(__name__)
+
+KIND_TASK = "task"
+KIND_TEMPLATE = "template"
+
+
+class ListTaskIndex:
+    """Inverted indexes (tag, section, status, due day, kind) of one list.
+
+    Each index maps a key to the UIDs of the visible tasks and templates
+    having it. The store updates the index for the UIDs of every commit, so
+    it never has to walk the whole list; a query intersects the posting
+    sets of its filters, smallest first.
+
+    Due days are the UTC date of the due timestamp. Their keys are also
+    kept sorted so a date range is answered with two bisections. Open tasks
+    are also kept sorted by the time they become overdue (Task.overdue_at),
+    so counting the overdue ones is one bisection instead of a due date
+    parse per task.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._by_tag: dict[str, set[str]] = {}
+        self._by_section: dict[str | None, set[str]] = {}
+        self._by_status: dict[str, set[str]] = {}
+        self._by_kind: dict[str, set[str]] = {}
+        self._by_due_day: dict[date, set[str]] = {}
+        self._due_days: list[date] = []  # Sorted keys of _by_due_day
+        # Sorted (overdue_at, uid) of open tasks with a due date
+        self._overdue: list[tuple[datetime, str]] = []
+        self._overdue_at: dict[str, datetime] = {}
+        # uid -> the keys it is posted under (to unpost on change)
+        self._postings: dict[
+            str, tuple[tuple[str, ...], str | None, str, str, date | None]
+        ] = {}
+
+    @classmethod
+    def build(cls, tasks: Iterable[Task]) -> ListTaskIndex:
+        """Build an index of the given tasks and templates."""
+        index = cls()
+        for task in tasks:
+            index.update(task.uid, task)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks and templates."""
+        return len(self._postings)
+
+    def update(self, uid: str, task: Task | None) -> None:
+        """Re-index a task or template (None or deleted: remove it)."""
+        self._unpost(uid)
+        if task is None or task.is_deleted():
+            return
+
+        tags = tuple(dict.fromkeys(task.tags))
+        kind = KIND_TEMPLATE if task.is_recurring_template() else KIND_TASK
+        due_day = _due_day(task.due) if task.due else None
+        self._postings[uid] = (tags, task.section_id, task.status, kind, due_day)
+
+        for tag in tags:
+            self._by_tag.setdefault(tag, set()).add(uid)
+        self._by_section.setdefault(task.section_id, set()).add(uid)
+        self._by_status.setdefault(task.status, set()).add(uid)
+        self._by_kind.setdefault(kind, set()).add(uid)
+        if due_day is not None:
+            if due_day not in self._by_due_day:
+                self._by_due_day[due_day] = set()
+                insort(self._due_days, due_day)
+            self._by_due_day[due_day].add(uid)
+        if (
+            kind == KIND_TASK
+            and task.status != "completed"
+            and (overdue_at := task.overdue_at()) is not None
+        ):
+            self._overdue_at[uid] = overdue_at
+            insort(self._overdue, (overdue_at, uid))
+
+    def _unpost(self, uid: str) -> None:
+        """Remove a UID from every index it is posted in."""
+        postings = self._postings.pop(uid, None)
+        if postings is None:
+            return
+
+        tags, section_id, status, kind, due_day = postings
+        for tag in tags:
+            _discard(self._by_tag, tag, uid)
+        _discard(self._by_section, section_id, uid)
+        _discard(self._by_status, status, uid)
+        _discard(self._by_kind, kind, uid)
+        if due_day is not None and _discard(self._by_due_day, due_day, uid):
+            del self._due_days[bisect_left(self._due_days, due_day)]
+        if (overdue_at := self._overdue_at.pop(uid, None)) is not None:
+            del self._overdue[bisect_left(self._overdue, (overdue_at, uid))]
+
+    def overdue_count(self, now: datetime) -> int:
+        """Return the number of open tasks overdue at ``now``."""
+        return bisect_right(self._overdue, now, key=itemgetter(0))
+
+    def tags(self) -> list[str]:
+        """Return the sorted tags in use."""
+        return sorted(self._by_tag)
+
+    def query(
+        self,
+        *,
+        tags: Iterable[str] | None = None,
+        section_id: str | None = None,
+        status: str | None = None,
+        due_after: date | None = None,
+        due_before: date | None = None,
+        include_templates: bool = False,
+    ) -> set[str]:
+        """Return the UIDs matching every given filter.
+
+        Args:
+            tags: Tags that must all be present
+            section_id: Section the task must be in
+            status: Task status ("needs_action" or "completed")
+            due_after: First due day (UTC, inclusive)
+            due_before: Last due day (UTC, inclusive)
+            include_templates: Also match recurring templates
+
+        Returns:
+            Set of matching UIDs
+        """
+        candidates: list[set[str]] = []
+        for tag in tags or ():
+            candidates.append(self._by_tag.get(tag, set()))
+        if section_id is not None:
+            candidates.append(self._by_section.get(section_id, set()))
+        if status is not None:
+            candidates.append(self._by_status.get(status, set()))
+        if due_after is not None or due_before is not None:
+            low = bisect_left(self._due_days, due_after) if due_after else 0
+            high = (
+                bisect_right(self._due_days, due_before)
+                if due_before
+                else len(self._due_days)
+            )
+            due_uids: set[str] = set()
+            for day in self._due_days[low:high]:
+                due_uids |= self._by_due_day[day]
+            candidates.append(due_uids)
+        if not include_templates:
+            candidates.append(self._by_kind.get(KIND_TASK, set()))
+
+        if not candidates:
+            return set(self._postings)
+
+        candidates.sort(key=len)
+        result = set(candidates[0])
+        for uids in candidates[1:]:
+            if not result:
+                break
+            result &= uids
+        return result
+
+
+def _discard(index: dict, key, uid: str) -> bool:
+    """Remove a UID from a posting set, dropping the key once empty.
+
+    Returns:
+        True if the key was dropped
+    """
+    uids = index.get(key)
+    if uids is None:
+        return False
+    uids.discard(uid)
+    if uids:
+        return False
+    del index[key]
+    return True
+
+
+def _due_day(due: str) -> date | None:
+    """Return the UTC day of a stored due timestamp."""
+    try:
+        due_dt = datetime.fromisoformat(due.replace("Z", "+00:00"))
+    except ValueError:
+        _LOGGER.debug("Not indexing unparseable due date: %s", due)
+        return None
+    if due_dt.tzinfo is None:
+        due_dt = due_dt.replace(tzinfo=UTC)
+    return due_dt.astimezone(UTC).date()
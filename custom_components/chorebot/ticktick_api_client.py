@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import secrets
 from typing import Any
 
 from aiohttp import ClientResponse, ClientSession
 
-from .const import TICKTICK_API_BASE
+from .const import TICKTICK_API_BASE, TICKTICK_API_V2_BASE
 
 _LOGGER = logging.getLogger(__name__)
 
+# The web API (api/v2) only serves browser sessions: it needs a web client's
+# headers and the "t" session cookie from user/signin (as in ticktick-py)
+WEB_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:95.0) Gecko/20100101 Firefox/95.0"
+)
+
 
 class TickTickAPIClient:
     """Lightweight REST API client for TickTick Open API."""
@@ -19,6 +27,14 @@ class TickTickAPIClient:
         """Initialize the TickTick API client."""
         self._headers = {"Authorization": f"Bearer {access_token}"}
         self._session = session
+        # Web API headers with the session cookie (set by sign_in)
+        self._web_headers: dict[str, str] | None = None
+        # Cumulative request metrics (callers diff snapshots per sync run)
+        self.metrics: dict[str, int] = {
+            "requests": 0,
+            "bytes_received": 0,
+            "errors": 0,
+        }
 
     # === Project/List Operations ===
 
@@ -59,6 +75,66 @@ class TickTickAPIClient:
         payload = {"name": name}
         return await self._post(f"{TICKTICK_API_BASE}/project", payload)
 
+    # === Delta Sync ===
+
+    @property
+    def signed_in(self) -> bool:
+        """Return whether a web API session is available (see sign_in)."""
+        return self._web_headers is not None
+
+    async def sign_in(self, username: str, password: str) -> None:
+        """Sign in to the web API, which does not accept OAuth tokens.
+
+        Args:
+            username: TickTick account email
+            password: TickTick account password
+        """
+        device = {
+            "platform": "web",
+            "os": "OS X",
+            "device": "Firefox 95.0",
+            "name": "ChoreBot",
+            "version": 4531,
+            "id": f"6490{secrets.token_hex(10)}",
+            "channel": "website",
+        }
+        headers = {"User-Agent": WEB_USER_AGENT, "x-device": json.dumps(device)}
+        try:
+            # Not logged: the body carries the password
+            response = await self._session.post(
+                f"{TICKTICK_API_V2_BASE}/user/signin",
+                params={"wc": "true", "remember": "true"},
+                json={"username": username, "password": password},
+                headers=headers,
+            )
+            result = await self._get_response_dict(response)
+        except Exception as err:
+            self.metrics["errors"] += 1
+            _LOGGER.error("TickTick web API sign-in failed: %s", err)
+            raise
+        self._web_headers = {**headers, "Cookie": f"t={result['token']}"}
+
+    async def batch_check(self, checkpoint: int) -> dict[str, Any]:
+        """Get all changes since a checkpoint (web API, call sign_in first).
+
+        A checkpoint of 0 returns the full account state (every open task).
+        The response carries a new "checkPoint" to use for the next call.
+
+        Args:
+            checkpoint: Checkpoint returned by the previous batch check
+
+        Returns:
+            dict: Delta with "checkPoint", "syncTaskBean" and "projectProfiles"
+        """
+        if self._web_headers is None:
+            raise RuntimeError("Not signed in to the TickTick web API")
+        result = await self._get(
+            f"{TICKTICK_API_V2_BASE}/batch/check/{checkpoint}", self._web_headers
+        )
+        if isinstance(result, dict):
+            return result
+        raise TypeError("Expected dict response from batch/check but got list")
+
     # === Task Operations ===
 
     async def get_task(self, project_id: str, task_id: str) -> dict[str, Any]:
@@ -130,12 +206,15 @@ class TickTickAPIClient:
 
     # === HTTP Methods ===
 
-    async def _get(self, url: str) -> dict[str, Any] | list[dict[str, Any]]:
-        """Perform GET request."""
+    async def _get(
+        self, url: str, headers: dict[str, str] | None = None
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Perform GET request (with the OAuth headers unless given others)."""
         try:
-            response = await self._session.get(url, headers=self._headers)
+            response = await self._session.get(url, headers=headers or self._headers)
             return await self._get_response(response)
         except Exception as err:
+            self.metrics["errors"] += 1
             _LOGGER.error("GET request failed for %s: %s", url, err)
             raise
 
@@ -168,6 +247,7 @@ class TickTickAPIClient:
             result = await self._get_response_dict(response)
             _LOGGER.debug("POST %s response: %s", url, result)
         except Exception as err:
+            self.metrics["errors"] += 1
             _LOGGER.error("POST request failed for %s: %s", url, err)
             raise
         else:
@@ -179,6 +259,7 @@ class TickTickAPIClient:
             response = await self._session.delete(url, headers=self._headers)
             return await self._get_response_dict(response)
         except Exception as err:
+            self.metrics["errors"] += 1
             _LOGGER.error("DELETE request failed for %s: %s", url, err)
             raise
 
@@ -186,6 +267,11 @@ class TickTickAPIClient:
         self, response: ClientResponse
     ) -> dict[str, Any] | list[dict[str, Any]]:
         """Process response and return JSON data."""
+        self.metrics["requests"] += 1
+        # Read the body once up front; json()/text() reuse the buffered body
+        body = await response.read()
+        self.metrics["bytes_received"] += len(body)
+
         if response.ok:
             try:
                 # Use content_type=None to bypass content-type validation
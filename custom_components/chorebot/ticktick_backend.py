@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
+import hashlib
 import json
 import logging
 import re
 from typing import Any
 from zoneinfo import ZoneInfo
 
+from aiohttp import ClientError
+
 from homeassistant.core import HomeAssistant
 
+from .const import (
+    CONF_DELTA_SYNC,
+    CONF_TICKTICK_PASSWORD,
+    CONF_TICKTICK_USERNAME,
+    DEFAULT_DELTA_SYNC,
+)
 from .oauth_api import AsyncConfigEntryAuth
 from .store import ChoreBotStore
 from .sync_backend import SyncBackend
+from .sync_trace import SyncTracer
 from .task import Task
 from .ticktick_api_client import TickTickAPIClient
 
@@ -22,6 +34,9 @@ _LOGGER = logging.getLogger(__name__)
 # Metadata format: [chorebot:key1=value1;key2=value2]
 METADATA_PATTERN = r"\[chorebot:(.*?)\]"
 
+# Projects fetched and reconciled at once (lists have independent store locks)
+MAX_CONCURRENT_PROJECT_PULLS = 4
+
 
 class TickTickBackend(SyncBackend):
     """TickTick synchronization backend."""
@@ -32,12 +47,14 @@ class TickTickBackend(SyncBackend):
         store: ChoreBotStore,
         auth: AsyncConfigEntryAuth,
         config: dict[str, Any],
+        tracer: SyncTracer | None = None,
     ) -> None:
         """Initialize the TickTick backend."""
         self.hass = hass
         self.store = store
         self._auth = auth
         self.config = config
+        self.tracer = tracer or SyncTracer()
         self._client: TickTickAPIClient | None = None
         _LOGGER.info(
             "TickTick backend initialized (list mappings now stored in storage)"
@@ -331,8 +348,16 @@ class TickTickBackend(SyncBackend):
 
     async def async_push_task(self, list_id: str, task: Task) -> bool:
         """Push a local task to TickTick."""
+        return await self.async_push_tasks(list_id, [task]) == 1
+
+    async def async_push_tasks(self, list_id: str, tasks: list[Task]) -> int:
+        """Push several local tasks of one list to TickTick.
+
+        The pending and final sync metadata of the whole batch are each
+        committed with a single list save instead of two saves per task.
+        """
         if not self._client:
-            return False
+            return 0
 
         # Check if this list is mapped (read from storage)
         sync_info = self.store.get_list_sync_info(list_id, "ticktick")
@@ -342,21 +367,43 @@ class TickTickBackend(SyncBackend):
                 list_id,
                 self.get_list_mappings(),
             )
-            return False
+            return 0
 
         project_id = sync_info["project_id"]
 
         # Skip recurring instances (only sync templates + their current due date)
-        if task.is_recurring_instance():
-            _LOGGER.debug("Skipping sync for recurring instance")
-            return True
+        to_push = []
+        skipped = 0
+        for task in tasks:
+            if task.is_recurring_instance():
+                _LOGGER.debug("Skipping sync for recurring instance")
+                skipped += 1
+            else:
+                to_push.append(task)
+        if not to_push:
+            return skipped
 
         # Mark as pending push
-        if "ticktick" not in task.sync:
-            task.sync["ticktick"] = {}
-        task.sync["ticktick"]["status"] = "pending_push"
-        await self.store.async_update_task(list_id, task)
+        for task in to_push:
+            task.sync.setdefault("ticktick", {})["status"] = "pending_push"
+        await self._async_commit_sync_metadata(list_id, to_push)
+
+        pushed = 0
+        for task in to_push:
+            if await self._async_push_remote(list_id, project_id, task):
+                pushed += 1
+
+        await self._async_commit_sync_metadata(list_id, to_push)
+        return skipped + pushed
 
+    async def _async_push_remote(
+        self, list_id: str, project_id: str, task: Task
+    ) -> bool:
+        """Create or update a task on TickTick and record the outcome in task.sync.
+
+        The sync metadata is only updated on ``task``; the caller commits it.
+        """
+        assert self._client is not None
         try:
             # Convert to TickTick format
             ticktick_task = self._task_to_ticktick(task, list_id, project_id)
@@ -406,18 +453,35 @@ class TickTickBackend(SyncBackend):
                             task.summary,
                         )
 
-            await self.store.async_update_task(list_id, task)
             _LOGGER.debug("Successfully pushed task '%s' to TickTick", task.summary)
 
         except Exception as err:  # noqa: BLE001
             _LOGGER.error("Failed to push task '%s' to TickTick: %s", task.summary, err)
             # Mark as failed
             task.sync["ticktick"]["status"] = "push_failed"
-            await self.store.async_update_task(list_id, task)
             return False
         else:
             return True
 
+    async def _async_commit_sync_metadata(
+        self, list_id: str, tasks: list[Task]
+    ) -> None:
+        """Commit the TickTick sync metadata of pushed tasks (one list save).
+
+        Only the sync metadata is applied, onto the latest committed versions
+        of the tasks, so user edits committed while the push was in flight
+        are not overwritten by the copies that were pushed.
+        """
+        async with self.store.async_edit_tasks(
+            list_id, [task.uid for task in tasks]
+        ) as latest:
+            # Tasks deleted while the push was in flight are left out
+            for task in tasks:
+                if task.uid in latest:
+                    latest[task.uid].sync["ticktick"] = dict(
+                        task.sync.get("ticktick", {})
+                    )
+
     async def async_delete_task(self, list_id: str, task: Task) -> bool:
         """Delete a task from TickTick."""
         if not self._client:
@@ -491,12 +555,26 @@ class TickTickBackend(SyncBackend):
         else:
             return True
 
+    @property
+    def delta_sync_enabled(self) -> bool:
+        """Return whether batch/check delta sync is enabled.
+
+        Off after TickTick rejected it, until the options are saved again
+        with Delta Sync on.
+        """
+        if self.store.get_backend_sync_state("ticktick").get("delta_disabled"):
+            return False
+        return bool(self.config.get(CONF_DELTA_SYNC, DEFAULT_DELTA_SYNC))
+
     async def async_pull_changes(self, list_id: str | None = None) -> dict[str, int]:
         """Pull changes from TickTick."""
         if not self._client:
             return {"created": 0, "updated": 0, "deleted": 0}
 
         stats = {"created": 0, "updated": 0, "deleted": 0}
+        use_delta = list_id is None and self.delta_sync_enabled
+        self.tracer.start_run("delta" if use_delta else "full", list_id)
+        metrics_before = dict(self._client.metrics)
 
         try:
             # Get lists to sync (read from storage)
@@ -523,351 +601,668 @@ class TickTickBackend(SyncBackend):
                         len(failed_tasks),
                         local_list_id,
                     )
-                    for task in failed_tasks:
-                        _LOGGER.debug("Retrying failed push: %s", task.summary)
-                        await self.async_push_task(local_list_id, task)
+                    self.tracer.count("push_retries", len(failed_tasks))
+                    with self.tracer.phase("push_retry", local_list_id):
+                        for task in failed_tasks:
+                            _LOGGER.debug("Retrying failed push: %s", task.summary)
+                            await self.async_push_task(local_list_id, task)
 
-            # Sync each mapped list
-            for local_list_id in lists_to_sync:
-                project_id = list_mappings[local_list_id]
+            # Delta sync is account-wide, so it is only used when syncing all lists.
+            # A single-list sync must not advance the shared checkpoint.
+            if not (use_delta and await self._async_pull_delta(list_mappings, stats)):
+                self.tracer.set_mode("full")
 
-                # Get TickTick tasks for this project
-                project_data = await self._client.get_project_with_tasks(project_id)
+                # Sync each mapped list
+                await self._async_pull_projects(lists_to_sync, list_mappings, stats)
+
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.error("Error during pull sync: %s", err)
+            self.tracer.count("errors")
 
-                # Debug: Log full project structure including columns (sections)
+        for key, value in self._client.metrics.items():
+            self.tracer.count(key, value - metrics_before.get(key, 0))
+        self.tracer.finish_run(stats)
+        return stats
+
+    async def _async_pull_delta(
+        self, list_mappings: dict[str, str], stats: dict[str, int]
+    ) -> bool:
+        """Pull only what changed since the stored checkpoint (batch/check).
+
+        Tasks in the delta are applied individually. Projects whose profile
+        etag changed (columns added, renamed or reordered) or whose tasks
+        reference an unknown column get a full project fetch instead.
+
+        Without a checkpoint, batch/check/0 returns every open task: each
+        list is reconciled against that response like a full fetch, so the
+        first checkpoint costs one download.
+
+        Args:
+            list_mappings: Mapping of local list IDs to TickTick project IDs
+            stats: Sync statistics to update
+
+        Returns:
+            bool: True if the delta was applied, False if the caller should
+            fall back to a full fetch (delta sync unreachable or rejected).
+        """
+        assert self._client is not None
+
+        sync_state = self.store.get_backend_sync_state("ticktick")
+        checkpoint = sync_state.get("checkpoint") or 0
+        project_to_list = {
+            project_id: local_list_id
+            for local_list_id, project_id in list_mappings.items()
+        }
+
+        try:
+            with self.tracer.phase("fetch"):
+                delta = await self._async_batch_check(checkpoint)
+            new_checkpoint = delta["checkPoint"]
+        except (ClientError, TimeoutError) as err:
+            _LOGGER.warning(
+                "TickTick delta sync unreachable, using full fetch: %s", err
+            )
+            return False
+        except Exception as err:  # noqa: BLE001
+            # Rejected login, rejected checkpoint or unexpected response:
+            # retrying would cost a failed request on every poll
+            _LOGGER.warning(
+                "TickTick rejected delta sync (checkpoint %s): %s. Using full "
+                "fetches until Delta Sync is saved again in the ChoreBot options",
+                checkpoint,
+                err,
+            )
+            await self.store.async_set_backend_sync_state(
+                "ticktick",
+                {
+                    "delta_disabled": str(err),
+                    "project_etags": sync_state.get("project_etags", {}),
+                },
+            )
+            return False
+
+        self.tracer.capture("delta", delta, checkpoint=checkpoint)
+
+        # Group changed and deleted tasks by local list
+        task_bean = delta.get("syncTaskBean") or {}
+        updated_by_list: dict[str, list[dict[str, Any]]] = {}
+        for tt_task in task_bean.get("update") or []:
+            local_list_id = project_to_list.get(tt_task.get("projectId"))
+            if local_list_id:
+                updated_by_list.setdefault(local_list_id, []).append(tt_task)
+
+        deleted_by_list: dict[str, set[str]] = {}
+        for item in task_bean.get("delete") or []:
+            local_list_id = project_to_list.get(item.get("projectId"))
+            if local_list_id and item.get("taskId"):
+                deleted_by_list.setdefault(local_list_id, set()).add(item["taskId"])
+
+        # Projects whose profile changed need their columns refreshed
+        old_etags = sync_state.get("project_etags", {})
+        new_etags = self._get_project_etags(delta, project_to_list)
+        lists_to_refresh = {
+            project_to_list[project_id]
+            for project_id, etag in new_etags.items()
+            # A baseline only knows the etags recorded before (local sections
+            # otherwise come from earlier full syncs)
+            if etag != old_etags.get(project_id)
+            and (checkpoint or project_id in old_etags)
+        }
+        if checkpoint:
+            # Lists mapped after the checkpoint was taken have never been fetched
+            lists_to_refresh.update(
+                local_list_id
+                for project_id, local_list_id in project_to_list.items()
+                if project_id not in old_etags and project_id not in new_etags
+            )
+        for local_list_id, tt_tasks in updated_by_list.items():
+            known_columns = {
+                s["id"] for s in self.store.get_sections_for_list(local_list_id)
+            }
+            if any(
+                t.get("columnId") and t["columnId"] not in known_columns
+                for t in tt_tasks
+            ):
+                lists_to_refresh.add(local_list_id)
+
+        self.tracer.count("delta_tasks", len(task_bean.get("update") or []))
+        self.tracer.count("delta_deletes", len(task_bean.get("delete") or []))
+        self.tracer.count("lists_refreshed", len(lists_to_refresh))
+
+        await self._async_pull_projects(lists_to_refresh, list_mappings, stats)
+
+        if not checkpoint:
+            self.tracer.set_mode("full+checkpoint")
+            for local_list_id in list_mappings.keys() - lists_to_refresh:
+                with self.tracer.phase("reconcile", local_list_id):
+                    await self._async_pull_project(
+                        local_list_id,
+                        list_mappings[local_list_id],
+                        stats,
+                        snapshot=updated_by_list.get(local_list_id, []),
+                    )
+        else:
+            for local_list_id in (
+                updated_by_list.keys() | deleted_by_list.keys()
+            ) - lists_to_refresh:
+                with self.tracer.phase("reconcile", local_list_id):
+                    await self._async_apply_delta(
+                        local_list_id,
+                        updated_by_list.get(local_list_id, []),
+                        deleted_by_list.get(local_list_id, set()),
+                        stats,
+                    )
+
+        await self.store.async_set_backend_sync_state(
+            "ticktick",
+            {
+                "checkpoint": new_checkpoint,
+                "project_etags": {
+                    **old_etags,
+                    **new_etags,
+                    **{
+                        list_mappings[local_list_id]: None
+                        for local_list_id in lists_to_refresh
+                        if list_mappings[local_list_id] not in new_etags
+                    },
+                },
+            },
+        )
+        _LOGGER.debug(
+            "Applied TickTick delta %s -> %s: %d list(s) changed, %d refreshed",
+            checkpoint,
+            new_checkpoint,
+            len(updated_by_list.keys() | deleted_by_list.keys()),
+            len(lists_to_refresh),
+        )
+        return True
+
+    async def _async_batch_check(self, checkpoint: int) -> dict[str, Any]:
+        """Call batch/check, signing in to the web API first if needed.
+
+        The web API does not accept the OAuth token; it needs the session
+        cookie of a password login. An expired session is renewed once.
+        """
+        assert self._client is not None
+        username = self.config.get(CONF_TICKTICK_USERNAME)
+        password = self.config.get(CONF_TICKTICK_PASSWORD)
+        if not (username and password):
+            raise ValueError("Delta Sync needs the TickTick email and password")
+
+        if not self._client.signed_in:
+            await self._client.sign_in(username, password)
+            return await self._client.batch_check(checkpoint)
+        try:
+            return await self._client.batch_check(checkpoint)
+        except Exception as err:
+            if "401" not in str(err):
+                raise
+            _LOGGER.debug("TickTick web API session expired, signing in again")
+        await self._client.sign_in(username, password)
+        return await self._client.batch_check(checkpoint)
+
+    def _get_project_etags(
+        self, delta: dict[str, Any], project_to_list: dict[str, str]
+    ) -> dict[str, str | None]:
+        """Extract project etags for mapped projects from a batch/check response."""
+        return {
+            profile["id"]: profile.get("etag")
+            for profile in delta.get("projectProfiles") or []
+            if profile.get("id") in project_to_list
+        }
+
+    async def _async_apply_delta(
+        self,
+        list_id: str,
+        ticktick_tasks: list[dict[str, Any]],
+        deleted_ticktick_ids: set[str],
+        stats: dict[str, int],
+    ) -> None:
+        """Apply changed and deleted tasks from a delta to a single list."""
+        sections = self.store.get_sections_for_list(list_id)
+        column_map = {s["id"]: s.get("name") for s in sections}
+        ticktick_id_map = self._build_ticktick_id_map(list_id)
+
+        for ticktick_id in deleted_ticktick_ids:
+            local_task = ticktick_id_map.pop(ticktick_id, None)
+            if local_task and not local_task.is_deleted():
                 _LOGGER.info(
-                    "TickTick Project Data for list '%s' (project_id: %s):\n%s",
-                    local_list_id,
-                    project_id,
-                    json.dumps(project_data, indent=2, default=str),
+                    "DELETED task on TickTick: '%s' (uid: %s) - soft-deleting locally",
+                    local_task.summary,
+                    local_task.uid,
                 )
+                await self._async_soft_delete_local(list_id, local_task, stats)
 
-                # Extract and log columns (sections) if available
-                columns = project_data.get("columns", [])
-                if columns:
-                    column_map = {col.get("id"): col.get("name") for col in columns}
-                    _LOGGER.info(
-                        "Project columns/sections mapping (columnId -> name):\n%s",
-                        json.dumps(column_map, indent=2, default=str),
+        for tt_task in ticktick_tasks:
+            await self._async_apply_remote_task(
+                list_id, tt_task, ticktick_id_map, column_map, stats
+            )
+
+    async def _async_soft_delete_local(
+        self, list_id: str, local_task: Task, stats: dict[str, int]
+    ) -> None:
+        """Soft-delete a task removed on TickTick (templates take their instances)."""
+        local_task.mark_deleted()
+        await self.store.async_update_task(list_id, local_task)
+        stats["deleted"] += 1
+
+        if not local_task.is_recurring_template():
+            return
+
+        for instance in self.store.get_instances_for_template(list_id, local_task.uid):
+            if not instance.is_deleted():
+                instance.mark_deleted()
+                await self.store.async_update_task(list_id, instance)
+                stats["deleted"] += 1
+                _LOGGER.debug(
+                    "Soft-deleted instance '%s' of deleted template", instance.uid
+                )
+
+    def _build_ticktick_id_map(self, list_id: str) -> dict[str, Task]:
+        """Build mapping of ticktick_id -> local task (templates + regular tasks)."""
+        local_templates = self.store.get_templates_for_list(list_id)
+        local_tasks = self.store.get_tasks_for_list(list_id)
+        local_regular_tasks = [t for t in local_tasks if not t.is_recurring_instance()]
+
+        ticktick_id_map = {}
+        for task in local_templates + local_regular_tasks:
+            ticktick_id = task.get_sync_id("ticktick")
+            if ticktick_id:
+                ticktick_id_map[ticktick_id] = task
+        return ticktick_id_map
+
+    async def _async_pull_projects(
+        self,
+        list_ids: Iterable[str],
+        list_mappings: dict[str, str],
+        stats: dict[str, int],
+    ) -> None:
+        """Fetch and reconcile several projects concurrently (bounded).
+
+        Every pull runs to completion; the first error is re-raised afterwards
+        so callers (e.g. delta checkpointing) still see the failure.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROJECT_PULLS)
+
+        async def pull(local_list_id: str) -> None:
+            async with semaphore:
+                with self.tracer.phase("reconcile", local_list_id):
+                    await self._async_pull_project(
+                        local_list_id, list_mappings[local_list_id], stats
                     )
 
-                    # CRITICAL: Merge TickTick section data with existing local sections
-                    # to preserve local-only fields like person_id.
-                    #
-                    # Bug Fix (2025-12-05): Previously, this code replaced sections
-                    # wholesale with TickTick data, losing person_id assignments on
-                    # every sync. Now we merge: TickTick provides id/name/sort_order
-                    # (source of truth for structure), while local data preserves
-                    # ChoreBot-specific extensions like person_id.
-                    existing_sections = self.store.get_sections_for_list(local_list_id)
-                    existing_sections_map = {s["id"]: s for s in existing_sections}
-
-                    # Merge TickTick data with existing sections
-                    sections = []
-                    for col in columns:
-                        col_id = col.get("id")
-                        # Start with existing section if it exists (preserves person_id and other local fields)
-                        section = existing_sections_map.get(col_id, {}).copy()
-                        # Update with TickTick data (name and sort_order from remote)
-                        section.update(
-                            {
-                                "id": col_id,
-                                "name": col.get("name"),
-                                "sort_order": col.get("sortOrder", 0),
-                            }
-                        )
-                        sections.append(section)
-
-                        # Log if we preserved a person_id during merge
-                        if "person_id" in section:
-                            _LOGGER.info(
-                                "[SECTION_SYNC] Preserved person_id='%s' for section '%s' (id: %s) during sync",
-                                section["person_id"],
-                                section["name"],
-                                col_id,
-                            )
-
-                    await self.store.async_set_sections(local_list_id, sections)
-                else:
-                    _LOGGER.info("No columns/sections found in project data")
-                    column_map = {}
-                    await self.store.async_set_sections(local_list_id, [])
+        results = await asyncio.gather(
+            *(pull(local_list_id) for local_list_id in list_ids),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
-                ticktick_tasks = project_data.get("tasks", [])
+    async def _async_pull_project(
+        self,
+        local_list_id: str,
+        project_id: str,
+        stats: dict[str, int],
+        snapshot: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """Fetch a full TickTick project and reconcile it with a local list.
 
-                # Get local templates and regular tasks (not instances)
-                local_templates = self.store.get_templates_for_list(local_list_id)
-                local_tasks = self.store.get_tasks_for_list(local_list_id)
-                local_regular_tasks = [
-                    t for t in local_tasks if not t.is_recurring_instance()
-                ]
+        Args:
+            local_list_id: Local list ID
+            project_id: TickTick project ID
+            stats: Sync statistics to update
+            snapshot: Every open task of the project, from batch/check/0,
+                reconciled instead of fetching the project (the response has
+                no columns, so local sections are kept)
+        """
+        assert self._client is not None
 
-                # Build mapping of ticktick_id -> local task (templates + regular tasks)
-                ticktick_id_map = {}
-                for task in local_templates + local_regular_tasks:
-                    ticktick_id = task.get_sync_id("ticktick")
-                    if ticktick_id:
-                        ticktick_id_map[ticktick_id] = task
-
-                # Process TickTick tasks
-                for tt_task in ticktick_tasks:
-                    tt_id = tt_task["id"]
-
-                    if tt_id in ticktick_id_map:
-                        # Task exists - check for updates
-                        local_task = ticktick_id_map[tt_id]
-
-                        # Check sync status
-                        tt_sync = local_task.sync.get("ticktick", {})
-                        sync_status = tt_sync.get("status", "synced")
-
-                        # Skip if local has pending or failed changes
-                        if sync_status in ["pending_push", "push_failed"]:
-                            _LOGGER.debug(
-                                "Skipping task '%s' - local has %s status",
-                                tt_task.get("title"),
-                                sync_status,
-                            )
-                            del ticktick_id_map[tt_id]
-                            continue
-
-                        # Compare etags to detect remote changes
-                        remote_etag = tt_task.get("etag")
-                        last_etag = tt_sync.get("etag")
-
-                        if remote_etag and remote_etag != last_etag:
-                            # Remote changed - update local
-                            column_id = tt_task.get("columnId")
-                            column_name = (
-                                column_map.get(column_id, "Unknown")
-                                if column_map
-                                else "No column"
-                            )
-                            _LOGGER.info(
-                                "UPDATED task from TickTick: '%s' (etag changed) - columnId: %s -> '%s'\nFull object:\n%s",
-                                tt_task["title"],
-                                column_id,
-                                column_name,
-                                json.dumps(tt_task, indent=2, default=str),
-                            )
-                            await self._update_local_from_ticktick(
-                                local_list_id, local_task, tt_task
-                            )
-                            # Update sync metadata (preserve existing fields like id, last_synced_occurrence_index)
-                            local_task.sync["ticktick"].update(
-                                {
-                                    "status": "synced",
-                                    "etag": remote_etag,
-                                    "last_synced_at": datetime.now(UTC)
-                                    .isoformat()
-                                    .replace("+00:00", "Z"),
-                                }
-                            )
-                            await self.store.async_update_task(
-                                local_list_id, local_task
-                            )
-                            stats["updated"] += 1
-
-                        # Remove from map (processed)
-                        del ticktick_id_map[tt_id]
+        if snapshot is None:
+            # Get TickTick tasks for this project
+            with self.tracer.phase("fetch", local_list_id):
+                project_data = await self._client.get_project_with_tasks(project_id)
+            self.tracer.count("projects_fetched")
+            self.tracer.capture(
+                "project", project_data, list_id=local_list_id, project_id=project_id
+            )
+        else:
+            project_data = {"tasks": snapshot}
 
-                    else:
-                        # New task from TickTick - import if recent
-                        if tt_task.get("status") == 2:  # Completed
-                            completed_time = tt_task.get("completedTime", 0)
-                            if completed_time:
-                                completed_dt = datetime.fromtimestamp(
-                                    completed_time / 1000, tz=UTC
-                                )
-                                if datetime.now(UTC) - completed_dt > timedelta(
-                                    days=30
-                                ):
-                                    _LOGGER.debug(
-                                        "Skipping old completed task: %s",
-                                        tt_task["title"],
-                                    )
-                                    continue
-
-                        column_id = tt_task.get("columnId")
-                        column_name = (
-                            column_map.get(column_id, "Unknown")
-                            if column_map
-                            else "No column"
+        # Short-circuit when nothing changed remotely since the last full reconcile
+        # (a snapshot has no columns, so it is never compared or remembered)
+        fingerprint = (
+            self._get_project_fingerprint(project_data) if snapshot is None else None
+        )
+        sync_info = self.store.get_list_sync_info(local_list_id, "ticktick") or {}
+        if fingerprint and fingerprint == sync_info.get("fingerprint"):
+            _LOGGER.debug(
+                "TickTick project %s unchanged (fingerprint %s), skipping list %s",
+                project_id,
+                fingerprint,
+                local_list_id,
+            )
+            self.tracer.count("projects_unchanged")
+            return
+        reconciled_cleanly = True
+
+        # Full payload goes to the sync trace (opt-in); keep logs proportional to counts
+        _LOGGER.debug(
+            "TickTick project for list '%s' (project_id: %s): %d tasks, %d columns",
+            local_list_id,
+            project_id,
+            len(project_data.get("tasks", [])),
+            len(project_data.get("columns", [])),
+        )
+
+        # Extract and log columns (sections) if available
+        columns = project_data.get("columns", [])
+        if snapshot is not None:
+            column_map = {
+                s["id"]: s.get("name")
+                for s in self.store.get_sections_for_list(local_list_id)
+            }
+        elif columns:
+            column_map = {col.get("id"): col.get("name") for col in columns}
+            _LOGGER.debug(
+                "Project columns/sections mapping (columnId -> name): %s", column_map
+            )
+
+            # CRITICAL: Merge TickTick section data with existing local sections
+            # to preserve local-only fields like person_id.
+            #
+            # Bug Fix (2025-12-05): Previously, this code replaced sections
+            # wholesale with TickTick data, losing person_id assignments on
+            # every sync. Now we merge: TickTick provides id/name/sort_order
+            # (source of truth for structure), while local data preserves
+            # ChoreBot-specific extensions like person_id.
+            existing_sections = self.store.get_sections_for_list(local_list_id)
+            existing_sections_map = {s["id"]: s for s in existing_sections}
+
+            # Merge TickTick data with existing sections
+            sections = []
+            for col in columns:
+                col_id = col.get("id")
+                # Start with existing section if it exists (preserves person_id and other local fields)
+                section = existing_sections_map.get(col_id, {}).copy()
+                # Update with TickTick data (name and sort_order from remote)
+                section.update(
+                    {
+                        "id": col_id,
+                        "name": col.get("name"),
+                        "sort_order": col.get("sortOrder", 0),
+                    }
+                )
+                sections.append(section)
+
+                # Log if we preserved a person_id during merge
+                if "person_id" in section:
+                    _LOGGER.debug(
+                        "[SECTION_SYNC] Preserved person_id='%s' for section '%s' (id: %s) during sync",
+                        section["person_id"],
+                        section["name"],
+                        col_id,
+                    )
+
+            # Only save when the merged sections actually differ
+            if sections != existing_sections:
+                await self.store.async_set_sections(local_list_id, sections)
+        else:
+            _LOGGER.debug("No columns/sections found in project data")
+            column_map = {}
+            if self.store.get_sections_for_list(local_list_id):
+                await self.store.async_set_sections(local_list_id, [])
+
+        ticktick_tasks = project_data.get("tasks", [])
+
+        # Build mapping of ticktick_id -> local task (templates + regular tasks)
+        ticktick_id_map = self._build_ticktick_id_map(local_list_id)
+
+        # Process TickTick tasks
+        for tt_task in ticktick_tasks:
+            await self._async_apply_remote_task(
+                local_list_id, tt_task, ticktick_id_map, column_map, stats
+            )
+
+        # Check for missing tasks (could be deleted OR completed)
+        # TickTick's get_project_with_tasks endpoint doesn't return completed tasks,
+        # so we need to individually check each missing task to determine if it was
+        # completed or actually deleted.
+        # OPTIMIZATION: Skip tasks that are already marked as completed locally to avoid
+        # unnecessary API calls on every sync.
+        for local_task in ticktick_id_map.values():
+            if local_task.is_deleted():
+                # Already deleted locally, skip
+                continue
+
+            if local_task.status == "completed":
+                # Already completed locally, no need to check TickTick
+                # (TickTick doesn't return completed tasks in bulk query)
+                _LOGGER.debug(
+                    "Skipping completed task '%s' - already marked complete locally",
+                    local_task.summary,
+                )
+                continue
+
+            ticktick_id = local_task.get_sync_id("ticktick")
+            if ticktick_id:
+                # Task is incomplete locally but missing from TickTick sync
+                # Check if it was completed or deleted by fetching individual task
+                try:
+                    with self.tracer.phase("fetch", local_list_id):
+                        tt_task = await self._client.get_task(project_id, ticktick_id)
+
+                    # Special handling for recurring templates:
+                    # If a template is missing from bulk response but still exists individually,
+                    # it might be "hidden" in TickTick (deleted but API still returns it).
+                    # In this case, delete the template AND all its instances to respect the
+                    # remote deletion.
+                    if local_task.is_recurring_template() and tt_task.get(
+                        "repeatFlag"
+                    ):
+                        instances = self.store.get_instances_for_template(
+                            local_list_id, local_task.uid
                         )
+
+                        # Template not in bulk response = user deleted it remotely
+                        # Delete template and all instances
                         _LOGGER.info(
-                            "NEW TASK from TickTick: '%s' - columnId: %s -> column/section: '%s'\nFull raw object:\n%s",
-                            tt_task["title"],
-                            column_id,
-                            column_name,
-                            json.dumps(tt_task, indent=2, default=str),
+                            "ORPHANED recurring template on TickTick: '%s' (uid: %s) - "
+                            "deleted remotely, soft-deleting template and %d instance(s) locally",
+                            local_task.summary,
+                            local_task.uid,
+                            len(instances),
                         )
-                        await self._import_ticktick_task(local_list_id, tt_task)
-                        stats["created"] += 1
-
-                # Check for missing tasks (could be deleted OR completed)
-                # TickTick's get_project_with_tasks endpoint doesn't return completed tasks,
-                # so we need to individually check each missing task to determine if it was
-                # completed or actually deleted.
-                # OPTIMIZATION: Skip tasks that are already marked as completed locally to avoid
-                # unnecessary API calls on every sync.
-                for local_task in ticktick_id_map.values():
-                    if local_task.is_deleted():
-                        # Already deleted locally, skip
-                        continue
-
-                    if local_task.status == "completed":
-                        # Already completed locally, no need to check TickTick
-                        # (TickTick doesn't return completed tasks in bulk query)
-                        _LOGGER.debug(
-                            "Skipping completed task '%s' - already marked complete locally",
+                        await self._async_soft_delete_local(
+                            local_list_id, local_task, stats
+                        )
+                        continue  # Skip the normal update logic
+
+                    # Task exists on TickTick - update locally (likely completed or just hidden from bulk)
+                    _LOGGER.info(
+                        "UPDATED task from TickTick individual query: '%s' (uid: %s)",
+                        local_task.summary,
+                        local_task.uid,
+                    )
+                    await self._update_local_from_ticktick(
+                        local_list_id, local_task, tt_task
+                    )
+                    # Update sync metadata
+                    local_task.sync["ticktick"].update(
+                        {
+                            "status": "synced",
+                            "etag": tt_task.get("etag"),
+                            "last_synced_at": datetime.now(UTC)
+                            .isoformat()
+                            .replace("+00:00", "Z"),
+                        }
+                    )
+                    await self.store.async_update_task(local_list_id, local_task)
+                    stats["updated"] += 1
+                except Exception as err:  # noqa: BLE001
+                    # If 404 or task not found, it was deleted
+                    error_str = str(err)
+                    if "404" in error_str or "not found" in error_str.lower():
+                        _LOGGER.info(
+                            "DELETED task on TickTick: '%s' (uid: %s) - soft-deleting locally",
                             local_task.summary,
+                            local_task.uid,
                         )
-                        continue
-
-                    ticktick_id = local_task.get_sync_id("ticktick")
-                    if ticktick_id:
-                        # Task is incomplete locally but missing from TickTick sync
-                        # Check if it was completed or deleted by fetching individual task
-                        try:
-                            tt_task = await self._client.get_task(
-                                project_id, ticktick_id
-                            )
-
-                            # Special handling for recurring templates:
-                            # If a template is missing from bulk response but still exists individually,
-                            # it might be "hidden" in TickTick (deleted but API still returns it).
-                            # In this case, delete the template AND all its instances to respect the
-                            # remote deletion.
-                            if local_task.is_recurring_template() and tt_task.get(
-                                "repeatFlag"
-                            ):
-                                instances = self.store.get_instances_for_template(
-                                    local_list_id, local_task.uid
-                                )
-                                active_instances = [
-                                    i
-                                    for i in instances
-                                    if i.status != "completed" and not i.is_deleted()
-                                ]
-
-                                # Template not in bulk response = user deleted it remotely
-                                # Delete template and all instances
-                                _LOGGER.info(
-                                    "ORPHANED recurring template on TickTick: '%s' (uid: %s) - "
-                                    "deleted remotely, soft-deleting template and %d instance(s) locally",
-                                    local_task.summary,
-                                    local_task.uid,
-                                    len(instances),
-                                )
-
-                                # Soft-delete the template
-                                local_task.mark_deleted()
-                                await self.store.async_update_task(
-                                    local_list_id, local_task
-                                )
-                                stats["deleted"] += 1
-
-                                # Soft-delete all instances
-                                for instance in instances:
-                                    if not instance.is_deleted():
-                                        instance.mark_deleted()
-                                        await self.store.async_update_task(
-                                            local_list_id, instance
-                                        )
-                                        stats["deleted"] += 1
-                                        _LOGGER.debug(
-                                            "Soft-deleted instance '%s' of orphaned template",
-                                            instance.uid,
-                                        )
-
-                                continue  # Skip the normal update logic
-                                active_instances = [
-                                    i
-                                    for i in instances
-                                    if i.status != "completed" and not i.is_deleted()
-                                ]
-
-                                if not active_instances:
-                                    # No active instances - template should be cleaned up
-                                    _LOGGER.info(
-                                        "ORPHANED recurring template on TickTick: '%s' (uid: %s) - "
-                                        "no active instances, soft-deleting locally",
-                                        local_task.summary,
-                                        local_task.uid,
-                                    )
-                                    local_task.mark_deleted()
-                                    await self.store.async_update_task(
-                                        local_list_id, local_task
-                                    )
-                                    stats["deleted"] += 1
-                                    continue  # Skip the normal update logic
-                                else:
-                                    # Has active instances - keep template but log warning
-                                    _LOGGER.warning(
-                                        "Recurring template '%s' (uid: %s) not in bulk response "
-                                        "but has %d active instance(s) - keeping template",
-                                        local_task.summary,
-                                        local_task.uid,
-                                        len(active_instances),
-                                    )
-
-                            # Task exists on TickTick - update locally (likely completed or just hidden from bulk)
-                            _LOGGER.info(
-                                "UPDATED task from TickTick individual query: '%s' (uid: %s)",
-                                local_task.summary,
-                                local_task.uid,
-                            )
-                            await self._update_local_from_ticktick(
-                                local_list_id, local_task, tt_task
-                            )
-                            # Update sync metadata
-                            local_task.sync["ticktick"].update(
-                                {
-                                    "status": "synced",
-                                    "etag": tt_task.get("etag"),
-                                    "last_synced_at": datetime.now(UTC)
-                                    .isoformat()
-                                    .replace("+00:00", "Z"),
-                                }
-                            )
-                            await self.store.async_update_task(
-                                local_list_id, local_task
-                            )
-                            stats["updated"] += 1
-                        except Exception as err:  # noqa: BLE001
-                            # If 404 or task not found, it was deleted
-                            error_str = str(err)
-                            if "404" in error_str or "not found" in error_str.lower():
-                                _LOGGER.info(
-                                    "DELETED task on TickTick: '%s' (uid: %s) - soft-deleting locally",
-                                    local_task.summary,
-                                    local_task.uid,
-                                )
-                                local_task.mark_deleted()
-                                await self.store.async_update_task(
-                                    local_list_id, local_task
-                                )
-                                stats["deleted"] += 1
-                            else:
-                                # Some other error - log it but don't modify task
-                                _LOGGER.error(
-                                    "Error checking task '%s' on TickTick: %s - skipping",
-                                    local_task.summary,
-                                    err,
-                                )
+                        local_task.mark_deleted()
+                        await self.store.async_update_task(local_list_id, local_task)
+                        stats["deleted"] += 1
                     else:
-                        # No TickTick ID means it was never synced
-                        _LOGGER.warning(
-                            "Task '%s' has no TickTick ID but was in sync map - skipping",
+                        # Some other error - log it but don't modify task
+                        _LOGGER.error(
+                            "Error checking task '%s' on TickTick: %s - skipping",
                             local_task.summary,
+                            err,
                         )
+                        # Re-check on the next sync even if the project is unchanged
+                        reconciled_cleanly = False
+            else:
+                # No TickTick ID means it was never synced
+                _LOGGER.warning(
+                    "Task '%s' has no TickTick ID but was in sync map - skipping",
+                    local_task.summary,
+                )
 
-            _LOGGER.info("Pull sync completed: %s", stats)
+        # Remember what we reconciled against so an unchanged project is skipped next time
+        if reconciled_cleanly and sync_info and fingerprint:
+            await self.store.async_set_list_sync_info(
+                local_list_id, "ticktick", {**sync_info, "fingerprint": fingerprint}
+            )
 
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.error("Error during pull sync: %s", err)
+    def _get_project_fingerprint(self, project_data: dict[str, Any]) -> str:
+        """Hash task ids/etags and column ids/names/sort orders of a project.
 
-        return stats
+        Any remote task edit changes its etag, and any column change alters the
+        column tuple, so an equal fingerprint means the project is unchanged.
+        """
+        tasks = sorted(
+            (t.get("id", ""), t.get("etag") or "")
+            for t in project_data.get("tasks", [])
+        )
+        columns = sorted(
+            (c.get("id") or "", c.get("name") or "", c.get("sortOrder", 0))
+            for c in project_data.get("columns", [])
+        )
+        payload = json.dumps([tasks, columns], separators=(",", ":"))
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    async def _async_apply_remote_task(
+        self,
+        local_list_id: str,
+        tt_task: dict[str, Any],
+        ticktick_id_map: dict[str, Task],
+        column_map: dict[str, Any],
+        stats: dict[str, int],
+    ) -> None:
+        """Apply a single TickTick task to a local list.
+
+        Processed tasks are removed from ticktick_id_map so the caller can
+        reconcile whatever is left as missing remotely.
+        """
+        tt_id = tt_task["id"]
+
+        if tt_id in ticktick_id_map:
+            # Task exists - check for updates. Re-read the latest committed
+            # version: the map was built before the fetch, and a local edit
+            # committed meanwhile must not be overwritten by a stale copy.
+            local_task = ticktick_id_map[tt_id]
+            latest = (
+                self.store.get_template(local_list_id, local_task.uid)
+                if local_task.is_recurring_template()
+                else self.store.get_task(local_list_id, local_task.uid)
+            )
+            if latest is not None:
+                local_task = latest
+
+            # Check sync status
+            tt_sync = local_task.sync.get("ticktick", {})
+            sync_status = tt_sync.get("status", "synced")
+
+            # Skip if local has pending or failed changes
+            if sync_status in ["pending_push", "push_failed"]:
+                _LOGGER.debug(
+                    "Skipping task '%s' - local has %s status",
+                    tt_task.get("title"),
+                    sync_status,
+                )
+                del ticktick_id_map[tt_id]
+                return
+
+            # Compare etags to detect remote changes
+            remote_etag = tt_task.get("etag")
+            last_etag = tt_sync.get("etag")
+
+            if remote_etag and remote_etag != last_etag:
+                # Remote changed - update local
+                column_id = tt_task.get("columnId")
+                column_name = (
+                    column_map.get(column_id, "Unknown") if column_map else "No column"
+                )
+                _LOGGER.debug(
+                    "UPDATED task from TickTick: '%s' (etag changed) - columnId: %s -> '%s'",
+                    tt_task["title"],
+                    column_id,
+                    column_name,
+                )
+                self.tracer.capture(
+                    "task_updated", tt_task, list_id=local_list_id, task_id=tt_id
+                )
+                await self._update_local_from_ticktick(
+                    local_list_id, local_task, tt_task
+                )
+                # Update sync metadata (preserve existing fields like id, last_synced_occurrence_index)
+                local_task.sync["ticktick"].update(
+                    {
+                        "status": "synced",
+                        "etag": remote_etag,
+                        "last_synced_at": datetime.now(UTC)
+                        .isoformat()
+                        .replace("+00:00", "Z"),
+                    }
+                )
+                await self.store.async_update_task(local_list_id, local_task)
+                stats["updated"] += 1
+
+            # Remove from map (processed)
+            del ticktick_id_map[tt_id]
+            return
+
+        # New task from TickTick - import if recent
+        if tt_task.get("status") == 2:  # Completed
+            completed_dt = self._parse_completed_time(tt_task.get("completedTime"))
+            if completed_dt and datetime.now(UTC) - completed_dt > timedelta(days=30):
+                _LOGGER.debug("Skipping old completed task: %s", tt_task["title"])
+                return
+
+        column_id = tt_task.get("columnId")
+        column_name = column_map.get(column_id, "Unknown") if column_map else "No column"
+        _LOGGER.debug(
+            "NEW TASK from TickTick: '%s' - columnId: %s -> column/section: '%s'",
+            tt_task["title"],
+            column_id,
+            column_name,
+        )
+        self.tracer.capture("task_new", tt_task, list_id=local_list_id, task_id=tt_id)
+        await self._import_ticktick_task(local_list_id, tt_task)
+        stats["created"] += 1
+
+    def _parse_completed_time(self, completed_time: Any) -> datetime | None:
+        """Parse TickTick completedTime (epoch milliseconds or date string) to UTC."""
+        if not completed_time:
+            return None
+        if isinstance(completed_time, (int, float)):
+            return datetime.fromtimestamp(completed_time / 1000, tz=UTC)
+        try:
+            return datetime.fromisoformat(
+                self._normalize_ticktick_date(str(completed_time))
+            )
+        except ValueError:
+            _LOGGER.debug("Unparseable completedTime: %s", completed_time)
+            return None
 
     async def _handle_remote_completion(
         self, list_id: str, template: Task, ticktick_task: dict[str, Any]
@@ -924,47 +1319,28 @@ class TickTickBackend(SyncBackend):
         old_instance.status = "completed"
 
         # Set completion time from TickTick (convert from milliseconds)
-        completed_time_ms = ticktick_task.get("completedTime")
-        if completed_time_ms:
-            completed_dt = datetime.fromtimestamp(completed_time_ms / 1000, tz=UTC)
-            old_instance.last_completed = completed_dt.isoformat().replace(
-                "+00:00", "Z"
-            )
-        else:
-            old_instance.last_completed = (
-                datetime.now(UTC).isoformat().replace("+00:00", "Z")
-            )
-
-        # Check if completed on time (for streak tracking)
-        completed_on_time = False
-        if old_instance.due:
-            due_dt = datetime.fromisoformat(old_instance.due)
-            completed_dt = datetime.fromisoformat(old_instance.last_completed)
-
-            if old_instance.is_all_day:
-                # For all-day tasks, compare dates only
-                completed_on_time = completed_dt.date() <= due_dt.date()
-            else:
-                # For timed tasks, compare full datetime
-                completed_on_time = completed_dt <= due_dt
-
-        # Update streak on template
-        if completed_on_time:
-            template.streak_current += 1
-            template.streak_longest = max(
-                template.streak_longest, template.streak_current
-            )
-            _LOGGER.info(
-                "Streak incremented for template %s: current=%d, longest=%d",
-                template.summary,
-                template.streak_current,
-                template.streak_longest,
-            )
-        else:
-            _LOGGER.info(
-                "Instance completed late, resetting streak for: %s", template.summary
-            )
-            template.streak_current = 0
+        completed_dt = self._parse_completed_time(
+            ticktick_task.get("completedTime")
+        ) or datetime.now(UTC)
+        if completed_dt.tzinfo is None:
+            completed_dt = completed_dt.replace(tzinfo=UTC)
+        old_instance.last_completed = completed_dt.isoformat().replace("+00:00", "Z")
+
+        # Check if completed on time: before its due day ended (the same rule
+        # as local completions)
+        overdue_at = old_instance.overdue_at()
+        old_instance.completed_on_time = overdue_at is None or completed_dt < overdue_at
+
+        # Update streak on template like a local completion: every completion
+        # counts; a missed due day already reset the streak when it ended
+        template.streak_current += 1
+        template.streak_longest = max(template.streak_longest, template.streak_current)
+        _LOGGER.info(
+            "Streak incremented for template %s: current=%d, longest=%d",
+            template.summary,
+            template.streak_current,
+            template.streak_longest,
+        )
 
         old_instance.update_modified()
         await self.store.async_update_task(list_id, old_instance)
@@ -1127,13 +1503,13 @@ class TickTickBackend(SyncBackend):
 
         # Update section_id from columnId
         column_id = ticktick_task.get("columnId")
-        _LOGGER.info(
+        _LOGGER.debug(
             "[SECTION_DEBUG] Task '%s' (uid: %s) - TickTick columnId: %s",
             local_task.summary,
             local_task.uid,
             column_id if column_id else "NOT PROVIDED (will set to None)",
         )
-        _LOGGER.info(
+        _LOGGER.debug(
             "[SECTION_DEBUG] Task '%s' - BEFORE assignment: local_task.section_id = %s",
             local_task.summary,
             local_task.section_id,
@@ -1141,7 +1517,7 @@ class TickTickBackend(SyncBackend):
         if column_id:
             # TickTick returned a valid columnId - use it
             local_task.section_id = column_id
-            _LOGGER.info(
+            _LOGGER.debug(
                 "[SECTION_DEBUG] Task '%s' - AFTER assignment: local_task.section_id = %s (SET from columnId)",
                 local_task.summary,
                 local_task.section_id,
@@ -1150,7 +1526,7 @@ class TickTickBackend(SyncBackend):
             # TickTick says task has no column - clear section_id
             # (TickTick is source of truth for section assignments)
             local_task.section_id = None
-            _LOGGER.info(
+            _LOGGER.debug(
                 "[SECTION_DEBUG] Task '%s' - AFTER assignment: local_task.section_id = None (CLEARED - no columnId)",
                 local_task.summary,
             )
@@ -1211,7 +1587,7 @@ class TickTickBackend(SyncBackend):
 
         # Extract section_id from columnId
         section_id = ticktick_task.get("columnId")
-        _LOGGER.info(
+        _LOGGER.debug(
             "[SECTION_DEBUG] IMPORT - Task '%s' - TickTick columnId: %s",
             ticktick_task.get("title"),
             section_id if section_id else "NOT PROVIDED",
@@ -1219,7 +1595,7 @@ class TickTickBackend(SyncBackend):
         if not section_id:
             # Use default section if no columnId specified
             section_id = self.store.get_default_section_id(list_id)
-            _LOGGER.info(
+            _LOGGER.debug(
                 "[SECTION_DEBUG] IMPORT - Task '%s' - Using default section_id: %s",
                 ticktick_task.get("title"),
                 section_id,
@@ -1277,11 +1653,7 @@ class TickTickBackend(SyncBackend):
 
             # Add to store
             await self.store.async_add_task(list_id, template)
-            _LOGGER.info(
-                "Template created with uid: %s - Converted Task object:\n%s",
-                template.uid,
-                json.dumps(template.to_dict(), indent=2, default=str),
-            )
+            _LOGGER.debug("Template created with uid: %s", template.uid)
 
             # Create first instance if there's a due date
             if "dueDate" in ticktick_task:
@@ -1304,11 +1676,7 @@ class TickTickBackend(SyncBackend):
                     section_id=section_id,
                 )
                 await self.store.async_add_task(list_id, first_instance)
-                _LOGGER.info(
-                    "First instance created with uid: %s - Converted Task object:\n%s",
-                    first_instance.uid,
-                    json.dumps(first_instance.to_dict(), indent=2, default=str),
-                )
+                _LOGGER.debug("First instance created with uid: %s", first_instance.uid)
 
         else:
             # Create regular task
@@ -1343,8 +1711,4 @@ class TickTickBackend(SyncBackend):
 
             # Add to store
             await self.store.async_add_task(list_id, task)
-            _LOGGER.info(
-                "Regular task created with uid: %s - Converted Task object:\n%s",
-                task.uid,
-                json.dumps(task.to_dict(), indent=2, default=str),
-            )
+            _LOGGER.debug("Regular task created with uid: %s", task.uid)
@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
 import logging
+from typing import Any
 
 from dateutil.rrule import rrulestr
 
 from homeassistant.components.todo import TodoItem, TodoListEntity
 from homeassistant.components.todo.const import TodoItemStatus, TodoListEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .completion_context import CompletionContextBuilder
-from .const import DOMAIN
-from .store import ChoreBotStore
+from .completion_context import CompletionContext, CompletionContextBuilder
+from .const import (
+    CONF_SLIM_ATTRIBUTES,
+    DEFAULT_SLIM_ATTRIBUTES,
+    DOMAIN,
+    SIGNAL_LIST_ADDED,
+    SIGNAL_LIST_REMOVED,
+)
+from .people import PeopleStore
+from .store import ChoreBotStore, ListSnapshot
 from .task import Task
 
 _LOGGER = logging.getLogger(__name__)
@@ -34,9 +47,16 @@ async def async_setup_entry(
     lists = store.get_all_lists()
     _LOGGER.info("Found %d lists to set up", len(lists))
 
+    # Slim mode keeps the full task arrays out of the recorder database
+    entity_class = (
+        ChoreBotSlimList
+        if config_entry.options.get(CONF_SLIM_ATTRIBUTES, DEFAULT_SLIM_ATTRIBUTES)
+        else ChoreBotList
+    )
+
     # Create entity for each list
     entities = [
-        ChoreBotList(hass, store, list_config["id"], list_config["name"])
+        entity_class(hass, store, list_config["id"], list_config["name"])
         for list_config in lists
     ]
     _LOGGER.info("Created %d entities", len(entities))
@@ -47,6 +67,103 @@ async def async_setup_entry(
     async_add_entities(entities)
     _LOGGER.info("Entities added successfully")
 
+    # Lists created or deleted at runtime add/remove only their own entity
+    @callback
+    def async_add_list(list_id: str) -> None:
+        """Add the entity of a newly created list."""
+        entities_by_list = hass.data[DOMAIN].setdefault("entities", {})
+        list_config = store.get_list(list_id)
+        if list_config is None or list_id in entities_by_list:
+            return
+
+        entity = entity_class(hass, store, list_id, list_config["name"])
+        entities_by_list[list_id] = entity
+        async_add_entities([entity])
+        _LOGGER.info("Added entity for new list: %s", list_id)
+
+    async def async_remove_list(list_id: str) -> None:
+        """Remove the entity (and its registry entry) of a deleted list."""
+        entity = hass.data[DOMAIN].get("entities", {}).pop(list_id, None)
+        if entity is None:
+            return
+
+        entity_id = entity.entity_id
+        await entity.async_remove(force_remove=True)
+        registry = er.async_get(hass)
+        if entity_id and registry.async_get(entity_id):
+            registry.async_remove(entity_id)
+        _LOGGER.info("Removed entity for deleted list: %s", list_id)
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_LIST_ADDED, async_add_list)
+    )
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_LIST_REMOVED, async_remove_list)
+    )
+
+
+@dataclass
+class _UpdateBatch:
+    """Working copies and outcomes of a batch of task updates.
+
+    Every task or template touched by the batch is read once and then
+    edited as a working copy, so several updates to the same task compose.
+    """
+
+    tasks: dict[str, Task] = field(default_factory=dict)  # Working copies by UID
+    old_status: dict[str, str] = field(default_factory=dict)  # Committed status
+    # Committed ``modified`` of each working copy (checked when committing)
+    versions: dict[str, str] = field(default_factory=dict)
+    writes: dict[str, Task] = field(default_factory=dict)  # Plain edits
+    push: dict[str, Task] = field(default_factory=dict)  # Plain edits to sync
+    completions: dict[str, Task] = field(default_factory=dict)
+    uncompletes: dict[str, Task] = field(default_factory=dict)
+
+    def get_task(self, store: ChoreBotStore, list_id: str, uid: str) -> Task | None:
+        """Return the working copy of a task, reading it from the store once."""
+        if uid not in self.tasks:
+            task = store.get_task(list_id, uid)
+            if task is None:
+                return None
+            self.tasks[uid] = task
+            self.old_status[uid] = task.status
+            self.versions[uid] = task.modified
+        return self.tasks[uid]
+
+    def get_template(
+        self, store: ChoreBotStore, list_id: str, uid: str
+    ) -> Task | None:
+        """Return the working copy of a template, reading it from the store once."""
+        if uid not in self.tasks:
+            template = store.get_template(list_id, uid)
+            if template is None:
+                return None
+            self.tasks[uid] = template
+            self.versions[uid] = template.modified
+        return self.tasks[uid]
+
+    def stage_write(self, task: Task, push: bool) -> None:
+        """Stage a plain edit (optionally pushed to the sync backend)."""
+        self.completions.pop(task.uid, None)
+        self.uncompletes.pop(task.uid, None)
+        self.writes[task.uid] = task
+        if push:
+            self.push[task.uid] = task
+
+    def stage_completion(self, task: Task) -> None:
+        """Stage a needs_action → completed transition."""
+        self.writes.pop(task.uid, None)
+        self.push.pop(task.uid, None)
+        self.uncompletes.pop(task.uid, None)
+        self.completions[task.uid] = task
+
+    def stage_uncomplete(self, task: Task) -> None:
+        """Stage a completed → needs_action transition."""
+        self.writes.pop(task.uid, None)
+        self.push.pop(task.uid, None)
+        self.completions.pop(task.uid, None)
+        self.uncompletes[task.uid] = task
+
 
 class ChoreBotList(TodoListEntity):
     """A ChoreBot list (wraps HA's TodoListEntity)."""
@@ -104,16 +221,53 @@ class ChoreBotList(TodoListEntity):
         self._sync_coordinator = hass.data[DOMAIN].get("sync_coordinator")
         self._completion_builder = CompletionContextBuilder(store, list_id)
         self._audit_logger = hass.data[DOMAIN].get("audit_logger")
+        # Coalesced state writes (see async_schedule_state_write)
+        self._state_write_handle: asyncio.Handle | None = None
+        self._written_revision = -1
         _LOGGER.info("Initialized ChoreBotList entity: %s (id: %s)", list_name, list_id)
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending state write when the entity is removed."""
+        if self._state_write_handle is not None:
+            self._state_write_handle.cancel()
+            self._state_write_handle = None
+
+    @callback
+    def async_schedule_state_write(self) -> None:
+        """Mark the entity dirty; its state is written once on the next loop tick.
+
+        Several changes made while handling one call (store commits, points,
+        sync) therefore rebuild the attribute payload only once.
+        """
+        if self._state_write_handle is None:
+            self._state_write_handle = self.hass.loop.call_soon(
+                self._async_write_scheduled_state
+            )
+
+    @callback
+    def _async_write_scheduled_state(self) -> None:
+        """Write the state scheduled by async_schedule_state_write."""
+        self._state_write_handle = None
+        self._written_revision = self._store.get_revision(self._list_id)
+        self.async_write_ha_state()
+
+    @callback
+    def async_refresh_if_changed(self) -> bool:
+        """Schedule a state write if the list changed since the last one.
+
+        Returns:
+            True if a write was scheduled
+        """
+        if self._store.get_revision(self._list_id) == self._written_revision:
+            return False
+        self.async_schedule_state_write()
+        return True
+
     @property
     def todo_items(self) -> list[TodoItem] | None:  # pyright: ignore[reportIncompatibleVariableOverride]
         """Return the todo items (HA format)."""
-        # Get tasks from store (templates already separated, only returns tasks)
-        tasks = self._store.get_tasks_for_list(self._list_id)
-
-        # Filter out soft-deleted tasks
-        visible_tasks = [t for t in tasks if not t.is_deleted()]
+        # Snapshot only holds visible (non-deleted) tasks, templates excluded
+        visible_tasks = self._store.get_list_snapshot(self._list_id).tasks.values()
 
         _LOGGER.debug(
             "Building todo_items for %s: %d visible tasks",
@@ -127,58 +281,38 @@ class ChoreBotList(TodoListEntity):
     @property
     def extra_state_attributes(self) -> dict:  # pyright: ignore[reportIncompatibleVariableOverride]
         """Expose additional ChoreBot data to frontend."""
-        # Get tasks (regular tasks and recurring instances)
-        tasks = self._store.get_tasks_for_list(self._list_id)
-        visible_tasks = [t for t in tasks if not t.is_deleted()]
-
-        # Get templates (for streak lookups)
-        templates = self._store.get_templates_for_list(self._list_id)
-        visible_templates = [t for t in templates if not t.is_deleted()]
-
-        # Get sections for this list
-        # CRITICAL: Deep copy sections to ensure HA detects state changes
-        # When extra_state_attributes returns the same list/dict references,
-        # HA's state machine won't recognize that the contents changed, causing
-        # the UI to show stale data until restart. Deep copy ensures new references.
-        import copy
-
-        sections = copy.deepcopy(self._store.get_sections_for_list(self._list_id))
-
-        # Extract all unique tags from tasks and templates
-        all_tags = set()
-        for task in visible_tasks:
-            if task.tags:
-                all_tags.update(task.tags)
-        for template in visible_templates:
-            if template.tags:
-                all_tags.update(template.tags)
+        # Read one consistent revision of the list. Snapshot contents are
+        # never mutated by the store (edits commit replacement objects and a
+        # new snapshot), so HA sees new references whenever the list changes
+        # without us deep copying sections/metadata on every state write.
+        snapshot = self._store.get_list_snapshot(self._list_id)
+        visible_tasks = list(snapshot.tasks.values())
+        visible_templates = list(snapshot.templates.values())
 
         _LOGGER.debug(
             "Building extra_state_attributes for %s: %d tasks, %d templates, %d sections, %d tags",
             self._list_id,
             len(visible_tasks),
             len(visible_templates),
-            len(sections),
-            len(all_tags),
+            len(snapshot.sections),
+            len(snapshot.tags),
         )
 
-        # Get list metadata (person_id, etc.)
-        list_metadata = self._store._metadata_cache.get(self._list_id, {})
-
         return {
-            "chorebot_tasks": [
-                {
-                    **task.to_dict(),
-                    "computed_person_id": self._resolve_person_id_for_task(task),
-                }
-                for task in visible_tasks
-            ],
+            "chorebot_tasks": [self.task_payload(task) for task in visible_tasks],
             "chorebot_templates": [
                 template.to_dict() for template in visible_templates
             ],
-            "chorebot_sections": sections,
-            "chorebot_tags": sorted(list(all_tags)),
-            "chorebot_metadata": list_metadata,
+            "chorebot_sections": list(snapshot.sections),
+            "chorebot_tags": list(snapshot.tags),
+            "chorebot_metadata": dict(snapshot.metadata),
+        }
+
+    def task_payload(self, task: Task) -> dict:
+        """Serialize a task for the frontend (adds computed_person_id)."""
+        return {
+            **task.to_dict(),
+            "computed_person_id": self._resolve_person_id_for_task(task),
         }
 
     def _task_to_todo_item(self, task: Task) -> TodoItem:
@@ -270,6 +404,82 @@ class ChoreBotList(TodoListEntity):
         This is the single source of truth for task creation.
         Handles regular tasks, date-based recurring, and dateless recurring tasks.
         """
+        await self.async_create_tasks_internal(
+            [
+                {
+                    "summary": summary,
+                    "description": description,
+                    "due": due,
+                    "tags": tags,
+                    "rrule": rrule,
+                    "is_all_day": is_all_day,
+                    "section_id": section_id,
+                    "points_value": points_value,
+                    "streak_bonus_points": streak_bonus_points,
+                    "streak_bonus_interval": streak_bonus_interval,
+                    "is_dateless_recurring": is_dateless_recurring,
+                }
+            ]
+        )
+
+    async def async_create_tasks_internal(self, items: list[dict[str, Any]]) -> int:
+        """Create several tasks with one store commit and one state write.
+
+        Args:
+            items: Keyword arguments of async_create_task_internal, one dict
+                per task to create
+
+        Returns:
+            Number of tasks created (invalid items are skipped)
+        """
+        tasks: list[Task] = []
+        to_push: list[Task] = []
+        created = 0
+        for item in items:
+            built = self._build_new_tasks(**item)
+            if built is None:
+                continue
+            new_tasks, push_task = built
+            tasks.extend(new_tasks)
+            if push_task:
+                to_push.append(push_task)
+            created += 1
+
+        if not tasks:
+            return 0
+
+        await self._store.async_put_tasks(self._list_id, tasks)
+
+        # Schedule a state write (coalesced with other changes this tick)
+        _LOGGER.debug("Scheduling HA state write after creating %d tasks", created)
+        self.async_schedule_state_write()
+
+        # Push to remote backend if sync is enabled
+        if self._sync_coordinator and to_push:
+            await self._sync_coordinator.async_push_tasks(self._list_id, to_push)
+
+        return created
+
+    def _build_new_tasks(
+        self,
+        summary: str,
+        description: str | None = None,
+        due: str | None = None,
+        tags: list[str] | None = None,
+        rrule: str | None = None,
+        is_all_day: bool = False,
+        section_id: str | None = None,
+        points_value: int = 0,
+        streak_bonus_points: int = 0,
+        streak_bonus_interval: int = 0,
+        is_dateless_recurring: bool = False,
+    ) -> tuple[list[Task], Task | None] | None:
+        """Build the task(s) for a new task without committing them.
+
+        Returns:
+            (tasks to write, task to push to the sync backend or None), or
+            None if the task is invalid
+        """
         _LOGGER.info(
             "Creating task internally: %s (recurring=%s, dateless=%s)",
             summary,
@@ -317,24 +527,17 @@ class ChoreBotList(TodoListEntity):
             _LOGGER.debug(
                 "Creating date-based recurring task template and first instance"
             )
-            await self._store.async_add_task(self._list_id, template)
-            await self._store.async_add_task(self._list_id, first_instance)
-
-            # Write state immediately
-            self.async_write_ha_state()
+            # Only the template is synced for recurring tasks
+            return [template, first_instance], template
 
-            # Push to remote backend if sync is enabled (only sync template for recurring)
-            if self._sync_coordinator:
-                await self._sync_coordinator.async_push_task(self._list_id, template)
-
-        elif is_dateless_recurring:
+        if is_dateless_recurring:
             # Case 2: Dateless recurring task (NEW)
             # Validation: Cannot have both rrule and dateless
             if rrule:
                 _LOGGER.error(
                     "Cannot create task with both rrule and is_dateless_recurring"
                 )
-                return
+                return None
 
             # Create template
             template = Task.create_new(
@@ -369,43 +572,25 @@ class ChoreBotList(TodoListEntity):
             # First instance starts at streak 0 (template starts at 0)
             first_instance.streak_when_created = 0
 
-            _LOGGER.info("Creating dateless recurring task (local-only, no sync)")
-            await self._store.async_add_task(self._list_id, template)
-            await self._store.async_add_task(self._list_id, first_instance)
-
-            # Write state immediately
-            self.async_write_ha_state()
-
             # DO NOT sync dateless recurring to TickTick (local-only)
-            _LOGGER.debug("Dateless recurring task created, skipping sync")
-
-        else:
-            # Create regular task
-            task = Task.create_new(
-                summary=summary,
-                description=description,
-                due=due,
-                tags=tags or [],
-                rrule=None,
-                is_all_day=is_all_day,
-                section_id=section_id,
-                points_value=points_value,
-            )
-            # Set bonus fields (though they won't be used for non-recurring tasks)
-            task.streak_bonus_points = streak_bonus_points
-            task.streak_bonus_interval = streak_bonus_interval
-
-            await self._store.async_add_task(self._list_id, task)
-
-            # Write state immediately
-            _LOGGER.debug(
-                "Writing HA state immediately after creating task: %s", task.summary
-            )
-            self.async_write_ha_state()
-
-            # Push to remote backend if sync is enabled
-            if self._sync_coordinator:
-                await self._sync_coordinator.async_push_task(self._list_id, task)
+            _LOGGER.info("Creating dateless recurring task (local-only, no sync)")
+            return [template, first_instance], None
+
+        # Create regular task
+        task = Task.create_new(
+            summary=summary,
+            description=description,
+            due=due,
+            tags=tags or [],
+            rrule=None,
+            is_all_day=is_all_day,
+            section_id=section_id,
+            points_value=points_value,
+        )
+        # Set bonus fields (though they won't be used for non-recurring tasks)
+        task.streak_bonus_points = streak_bonus_points
+        task.streak_bonus_interval = streak_bonus_interval
+        return [task], task
 
     async def async_update_task_internal(
         self,
@@ -433,6 +618,111 @@ class ChoreBotList(TodoListEntity):
             All other fields: Optional - only provided fields are updated
             include_future_occurrences: For recurring instances, update template too
         """
+        await self.async_update_tasks_internal(
+            [
+                {
+                    "uid": uid,
+                    "summary": summary,
+                    "description": description,
+                    "due": due,
+                    "status": status,
+                    "tags": tags,
+                    "is_all_day": is_all_day,
+                    "section_id": section_id,
+                    "points_value": points_value,
+                    "streak_bonus_points": streak_bonus_points,
+                    "streak_bonus_interval": streak_bonus_interval,
+                    "rrule": rrule,
+                    "include_future_occurrences": include_future_occurrences,
+                }
+            ]
+        )
+
+    async def async_update_tasks_internal(self, updates: list[dict[str, Any]]) -> None:
+        """Apply several task updates as one batch.
+
+        Plain edits (including template changes) and uncompletes are written
+        with one store commit (through the completion committer, together
+        with the point deductions, if any), completions are committed
+        together through the completion committer, state is written once and
+        the changed tasks are pushed to the sync backend as one batch. Updates to the same task compose in
+        order.
+
+        Args:
+            updates: Keyword arguments of async_update_task_internal, one dict
+                per update
+        """
+        batch = _UpdateBatch()
+        for update in updates:
+            self._stage_update(batch, **update)
+
+        if not (batch.writes or batch.completions or batch.uncompletes):
+            return
+
+        # 1. Plain edits and uncompletes (with their point deductions and
+        # stats changes) first, committed as one unit, so completions see
+        # updated templates
+        people_store = self.hass.data[DOMAIN].get("people_store")
+        transactions: list[dict[str, Any]] = []
+        for task in batch.uncompletes.values():
+            transactions.extend(self._stage_uncomplete(task, people_store))
+            batch.push[task.uid] = task
+        tasks = [*batch.writes.values(), *batch.uncompletes.values()]
+        committer = self.hass.data[DOMAIN].get("completion_committer")
+        if transactions and committer:
+            # Rejected if a task changed meanwhile (e.g. uncompleted twice)
+            if not await committer.async_commit(
+                self._list_id,
+                tasks,
+                transactions,
+                {task.uid: batch.versions.get(task.uid) for task in tasks},
+            ):
+                return
+        else:
+            if transactions and people_store:
+                await people_store.async_apply_transactions(transactions)
+            if tasks:
+                await self._store.async_put_tasks(self._list_id, tasks)
+        for task in tasks:
+            batch.versions[task.uid] = task.modified
+
+        # 2. Completions (points, streaks and next instances)
+        completed_templates: dict[str, Task] = {}
+        if batch.completions:
+            completed_templates = await self._async_commit_completions(
+                list(batch.completions.values()), batch.versions
+            )
+
+        # Schedule a state write (coalesced with other changes this tick)
+        self.async_schedule_state_write()
+
+        # Push to remote backend if sync is enabled
+        if self._sync_coordinator:
+            await self._async_sync_completed_templates(completed_templates)
+            to_push = dict(batch.push)
+            to_push.update(completed_templates)
+            await self._sync_coordinator.async_push_tasks(
+                self._list_id, list(to_push.values())
+            )
+
+    def _stage_update(
+        self,
+        batch: _UpdateBatch,
+        uid: str,
+        summary: str | None = None,
+        description: str | None = None,
+        due: str | None = None,
+        status: str | None = None,
+        tags: list[str] | None = None,
+        is_all_day: bool | None = None,
+        section_id: str | None = None,
+        points_value: int | None = None,
+        streak_bonus_points: int | None = None,
+        streak_bonus_interval: int | None = None,
+        rrule: str | None = None,
+        include_future_occurrences: bool = False,
+    ) -> None:
+        """Apply one update to the batch's working copies (nothing is committed)."""
         _LOGGER.info(
             "Updating task internally: %s (include_future=%s)",
             uid,
@@ -443,8 +733,8 @@ class ChoreBotList(TodoListEntity):
         if due is not None and is_all_day is not None:
             due = self._normalize_all_day_date(due, is_all_day)
 
-        # Get existing task
-        task = self._store.get_task(self._list_id, uid)
+        # Get existing task (the batch's working copy if already updated)
+        task = batch.get_task(self._store, self._list_id, uid)
         if not task:
             _LOGGER.error("Task %s not found in list %s", uid, self._list_id)
             return
@@ -456,9 +746,6 @@ class ChoreBotList(TodoListEntity):
             )
             return
 
-        # Track old status for completion logic
-        old_status = task.status
-
         # CONVERSION: Regular task → Recurring task (when rrule is added)
         # Note: Check for truthy rrule, not just non-None, to avoid converting on empty string ""
         if (
@@ -527,19 +814,12 @@ class ChoreBotList(TodoListEntity):
                 task.points_value = points_value
                 template.points_value = points_value
 
-            # Save template first, then update the instance
-            await self._store.async_add_task(self._list_id, template)
+            # Write the new template and the instance; only the template is synced
+            batch.tasks[template.uid] = template
+            batch.stage_write(template, push=True)
             task.update_modified()
-            await self._store.async_update_task(self._list_id, task)
-
-            # Write state immediately
-            self.async_write_ha_state()
-
-            # Push template to remote backend if sync is enabled
-            if self._sync_coordinator:
-                await self._sync_coordinator.async_push_task(self._list_id, template)
-
-            return  # Exit early, conversion complete
+            batch.stage_write(task, push=False)
+            return  # Conversion complete
 
         # If updating future occurrences for recurring instance, validate and update template
         if include_future_occurrences and task.is_recurring_instance():
@@ -554,7 +834,7 @@ class ChoreBotList(TodoListEntity):
 
             # Get parent template (parent_uid is guaranteed non-None by is_recurring_instance check)
             assert task.parent_uid is not None
-            template = self._store.get_template(self._list_id, task.parent_uid)
+            template = batch.get_template(self._store, self._list_id, task.parent_uid)
             if not template:
                 _LOGGER.error("Template not found for instance: %s", task.parent_uid)
                 return
@@ -582,7 +862,7 @@ class ChoreBotList(TodoListEntity):
                 template.rrule = rrule
 
             template.update_modified()
-            await self._store.async_update_task(self._list_id, template)
+            batch.stage_write(template, push=False)
 
         # Update the task instance with all provided fields
         if summary is not None:
@@ -618,30 +898,16 @@ class ChoreBotList(TodoListEntity):
             if streak_bonus_interval is not None:
                 task.streak_bonus_interval = streak_bonus_interval
 
-        # Check if status changed to completed
-        status_changed_to_completed = (
-            old_status == "needs_action" and task.status == "completed"
-        )
-
-        # Handle completion using new context-based approach
-        if status_changed_to_completed:
-            person_id = self._resolve_person_id_for_task(task)
-            context = await self._completion_builder.build_context(task, person_id)
-            await self._process_completion(context)
+        # Status change relative to the committed task decides how it is written
+        old_status = batch.old_status[uid]
+        if old_status == "needs_action" and task.status == "completed":
+            batch.stage_completion(task)
         elif old_status != task.status:
-            # Handle uncomplete
-            await self._handle_uncomplete(task, old_status, task.status)
+            batch.stage_uncomplete(task)
         else:
             # No status change, just update
             task.update_modified()
-            await self._store.async_update_task(self._list_id, task)
-
-            # Write state immediately
-            self.async_write_ha_state()
-
-            # Push to remote backend if sync is enabled
-            if self._sync_coordinator:
-                await self._sync_coordinator.async_push_task(self._list_id, task)
+            batch.stage_write(task, push=True)
 
     async def async_update_todo_item(self, item: TodoItem) -> None:
         """Update a task (standard HA interface)."""
@@ -688,17 +954,152 @@ class ChoreBotList(TodoListEntity):
             # Those can only be updated via chorebot.update_task service
         )
 
-    async def _process_completion(self, context) -> None:
-        """Execute completion using pre-validated context.
+    async def async_complete_tasks_internal(self, uids: list[str]) -> None:
+        """Complete several tasks as one batch (see async_update_tasks_internal).
+
+        Args:
+            uids: UIDs of the tasks to complete (already completed tasks are skipped)
+        """
+        updates = []
+        for uid in dict.fromkeys(uids):
+            task = self._store.get_task(self._list_id, uid)
+            if task and task.status == "completed":
+                _LOGGER.debug("Task %s is already completed, skipping", uid)
+                continue
+            updates.append({"uid": uid, "status": "completed"})
+        await self.async_update_tasks_internal(updates)
+
+    async def _async_commit_completions(
+        self, instances: list[Task], versions: Mapping[str, str]
+    ) -> dict[str, Task]:
+        """Complete staged instances, committing each round in one unit.
+
+        Instances of the same template are completed in successive rounds,
+        so each completion context sees the streak and next instance left by
+        the previous one.
+
+        Args:
+            instances: Working copies with status already set to completed
+            versions: Committed ``modified`` of each instance's working copy
+
+        Returns:
+            Templates whose completion should be synced, by UID
+        """
+        templates: dict[str, Task] = {}
+        pending = instances
+        while pending:
+            contexts = []
+            deferred = []
+            seen_templates: set[str] = set()
+            for instance in pending:
+                if instance.parent_uid:
+                    if instance.parent_uid in seen_templates:
+                        deferred.append(instance)
+                        continue
+                    seen_templates.add(instance.parent_uid)
+                person_id = self._resolve_person_id_for_task(instance)
+                contexts.append(
+                    await self._completion_builder.build_context(instance, person_id)
+                )
+
+            for template in await self._process_completions(contexts, versions):
+                templates[template.uid] = template
+            pending = deferred
+        return templates
+
+    async def _process_completions(
+        self, contexts: list[CompletionContext], versions: Mapping[str, str]
+    ) -> list[Task]:
+        """Execute completions using pre-validated contexts.
+
+        Every change (instances, templates, next instances, points) is staged
+        and committed once through the completion committer, which rejects
+        the round if any of the tasks changed since they were read (so a
+        concurrent edit is not overwritten and points are not awarded twice).
 
         Args:
-            context: CompletionContext with all decisions pre-calculated
+            contexts: CompletionContexts with all decisions pre-calculated
+                (at most one per template)
+            versions: Committed ``modified`` of each instance's working copy
+
+        Returns:
+            Templates whose completion should be synced to the remote backend
         """
-        from .completion_context import CompletionContext
+        people_store = self.hass.data[DOMAIN].get("people_store")
+        tasks: list[Task] = []
+        transactions: list[dict[str, Any]] = []
+        awarded: list[CompletionContext] = []
+        created: list[tuple[CompletionContext, Task]] = []
+        staged_from: dict[str, str | None] = {}
+
+        for ctx in contexts:
+            staged_from[ctx.instance.uid] = versions.get(ctx.instance.uid)
+            if ctx.template:
+                staged_from[ctx.template.uid] = ctx.template.modified
+            ctx_transactions = self._stage_completion(ctx, people_store)
+            if ctx_transactions:
+                transactions.extend(ctx_transactions)
+                awarded.append(ctx)
+            if (
+                people_store
+                and ctx.person_id
+                and self._validate_person_entity(ctx.person_id)
+            ):
+                # Completion counts go in the same people save as the points
+                transactions.append(
+                    people_store.stage_completion_stats(
+                        ctx.person_id,
+                        ctx.completion_timestamp,
+                        ctx.is_on_time if ctx.instance.due else None,
+                    )
+                )
+
+            # Stage next instance
+            tasks.append(ctx.instance)
+            if ctx.template:
+                tasks.append(ctx.template)
+            if ctx.should_create_next and ctx.template:
+                next_instance = self._build_next_instance(ctx)
+                tasks.append(next_instance)
+                staged_from[next_instance.uid] = None
+                created.append((ctx, next_instance))
+
+        # Commit tasks and points together (replayed on startup if interrupted)
+        committer = self.hass.data[DOMAIN].get("completion_committer")
+        if committer:
+            if not await committer.async_commit(
+                self._list_id,
+                tasks,
+                transactions,
+                staged_from,
+                completing=[ctx.instance.uid for ctx in contexts],
+            ):
+                return []
+        else:
+            if transactions and people_store:
+                await people_store.async_apply_transactions(transactions)
+            await self._store.async_put_tasks(self._list_id, tasks)
+
+        for ctx in awarded:
+            self._log_points_awarded(ctx)
+        for ctx, next_instance in created:
+            self._log_instance_created(ctx, next_instance)
+
+        # Dateless recurring tasks are local-only
+        return [
+            ctx.template
+            for ctx in contexts
+            if ctx.template and not ctx.template.is_dateless_recurring
+        ]
 
-        # Type hint for context
-        ctx: CompletionContext = context
+    def _stage_completion(
+        self, ctx: CompletionContext, people_store: PeopleStore | None
+    ) -> list[dict[str, Any]]:
+        """Apply a completion to its working copies and stage its points.
 
+        Returns:
+            Staged points transactions (base + streak bonus)
+        """
         # 1. Update instance with metadata
         ctx.instance.status = "completed"
         ctx.instance.last_completed = ctx.completion_timestamp
@@ -717,12 +1118,16 @@ class ChoreBotList(TodoListEntity):
                 is_recurring=ctx.instance.is_recurring_instance(),
             )
 
-        # 3. Award points (with audit logs)
-        if ctx.person_id and ctx.base_points_earned > 0:
-            people_store = self.hass.data[DOMAIN].get("people_store")
-            if people_store and self._validate_person_entity(ctx.person_id):
-                # Award base points
-                await people_store.async_add_points(
+        # 3. Stage points (base + streak bonus, applied in one save)
+        transactions = []
+        if (
+            ctx.person_id
+            and ctx.base_points_earned > 0
+            and people_store
+            and self._validate_person_entity(ctx.person_id)
+        ):
+            transactions.append(
+                people_store.stage_transaction(
                     ctx.person_id,
                     ctx.base_points_earned,
                     "task_completion",
@@ -732,18 +1137,10 @@ class ChoreBotList(TodoListEntity):
                         "list_id": self._list_id,
                     },
                 )
-                if self._audit_logger:
-                    self._audit_logger.log_points_awarded(
-                        person_id=ctx.person_id,
-                        amount=ctx.base_points_earned,
-                        task_uid=ctx.instance.uid,
-                        task_summary=ctx.instance.summary,
-                        reason="task_completion",
-                    )
-
-                # Award bonus points if earned
-                if ctx.bonus_points_earned > 0:
-                    await people_store.async_add_points(
+            )
+            if ctx.bonus_points_earned > 0:
+                transactions.append(
+                    people_store.stage_transaction(
                         ctx.person_id,
                         ctx.bonus_points_earned,
                         "streak_bonus",
@@ -753,25 +1150,7 @@ class ChoreBotList(TodoListEntity):
                             "streak": ctx.streak_after,
                         },
                     )
-                    if self._audit_logger:
-                        self._audit_logger.log_bonus_awarded(
-                            person_id=ctx.person_id,
-                            amount=ctx.bonus_points_earned,
-                            task_uid=ctx.instance.uid,
-                            task_summary=ctx.instance.summary,
-                            streak=ctx.streak_after,
-                            reason=ctx.bonus_awarded_reason or "streak milestone",
-                        )
-                    _LOGGER.info(
-                        "Awarded streak bonus: %d points for %d-day streak",
-                        ctx.bonus_points_earned,
-                        ctx.streak_after,
-                    )
-
-                # Trigger immediate sensor update
-                points_sensor = self.hass.data[DOMAIN].get("points_sensor")
-                if points_sensor:
-                    points_sensor.async_write_ha_state()
+                )
 
         # 4. Update template streak (with audit log)
         if ctx.template:
@@ -799,44 +1178,48 @@ class ChoreBotList(TodoListEntity):
                 ctx.streak_after,
             )
 
-        # 5. Save all changes
-        await self._store.async_update_task(self._list_id, ctx.instance)
-        if ctx.template:
-            await self._store.async_update_task(self._list_id, ctx.template)
-
-        # 6. Create next instance (with audit log)
-        if ctx.should_create_next and ctx.template:
-            await self._create_next_instance_from_context(ctx)
+        return transactions
 
-        # 7. Write state to HA
-        self.async_write_ha_state()
+    async def _async_sync_completed_templates(self, templates: dict[str, Task]) -> None:
+        """Mark completed recurring templates as completed on the remote backend.
 
-        # 8. Sync to remote backend if enabled (dateless is local-only)
-        if (
-            self._sync_coordinator
-            and ctx.template
-            and not ctx.template.is_dateless_recurring
-        ):
-            await self._sync_coordinator.async_complete_task(
-                self._list_id, ctx.template
-            )
-            await self._sync_coordinator.async_push_task(self._list_id, ctx.template)
-
-    async def _create_next_instance_from_context(self, context) -> None:
-        """Create next recurring instance from completion context.
-
-        Args:
-            context: CompletionContext with next instance details
+        The templates themselves are pushed afterwards with the rest of the batch.
         """
-        from .completion_context import CompletionContext
-
-        ctx: CompletionContext = context
-
-        if not ctx.template:
+        if not self._sync_coordinator:
             return
+        for template in templates.values():
+            await self._sync_coordinator.async_complete_task(self._list_id, template)
 
-        next_occurrence_index = ctx.instance.occurrence_index + 1
+    def _log_points_awarded(self, ctx: CompletionContext) -> None:
+        """Audit log the points awarded by a committed completion."""
+        if self._audit_logger:
+            self._audit_logger.log_points_awarded(
+                person_id=ctx.person_id,
+                amount=ctx.base_points_earned,
+                task_uid=ctx.instance.uid,
+                task_summary=ctx.instance.summary,
+                reason="task_completion",
+            )
 
+        if ctx.bonus_points_earned > 0:
+            if self._audit_logger:
+                self._audit_logger.log_bonus_awarded(
+                    person_id=ctx.person_id,
+                    amount=ctx.bonus_points_earned,
+                    task_uid=ctx.instance.uid,
+                    task_summary=ctx.instance.summary,
+                    streak=ctx.streak_after,
+                    reason=ctx.bonus_awarded_reason or "streak milestone",
+                )
+            _LOGGER.info(
+                "Awarded streak bonus: %d points for %d-day streak",
+                ctx.bonus_points_earned,
+                ctx.streak_after,
+            )
+
+    def _build_next_instance(self, ctx: CompletionContext) -> Task:
+        """Build the next recurring instance from a completion context."""
+        assert ctx.template is not None
         new_instance = Task.create_new(
             summary=ctx.template.summary,
             description=ctx.template.description,
@@ -846,52 +1229,52 @@ class ChoreBotList(TodoListEntity):
             points_value=ctx.template.points_value,
             parent_uid=ctx.template.uid,
             is_template=False,
-            occurrence_index=next_occurrence_index,
+            occurrence_index=ctx.instance.occurrence_index + 1,
             is_all_day=ctx.template.is_all_day,
             section_id=ctx.template.section_id,
         )
         # Snapshot template's current streak (after increment)
         new_instance.streak_when_created = ctx.streak_after
+        return new_instance
 
-        await self._store.async_add_task(self._list_id, new_instance)
-
+    def _log_instance_created(self, ctx: CompletionContext, instance: Task) -> None:
+        """Audit log a next instance created by a committed completion."""
+        assert ctx.template is not None
         if self._audit_logger:
             self._audit_logger.log_instance_created(
-                instance_uid=new_instance.uid,
+                instance_uid=instance.uid,
                 template_uid=ctx.template.uid,
                 task_summary=ctx.template.summary,
-                occurrence_index=next_occurrence_index,
+                occurrence_index=instance.occurrence_index,
                 due_date=ctx.next_due_date,
                 streak_snapshot=ctx.streak_after,
             )
 
         _LOGGER.info(
             "Created next instance (occurrence %d) for template %s",
-            next_occurrence_index,
+            instance.occurrence_index,
             ctx.template.summary,
         )
 
-    async def _handle_uncomplete(
-        self,
-        task: Task,
-        old_status: str,
-        new_status: str,
-    ) -> None:
-        """Handle task uncomplete (status change from completed to needs_action).
+    def _stage_uncomplete(
+        self, task: Task, people_store: PeopleStore | None
+    ) -> list[dict[str, Any]]:
+        """Apply an uncomplete to its working copy and stage its points changes.
 
         Args:
-            task: Task being uncompleted
-            old_status: Previous status
-            new_status: New status
+            task: Working copy, with status already set back to needs_action
+            people_store: People store (None: no points)
+
+        Returns:
+            Staged point deduction and stats change (if any)
         """
-        if new_status == "needs_action" and old_status == "completed":
-            # Get people store
-            people_store = self.hass.data[DOMAIN].get("people_store")
-            if people_store and task.points_value > 0:
-                person_id = self._resolve_person_id_for_task(task)
-                if person_id and self._validate_person_entity(person_id):
-                    # Deduct points (no streak bonus deduction)
-                    await people_store.async_add_points(
+        transactions = []
+        person_id = self._resolve_person_id_for_task(task)
+        if people_store and person_id and self._validate_person_entity(person_id):
+            if task.points_value > 0:
+                # Deduct points (no streak bonus deduction)
+                transactions.append(
+                    people_store.stage_transaction(
                         person_id,
                         -task.points_value,
                         "task_uncomplete",
@@ -899,33 +1282,33 @@ class ChoreBotList(TodoListEntity):
                             "task_uid": task.uid,
                             "task_summary": task.summary,
                             "list_id": self._list_id,
+                            "completed_at": task.last_completed,
                         },
                     )
-
-                    # Trigger immediate sensor update
-                    points_sensor = self.hass.data[DOMAIN].get("points_sensor")
-                    if points_sensor:
-                        points_sensor.async_write_ha_state()
-
-            # Disassociate recurring instances from template to prevent farming
-            if task.is_recurring_instance():
-                _LOGGER.info(
-                    "Disassociating uncompleted recurring instance %s from template %s",
-                    task.uid,
-                    task.parent_uid,
                 )
-                task.parent_uid = None
-                task.occurrence_index = 0
-
-            task.update_modified()
-            await self._store.async_update_task(self._list_id, task)
+            if task.last_completed:
+                # Take the completion back out of the rolling stats
+                transactions.append(
+                    people_store.stage_completion_stats(
+                        person_id,
+                        task.last_completed,
+                        task.completed_on_time if task.due else None,
+                        -1,
+                    )
+                )
 
-            # Write state immediately
-            self.async_write_ha_state()
+        # Disassociate recurring instances from template to prevent farming
+        if task.is_recurring_instance():
+            _LOGGER.info(
+                "Disassociating uncompleted recurring instance %s from template %s",
+                task.uid,
+                task.parent_uid,
+            )
+            task.parent_uid = None
+            task.occurrence_index = 0
 
-            # Push to remote backend if sync is enabled
-            if self._sync_coordinator:
-                await self._sync_coordinator.async_push_task(self._list_id, task)
+        task.update_modified()
+        return transactions
 
     def _resolve_person_id_for_task(self, task: Task) -> str | None:
         """Resolve person_id: section > list > None."""
@@ -983,8 +1366,8 @@ class ChoreBotList(TodoListEntity):
         # Soft delete in store
         await self._store.async_delete_task(self._list_id, uid)
 
-        # Write state immediately
-        self.async_write_ha_state()
+        # Schedule a state write (coalesced with other changes this tick)
+        self.async_schedule_state_write()
 
         # Delete from remote backend if sync is enabled (non-blocking for frontend)
         if self._sync_coordinator and task:
@@ -1021,8 +1404,8 @@ class ChoreBotList(TodoListEntity):
                 await self._store.async_delete_task(self._list_id, uid)
                 all_deleted_uids.append(uid)
 
-        # Write state immediately
-        self.async_write_ha_state()
+        # Schedule a state write (coalesced with other changes this tick)
+        self.async_schedule_state_write()
 
         # Delete from remote backend if sync is enabled (non-blocking for frontend)
         # Note: We need to get tasks from storage (not cache) because they were just deleted
@@ -1033,3 +1416,55 @@ class ChoreBotList(TodoListEntity):
                 task = self._store.get_task(self._list_id, uid)
                 if task:
                     await self._sync_coordinator.async_delete_task(self._list_id, task)
+
+
+class ChoreBotSlimList(ChoreBotList):
+    """ChoreBot list whose full task data is not written to the recorder.
+
+    The chorebot_* attributes stay in the state machine (cards keep working)
+    and are also served by the chorebot/subscribe_list websocket command;
+    only the summary attributes are recorded.
+    """
+
+    _unrecorded_attributes = frozenset(
+        {
+            "chorebot_tasks",
+            "chorebot_templates",
+            "chorebot_sections",
+            "chorebot_tags",
+            "chorebot_metadata",
+        }
+    )
+
+    @property
+    def extra_state_attributes(self) -> dict:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Expose ChoreBot data plus the recorded summary attributes."""
+        snapshot = self._store.get_list_snapshot(self._list_id)
+        return {
+            **self._summary_attributes(snapshot),
+            **super().extra_state_attributes,
+        }
+
+    def _summary_attributes(self, snapshot: ListSnapshot) -> dict:
+        """Build compact summary attributes (cheap to record).
+
+        The overdue count comes from the list's task index; the due
+        scheduler rewrites the state when a task turns overdue.
+        """
+        open_count = 0
+        next_due: str | None = None
+        for task in snapshot.tasks.values():
+            if task.status == "completed":
+                continue
+            open_count += 1
+            if task.due and (next_due is None or task.due < next_due):
+                next_due = task.due
+
+        return {
+            "open_count": open_count,
+            "completed_count": len(snapshot.tasks) - open_count,
+            "template_count": len(snapshot.templates),
+            "overdue_count": self._store.get_overdue_count(self._list_id),
+            "next_due": next_due,
+            "revision": snapshot.revision,
+        }
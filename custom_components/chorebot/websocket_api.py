@@ -0,0 +1,584 @@
+"""Websocket API for ChoreBot."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .store import ChoreBotStore
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register ChoreBot websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe_list)
+    websocket_api.async_register_command(hass, ws_points)
+    websocket_api.async_register_command(hass, ws_stats)
+    websocket_api.async_register_command(hass, ws_transactions)
+    websocket_api.async_register_command(hass, ws_query_tasks)
+    websocket_api.async_register_command(hass, ws_search)
+    websocket_api.async_register_command(hass, ws_archive_history)
+    websocket_api.async_register_command(hass, ws_completion_history)
+
+
+def _resolve_list_id(hass: HomeAssistant, list_id: str) -> str | None:
+    """Accept a todo entity_id or a raw list ID and return the list ID."""
+    if not list_id.startswith("todo."):
+        return list_id
+
+    entity_entry = er.async_get(hass).async_get(list_id)
+    if entity_entry and entity_entry.unique_id.startswith(f"{DOMAIN}_"):
+        return entity_entry.unique_id[len(DOMAIN) + 1 :]
+    return None
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "chorebot/subscribe_list",
+        vol.Required("list_id"): str,
+    }
+)
+@callback
+def ws_subscribe_list(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to a list: one snapshot, then incremental deltas.
+
+    Event messages:
+        {"type": "snapshot", "revision", "tasks", "templates", "sections",
+         "tags", "metadata"} - full list state (first message, and again
+         whenever sections or list metadata change, since those affect
+         computed_person_id of every task)
+        {"type": "delta", "revision", "tasks", "templates", "removed"
+         [, "tags"]} - upserted tasks/templates, removed UIDs, and the tag
+         list when it changed
+    """
+    store: ChoreBotStore | None = hass.data.get(DOMAIN, {}).get("store")
+    list_id = _resolve_list_id(hass, msg["list_id"])
+
+    if store is None or list_id is None or store.get_list(list_id) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"Unknown list: {msg['list_id']}"
+        )
+        return
+
+    subscription = _ListSubscription(hass, connection, msg["id"], store, list_id)
+    connection.subscriptions[msg["id"]] = store.async_add_list_listener(
+        list_id, subscription.async_on_change
+    )
+    connection.send_result(msg["id"])
+    subscription.async_send_snapshot()
+
+
+@websocket_api.websocket_command({vol.Required("type"): "chorebot/points"})
+@callback
+def ws_points(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return full points data (people, rewards, recent transactions).
+
+    Serves the same data as the points sensor attributes, for installs that
+    keep those attributes out of the recorder (slim attribute mode).
+    """
+    sensor = hass.data.get(DOMAIN, {}).get("points_sensor")
+    if sensor is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "ChoreBot points not loaded"
+        )
+        return
+
+    connection.send_result(msg["id"], sensor.points_data())
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "chorebot/stats",
+        vol.Optional("person_id"): str,
+    }
+)
+@callback
+def ws_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return rolling-window stats: one person's, or the leaderboard."""
+    people_store = hass.data.get(DOMAIN, {}).get("people_store")
+    if people_store is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "ChoreBot people not loaded"
+        )
+        return
+
+    person_id = msg.get("person_id")
+    if person_id is None:
+        connection.send_result(
+            msg["id"], {"leaderboard": people_store.get_leaderboard()}
+        )
+        return
+
+    if person_id not in people_store.async_get_all_people():
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"Unknown person {person_id}"
+        )
+        return
+    connection.send_result(
+        msg["id"], {"person_id": person_id, **people_store.get_stats(person_id)}
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "chorebot/transactions",
+        vol.Optional("person_id"): str,
+        vol.Optional("offset", default=0): vol.All(int, vol.Range(min=0)),
+        vol.Optional("limit", default=50): vol.All(int, vol.Range(min=1, max=200)),
+    }
+)
+@websocket_api.async_response
+async def ws_transactions(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Page through the points ledger (optionally one person's), newest first.
+
+    Result:
+        {"transactions", "offset", "limit"}
+    """
+    people_store = hass.data.get(DOMAIN, {}).get("people_store")
+    if people_store is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "ChoreBot people not loaded"
+        )
+        return
+
+    transactions = await people_store.async_query_transactions(
+        msg.get("person_id"), msg["limit"], msg["offset"]
+    )
+    connection.send_result(
+        msg["id"],
+        {
+            "transactions": [transaction.to_dict() for transaction in transactions],
+            "offset": msg["offset"],
+            "limit": msg["limit"],
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "chorebot/query_tasks",
+        vol.Required("list_id"): str,
+        vol.Optional("tags"): vol.All(cv.ensure_list, [str]),
+        vol.Optional("section_id"): str,
+        vol.Optional("status"): vol.In(["needs_action", "completed"]),
+        vol.Optional("due_after"): cv.date,
+        vol.Optional("due_before"): cv.date,
+        vol.Optional("include_templates", default=False): bool,
+        vol.Optional("offset", default=0): vol.All(int, vol.Range(min=0)),
+        vol.Optional("limit", default=100): vol.All(int, vol.Range(min=1, max=500)),
+    }
+)
+@callback
+def ws_query_tasks(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return one page of the tasks matching all given filters.
+
+    Due filters are inclusive UTC days. Results are ordered by due date
+    (undated last), then summary.
+
+    Result:
+        {"revision", "total", "offset", "tasks"} - ``total`` counts all
+        matches, ``tasks`` holds at most ``limit`` of them from ``offset``
+    """
+    store: ChoreBotStore | None = hass.data.get(DOMAIN, {}).get("store")
+    list_id = _resolve_list_id(hass, msg["list_id"])
+
+    if store is None or list_id is None or store.get_list(list_id) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"Unknown list: {msg['list_id']}"
+        )
+        return
+
+    tasks = store.query_tasks(
+        list_id,
+        tags=msg.get("tags"),
+        section_id=msg.get("section_id"),
+        status=msg.get("status"),
+        due_after=msg.get("due_after"),
+        due_before=msg.get("due_before"),
+        include_templates=msg["include_templates"],
+    )
+    offset, limit = msg["offset"], msg["limit"]
+    entity = hass.data[DOMAIN].get("entities", {}).get(list_id)
+    connection.send_result(
+        msg["id"],
+        {
+            "revision": store.get_revision(list_id),
+            "total": len(tasks),
+            "offset": offset,
+            "tasks": [
+                task.to_dict()
+                if entity is None or task.is_recurring_template()
+                else entity.task_payload(task)
+                for task in tasks[offset : offset + limit]
+            ],
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "chorebot/search",
+        vol.Required("query"): str,
+        vol.Optional("list_id"): str,
+        vol.Optional("after"): cv.datetime,
+        vol.Optional("before"): cv.datetime,
+        vol.Optional("include_archived", default=True): bool,
+        vol.Optional("sort", default="relevance"): vol.In(["relevance", "recent"]),
+        vol.Optional("offset", default=0): vol.All(int, vol.Range(min=0)),
+        vol.Optional("limit", default=20): vol.All(int, vol.Range(min=1, max=200)),
+    }
+)
+@websocket_api.async_response
+async def ws_search(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Full-text search over tasks and archived history.
+
+    Every query term must match the summary, tags or description. Time
+    filters apply to the completion time (else due, else modified time).
+
+    Result:
+        {"total", "offset", "results"} - each result carries list_id, uid,
+        summary, tags, status, due, last_completed, is_template, archived
+        and its relevance score
+    """
+    store: ChoreBotStore | None = hass.data.get(DOMAIN, {}).get("store")
+    if store is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "ChoreBot not loaded"
+        )
+        return
+
+    list_ids: list[str] | None = None
+    if "list_id" in msg:
+        list_id = _resolve_list_id(hass, msg["list_id"])
+        if list_id is None or store.get_list(list_id) is None:
+            connection.send_error(
+                msg["id"],
+                websocket_api.ERR_NOT_FOUND,
+                f"Unknown list: {msg['list_id']}",
+            )
+            return
+        list_ids = [list_id]
+
+    results = await store.async_search(
+        msg["query"],
+        list_ids=list_ids,
+        after=_utc_iso(msg.get("after")),
+        before=_utc_iso(msg.get("before")),
+        include_archived=msg["include_archived"],
+        sort=msg["sort"],
+    )
+    offset, limit = msg["offset"], msg["limit"]
+    connection.send_result(
+        msg["id"],
+        {
+            "total": len(results),
+            "offset": offset,
+            "results": [
+                {**doc.as_dict(), "score": round(score, 3)}
+                for score, doc in results[offset : offset + limit]
+            ],
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "chorebot/completion_history",
+        vol.Required("list_id"): str,
+        vol.Required("template_uid"): str,
+        vol.Optional("start"): cv.date,
+        vol.Optional("end"): cv.date,
+    }
+)
+@callback
+def ws_completion_history(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return a template's completion heatmap and a streak audit.
+
+    Days are local dates; the range defaults to the last 365 days. Each entry
+    of ``days`` combines flags: 1 completed, 2 on time, 4 missed.
+
+    Result:
+        {"start", "end", "days", "counts", "streak"} - ``streak`` holds the
+        stored counters next to the ones recomputed from the history
+    """
+    store: ChoreBotStore | None = hass.data.get(DOMAIN, {}).get("store")
+    history = hass.data.get(DOMAIN, {}).get("completion_history")
+    if store is None or history is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "ChoreBot not loaded"
+        )
+        return
+
+    list_id = _resolve_list_id(hass, msg["list_id"])
+    template = (
+        store.get_template(list_id, msg["template_uid"]) if list_id else None
+    )
+    if list_id is None or template is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Unknown template: {msg['template_uid']}",
+        )
+        return
+
+    end = msg.get("end") or dt_util.now().date()
+    start = msg.get("start") or end - timedelta(days=364)
+    if start > end:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_INVALID_FORMAT, "start is after end"
+        )
+        return
+
+    template_history = history.get(list_id, template.uid)
+    if template_history is None:
+        days = [0] * ((end - start).days + 1)
+        counts = {"completions": 0, "completed": 0, "on_time": 0, "missed": 0}
+        current, longest = 0, 0
+    else:
+        days = template_history.heatmap(start, end)
+        counts = template_history.counts(start, end)
+        current, longest = template_history.streaks()
+
+    connection.send_result(
+        msg["id"],
+        {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "days": days,
+            "counts": counts,
+            "streak": {
+                "current": template.streak_current,
+                "longest": template.streak_longest,
+                "history_current": current,
+                "history_longest": longest,
+            },
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "chorebot/archive_history",
+        vol.Optional("list_id"): str,
+        vol.Optional("template_uid"): str,
+        vol.Optional("person_id"): str,
+        vol.Optional("cursor"): str,
+        vol.Optional("limit", default=50): vol.All(int, vol.Range(min=1, max=200)),
+    }
+)
+@websocket_api.async_response
+async def ws_archive_history(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Page through archived instances, newest first.
+
+    Filters (combinable): one list, one template's instances, or the
+    instances assigned to a person. Pass the returned ``cursor`` to get the
+    next page; it is None after the last page.
+
+    Result:
+        {"instances", "cursor"} - instance dicts with their list_id
+    """
+    store: ChoreBotStore | None = hass.data.get(DOMAIN, {}).get("store")
+    if store is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "ChoreBot not loaded"
+        )
+        return
+
+    list_ids: list[str] | None = None
+    if "list_id" in msg:
+        list_id = _resolve_list_id(hass, msg["list_id"])
+        if list_id is None or store.get_list(list_id) is None:
+            connection.send_error(
+                msg["id"],
+                websocket_api.ERR_NOT_FOUND,
+                f"Unknown list: {msg['list_id']}",
+            )
+            return
+        list_ids = [list_id]
+
+    before: tuple[str, str, str] | None = None
+    if "cursor" in msg:
+        parts = msg["cursor"].split("|")
+        if len(parts) != 3:
+            connection.send_error(
+                msg["id"], websocket_api.ERR_INVALID_FORMAT, "Invalid cursor"
+            )
+            return
+        before = (parts[0], parts[1], parts[2])
+
+    instances, next_cursor = await store.async_get_archive_history(
+        msg["limit"],
+        list_ids=list_ids,
+        parent_uid=msg.get("template_uid"),
+        person_id=msg.get("person_id"),
+        before=before,
+    )
+    connection.send_result(
+        msg["id"],
+        {
+            "instances": [
+                {**task.to_dict(), "list_id": list_id} for list_id, task in instances
+            ],
+            "cursor": "|".join(next_cursor) if next_cursor else None,
+        },
+    )
+
+
+def _utc_iso(value: datetime | None) -> str | None:
+    """Format a websocket datetime as a stored (UTC, Z-suffixed) timestamp."""
+    if value is None:
+        return None
+    return dt_util.as_utc(value).isoformat().replace("+00:00", "Z")
+
+
+class _ListSubscription:
+    """Tracks what one websocket subscriber has seen of a list."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+        store: ChoreBotStore,
+        list_id: str,
+    ) -> None:
+        """Initialize the subscription."""
+        self._hass = hass
+        self._connection = connection
+        self._msg_id = msg_id
+        self._store = store
+        self._list_id = list_id
+        self._pending_uids: set[str] = set()
+        self._pending_structure = False
+        self._flush_scheduled = False
+        self._sent_tags: list[str] = []
+
+    def _task_payload(self, task) -> dict[str, Any]:
+        """Serialize a task the same way the list entity attributes do."""
+        entity = self._hass.data[DOMAIN].get("entities", {}).get(self._list_id)
+        if entity is not None:
+            return entity.task_payload(task)
+        return task.to_dict()
+
+    @callback
+    def async_send_snapshot(self) -> None:
+        """Send the full list state."""
+        snapshot = self._store.get_list_snapshot(self._list_id)
+        self._sent_tags = list(snapshot.tags)
+
+        self._connection.send_message(
+            websocket_api.event_message(
+                self._msg_id,
+                {
+                    "type": "snapshot",
+                    "revision": snapshot.revision,
+                    "tasks": [
+                        self._task_payload(task) for task in snapshot.tasks.values()
+                    ],
+                    "templates": [
+                        template.to_dict() for template in snapshot.templates.values()
+                    ],
+                    "sections": list(snapshot.sections),
+                    "tags": self._sent_tags,
+                    "metadata": dict(snapshot.metadata),
+                },
+            )
+        )
+
+    @callback
+    def async_on_change(
+        self,
+        list_id: str,
+        revision: int,
+        changed_uids: set[str],
+        structure_changed: bool,
+    ) -> None:
+        """Queue a store change; bursts (e.g. a sync) go out as one delta."""
+        self._pending_uids |= changed_uids
+        self._pending_structure |= structure_changed
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send queued changes."""
+        self._flush_scheduled = False
+        uids, self._pending_uids = self._pending_uids, set()
+        structure_changed, self._pending_structure = self._pending_structure, False
+
+        if self._msg_id not in self._connection.subscriptions:
+            return  # Unsubscribed while the flush was pending
+
+        if structure_changed:
+            self.async_send_snapshot()
+            return
+
+        snapshot = self._store.get_list_snapshot(self._list_id)
+        tasks: list[dict[str, Any]] = []
+        templates: list[dict[str, Any]] = []
+        removed: list[str] = []
+        for uid in uids:
+            if uid in snapshot.templates:
+                templates.append(snapshot.templates[uid].to_dict())
+            elif uid in snapshot.tasks:
+                tasks.append(self._task_payload(snapshot.tasks[uid]))
+            else:
+                removed.append(uid)
+
+        delta: dict[str, Any] = {
+            "type": "delta",
+            "revision": snapshot.revision,
+            "tasks": tasks,
+            "templates": templates,
+            "removed": removed,
+        }
+        tags = list(snapshot.tags)
+        if tags != self._sent_tags:
+            self._sent_tags = tags
+            delta["tags"] = tags
+
+        self._connection.send_message(websocket_api.event_message(self._msg_id, delta))